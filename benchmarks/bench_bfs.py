@@ -0,0 +1,98 @@
+"""Benchmarks for the breadth-first search variants on random power-law graphs.
+
+Run from the root directory with:
+    python benchmarks/bench_bfs.py --num_nodes 1000000
+"""
+
+import argparse
+import random
+import time
+
+from graph_algorithms_the_fun_way.csr_graph import make_csr_graph
+from graph_algorithms_the_fun_way.graph import Graph
+from graph_algorithms_the_fun_way.search import breadth_first_search, direction_optimizing_bfs
+
+
+def make_power_law_graph(num_nodes: int, edges_per_node: int) -> Graph:
+    """Make a random undirected graph with a power-law degree distribution
+    using preferential attachment (the Barabasi-Albert model).
+
+    Parameters
+    ----------
+    num_nodes : int
+        The total number of nodes in the graph.
+    edges_per_node : int
+        The number of edges each new node adds to existing nodes.
+
+    Returns
+    -------
+    g : Graph
+        The constructed Graph.
+    """
+    g: Graph = Graph(num_nodes, undirected=True)
+
+    # Each node appears in endpoints once per incident edge, so sampling
+    # from it picks nodes in proportion to their degree.
+    endpoints: list = list(range(edges_per_node + 1))
+    for i in range(edges_per_node + 1):
+        for j in range(i + 1, edges_per_node + 1):
+            g.insert_edge(i, j, 1.0)
+
+    for new_node in range(edges_per_node + 1, num_nodes):
+        for _ in range(edges_per_node):
+            other: int = random.choice(endpoints)
+            if not g.is_edge(new_node, other):
+                g.insert_edge(new_node, other, 1.0)
+                endpoints.append(other)
+                endpoints.append(new_node)
+    return g
+
+
+def time_function(func, *args) -> float:
+    """Time a single call to a function.
+
+    Parameters
+    ----------
+    func : function
+        The function to time.
+    *args : tuple
+        The arguments to the function.
+
+    Returns
+    -------
+    float
+        The run time in seconds.
+    """
+    start: float = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(description="Benchmark BFS variants on power-law graphs.")
+    parser.add_argument("--num_nodes", type=int, default=100_000, help="The number of nodes.")
+    parser.add_argument("--edges_per_node", type=int, default=8, help="The edges added per node.")
+    parser.add_argument("--num_searches", type=int, default=5, help="The number of searches.")
+    parser.add_argument("--seed", type=int, default=100, help="The random seed.")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    g: Graph = make_power_law_graph(args.num_nodes, args.edges_per_node)
+    csr = make_csr_graph(g)
+    in_csr = csr.make_transpose()
+    starts: list = [random.randint(0, args.num_nodes - 1) for _ in range(args.num_searches)]
+    print(f"Power-law graph with {g.num_nodes} nodes and {csr.num_edges()} directed edges.")
+
+    results: dict = {
+        "breadth_first_search": sum(time_function(breadth_first_search, g, s) for s in starts),
+        "direction_optimizing_bfs": sum(
+            time_function(direction_optimizing_bfs, csr, s, 14.0, 24.0, in_csr) for s in starts
+        ),
+    }
+    for name, total in results.items():
+        print(f"{name:>30}: {total / args.num_searches:.4f} s per search")
+
+
+if __name__ == "__main__":
+    main()
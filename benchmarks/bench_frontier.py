@@ -0,0 +1,84 @@
+"""Benchmarks for the first-in, first-out frontiers used by the breadth-first searches.
+
+Run from the root directory with:
+    python benchmarks/bench_frontier.py --width 1000 --height 1000
+"""
+
+import argparse
+import queue
+import time
+
+from graph_algorithms_the_fun_way.frontier import DequeFrontier, RingBufferFrontier
+from graph_algorithms_the_fun_way.graph import Graph, Node
+from graph_algorithms_the_fun_way.grid_graphs import make_grid_graph
+
+
+def bfs_with_frontier(g: Graph, start: int, pending) -> int:
+    """Breadth-first search using a given frontier object.
+
+    Parameters
+    ----------
+    g : Graph
+        The input graph.
+    start : int
+        The index of the starting node.
+    pending : queue.Queue, DequeFrontier, or RingBufferFrontier
+        An empty frontier.
+
+    Returns
+    -------
+    num_ops : int
+        The number of put/get pairs performed.
+    """
+    seen: list = [False] * g.num_nodes
+    num_ops: int = 0
+
+    pending.put(start)
+    seen[start] = True
+    while not pending.empty():
+        index: int = pending.get()
+        num_ops += 1
+        current: Node = g.nodes[index]
+        for edge in current.get_edge_list():
+            neighbor: int = edge.to_node
+            if not seen[neighbor]:
+                pending.put(neighbor)
+                seen[neighbor] = True
+    return num_ops
+
+
+def main():
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(description="Benchmark BFS frontiers on a grid graph.")
+    parser.add_argument("--width", type=int, default=1000, help="The width of the grid.")
+    parser.add_argument("--height", type=int, default=1000, help="The height of the grid.")
+    args = parser.parse_args()
+
+    g: Graph = make_grid_graph(args.width, args.height)
+    print(f"Grid graph with {g.num_nodes} nodes.")
+
+    frontiers: dict = {
+        "queue.Queue": lambda: queue.Queue(),
+        "DequeFrontier": lambda: DequeFrontier(),
+        "RingBufferFrontier": lambda: RingBufferFrontier(g.num_nodes),
+    }
+    for name, make_frontier in frontiers.items():
+        # Time the frontier operations alone.
+        pending = make_frontier()
+        start_t: float = time.perf_counter()
+        for i in range(g.num_nodes):
+            pending.put(i)
+        while not pending.empty():
+            pending.get()
+        op_time: float = (time.perf_counter() - start_t) / g.num_nodes
+
+        # Time a full breadth-first search.
+        start_t = time.perf_counter()
+        bfs_with_frontier(g, 0, make_frontier())
+        bfs_time: float = time.perf_counter() - start_t
+
+        print(f"{name:>20}: {op_time * 1e9:8.1f} ns per put/get, BFS {bfs_time:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Benchmarks for Jump Point Search against A* search on mostly open grids.
+
+Run from the root directory with:
+    python benchmarks/bench_jps.py --width 300 --height 300
+"""
+
+import argparse
+import random
+import time
+
+from graph_algorithms_the_fun_way.graph import Graph
+from graph_algorithms_the_fun_way.grid_graphs import make_grid_with_obstacles
+from graph_algorithms_the_fun_way.jump_point_search import JumpPointGrid
+from graph_algorithms_the_fun_way.paths import make_node_path_from_last
+from graph_algorithms_the_fun_way.search import astar_search
+
+
+def main():
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(description="Benchmark Jump Point Search against A* on grids.")
+    parser.add_argument("--width", type=int, default=300, help="The width of the grid.")
+    parser.add_argument("--height", type=int, default=300, help="The height of the grid.")
+    parser.add_argument("--obstacle_prob", type=float, default=0.002, help="The fraction of blocked cells.")
+    parser.add_argument("--num_searches", type=int, default=5, help="The number of searches.")
+    parser.add_argument("--seed", type=int, default=100, help="The random seed.")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    width: int = args.width
+    height: int = args.height
+    obstacles: set = set()
+    for r in range(height):
+        for c in range(width):
+            if random.random() < args.obstacle_prob:
+                obstacles.add((r, c))
+
+    start_t: float = time.perf_counter()
+    g: Graph = make_grid_with_obstacles(width, height, obstacles)
+    graph_time: float = time.perf_counter() - start_t
+
+    start_t = time.perf_counter()
+    grid: JumpPointGrid = JumpPointGrid(width, height, obstacles)
+    grid_time: float = time.perf_counter() - start_t
+
+    print(f"Grid of {width} x {height} cells with {len(obstacles)} obstacles.")
+    print(f"Building the Graph:         {graph_time:.4f} s")
+    print(f"Building the JumpPointGrid: {grid_time:.4f} s")
+
+    astar_time: float = 0.0
+    jps_time: float = 0.0
+    num_done: int = 0
+    while num_done < args.num_searches:
+        start: int = random.randint(0, g.num_nodes - 1)
+        goal: int = random.randint(0, g.num_nodes - 1)
+        if grid.blocked[start] or grid.blocked[goal]:
+            continue
+        num_done += 1
+
+        goal_r: int = goal // width
+        goal_c: int = goal % width
+        h: list = [abs(i // width - goal_r) + abs(i % width - goal_c) for i in range(g.num_nodes)]
+
+        start_t = time.perf_counter()
+        last: list = astar_search(g, h, start, goal)
+        astar_time += time.perf_counter() - start_t
+        astar_path: list = make_node_path_from_last(last, goal)
+
+        start_t = time.perf_counter()
+        jps_path: list = grid.find_path(start, goal)
+        jps_time += time.perf_counter() - start_t
+
+        if astar_path[0] == start and len(jps_path) != len(astar_path):
+            print(f"Path length mismatch: A*={len(astar_path)}, JPS={len(jps_path)}")
+
+    print(f"A* search:                  {astar_time / args.num_searches:.4f} s per search")
+    print(f"Jump Point Search:          {jps_time / args.num_searches:.4f} s per search")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Benchmarks for the topological sorts on large random DAGs.
+
+Run from the root directory with:
+    python benchmarks/bench_topological.py --num_nodes 1000000 --degree 3
+"""
+
+import argparse
+import random
+import time
+
+from graph_algorithms_the_fun_way.graph import Graph
+from graph_algorithms_the_fun_way.topological import (
+    Kahns,
+    check_cycle_kahns,
+    is_topo_ordered,
+    topological_dfs,
+    topological_dfs_cycle,
+)
+
+
+def make_random_dag(num_nodes: int, degree: int, window: int, seed: int) -> Graph:
+    """Create a random DAG where each node links to nodes shortly after it
+    under a random relabeling of the nodes.
+
+    Parameters
+    ----------
+    num_nodes : int
+        The number of nodes.
+    degree : int
+        The number of edges out of each node (fewer near the end).
+    window : int
+        The largest distance (in the hidden order) of each edge.
+    seed : int
+        The random seed.
+
+    Returns
+    -------
+    g : Graph
+        The DAG.
+    """
+    rng: random.Random = random.Random(seed)
+    labels: list = list(range(num_nodes))
+    rng.shuffle(labels)
+
+    g: Graph = Graph(num_nodes, undirected=False)
+    for i in range(num_nodes - 1):
+        for _ in range(degree):
+            j: int = min(num_nodes - 1, i + rng.randint(1, window))
+            g.insert_edge(labels[i], labels[j], 1.0)
+    return g
+
+
+def main():
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(description="Benchmark topological sorts on a random DAG.")
+    parser.add_argument("--num_nodes", type=int, default=1000000, help="The number of nodes.")
+    parser.add_argument("--degree", type=int, default=3, help="The number of edges out of each node.")
+    parser.add_argument("--window", type=int, default=100, help="The largest span of each edge.")
+    parser.add_argument("--seed", type=int, default=0, help="The random seed.")
+    args = parser.parse_args()
+
+    g: Graph = make_random_dag(args.num_nodes, args.degree, args.window, args.seed)
+    print(f"Random DAG with {g.num_nodes} nodes and {len(g.make_edge_list())} edges.")
+
+    def kahns_with_check() -> list:
+        order: list = Kahns(g)
+        check_cycle_kahns(g)
+        return order
+
+    sorts: dict = {
+        "Kahns": lambda: Kahns(g),
+        "Kahns + check_cycle_kahns": kahns_with_check,
+        "topological_dfs": lambda: topological_dfs(g),
+        "topological_dfs_cycle": lambda: topological_dfs_cycle(g)[0],
+    }
+    for name, sort in sorts.items():
+        start_t: float = time.perf_counter()
+        order: list = sort()
+        run_time: float = time.perf_counter() - start_t
+        valid: bool = is_topo_ordered(g, order)
+        print(f"{name:>26}: {run_time:.3f} s (valid={valid})")
+
+    # Close a cycle through the whole graph and time how long it takes to find it.
+    order = Kahns(g)
+    g.insert_edge(order[-1], order[0], 1.0)
+    start_t = time.perf_counter()
+    _, cycle = topological_dfs_cycle(g)
+    print(f"{'cycle detection':>26}: {time.perf_counter() - start_t:.3f} s (cycle of {len(cycle)} nodes)")
+
+
+if __name__ == "__main__":
+    main()
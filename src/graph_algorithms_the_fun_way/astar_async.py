@@ -0,0 +1,213 @@
+"""An asynchronous version of the dynamic A* search for worlds whose
+neighbors, costs, and heuristics come from slow (I/O bound) sources, such
+as a call to a remote service.
+
+An asynchronous world provides the same functions as astar_generate.World,
+except that get_neighbors_with_costs() and get_heuristic() are coroutines:
+
+* get_start_index() -> int
+* is_goal(state) -> bool
+* async get_neighbors_with_costs(state) -> list of (neighbor, cost) tuples
+* async get_heuristic(state) -> float
+
+AsyncWorld adapts a synchronous World to this interface with an optional
+simulated latency on each call.
+"""
+
+import asyncio
+
+from graph_algorithms_the_fun_way.astar_generate import World
+from graph_algorithms_the_fun_way.priorityqueue import PriorityQueue
+
+
+class AsyncWorld:
+    """An asynchronous wrapper around a World that waits a fixed amount of
+    time before answering each neighbor or heuristic lookup.
+
+    Attributes
+    ----------
+    w : World
+        The wrapped world.
+    latency : float
+        The number of seconds each lookup takes.
+    num_calls : int
+        The number of lookups made.
+    in_flight : int
+        The number of lookups currently waiting.
+    max_in_flight : int
+        The largest number of lookups that were waiting at the same time.
+    """
+
+    def __init__(self, w: World, latency: float = 0.0):
+        self.w = w
+        self.latency: float = latency
+        self.num_calls: int = 0
+        self.in_flight: int = 0
+        self.max_in_flight: int = 0
+
+    async def _wait(self):
+        """Simulate the latency of a single lookup."""
+        self.num_calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+
+    def get_start_index(self) -> int:
+        """Get the index of the starting state."""
+        return self.w.get_start_index()
+
+    def is_goal(self, state: int) -> bool:
+        """Check whether the current state is the goal.
+
+        Parameters
+        ----------
+        state : int
+            The index of the current state.
+
+        Returns
+        -------
+        bool
+            True if the state is the goal and False otherwise.
+        """
+        return self.w.is_goal(state)
+
+    async def get_neighbors_with_costs(self, state: int) -> list:
+        """Get all of the neighbors of the current state along with the cost
+        of transitioning to each of them.
+
+        Parameters
+        ----------
+        state : int
+            The index of the current state.
+
+        Returns
+        -------
+        list of tuple
+            A (neighbor index, cost) pair for each neighboring state.
+        """
+        await self._wait()
+        if hasattr(self.w, "get_neighbors_with_costs"):
+            return self.w.get_neighbors_with_costs(state)
+        return [(other, self.w.get_cost(state, other)) for other in self.w.get_neighbors(state)]
+
+    async def get_heuristic(self, state: int) -> float:
+        """Get the heuristic value for a given state.
+
+        Parameters
+        ----------
+        state : int
+            The index of the current state.
+
+        Returns
+        -------
+        float
+            The heuristic value for this state.
+        """
+        await self._wait()
+        return self.w.get_heuristic(state)
+
+
+async def _fetch_expansion(w, state: int, limit: asyncio.Semaphore) -> tuple:
+    """Look up a state's neighbors, their costs, and their heuristic values.
+
+    Parameters
+    ----------
+    w : AsyncWorld
+        The asynchronous world.
+    state : int
+        The index of the state to expand.
+    limit : asyncio.Semaphore
+        Bounds the number of lookups in progress at once.
+
+    Returns
+    -------
+    neighbors : list of tuple
+        A (neighbor index, cost) pair for each neighboring state.
+    heuristics : list of float
+        The heuristic value of each neighbor in the same order.
+    """
+
+    async def limited(coroutine_function, *args):
+        async with limit:
+            return await coroutine_function(*args)
+
+    neighbors: list = await limited(w.get_neighbors_with_costs, state)
+    heuristics: list = await asyncio.gather(*[limited(w.get_heuristic, other) for other, _ in neighbors])
+    return neighbors, heuristics
+
+
+async def astar_dynamic_async(w, prefetch: int = 4, max_concurrency: int = 8) -> dict:
+    """The A* algorithm for exploring an asynchronous world.
+
+    The search expands states in the same order as astar_dynamic() and
+    returns the same result. While it waits on the lookups for the current
+    state, it also starts the lookups for the next several states in the
+    priority queue so that the time spent waiting on each overlaps.
+
+    Parameters
+    ----------
+    w : AsyncWorld
+        The asynchronous world.
+    prefetch : int
+        The number of states at the top of the priority queue to look up
+        at the same time (including the one being expanded).
+    max_concurrency : int
+        The maximum number of lookups in progress at once.
+
+    Returns
+    -------
+    last : dict
+        Maps the index of each state seen to the index of the state before it
+        on the path.
+    """
+    if prefetch < 1:
+        raise ValueError(f"prefetch must be at least 1. Found {prefetch}.")
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be at least 1. Found {max_concurrency}.")
+
+    limit: asyncio.Semaphore = asyncio.Semaphore(max_concurrency)
+    pending: dict = {}
+    visited: dict = {}
+    last: dict = {}
+    cost: dict = {}
+    pq: PriorityQueue = PriorityQueue(min_heap=True)
+    visited_goal: bool = False
+
+    start: int = w.get_start_index()
+    visited[start] = False
+    last[start] = -1
+    cost[start] = 0.0
+    async with limit:
+        pq.enqueue(start, await w.get_heuristic(start))
+
+    try:
+        while not pq.is_empty() and not visited_goal:
+            for state in pq.peek_top_values(prefetch):
+                if state not in pending:
+                    pending[state] = asyncio.ensure_future(_fetch_expansion(w, state, limit))
+
+            index: int = pq.dequeue()
+            visited[index] = True
+            visited_goal = w.is_goal(index)
+
+            neighbors, heuristics = await pending.pop(index)
+            for (other, c), h in zip(neighbors, heuristics):
+                if other not in visited:
+                    visited[other] = False
+                    last[other] = index
+                    cost[other] = cost[index] + c
+                    pq.enqueue(other, cost[other] + h)
+                elif cost[other] > cost[index] + c:
+                    last[other] = index
+                    cost[other] = cost[index] + c
+                    pq.update_priority(other, cost[other] + h)
+    finally:
+        for task in pending.values():
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending.values(), return_exceptions=True)
+
+    return last
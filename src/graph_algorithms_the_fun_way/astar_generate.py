@@ -9,6 +9,7 @@ I would normally recommend in production code.
 """
 
 import math
+from collections import OrderedDict
 
 from graph_algorithms_the_fun_way.graph import Graph
 from graph_algorithms_the_fun_way.priorityqueue import PriorityQueue
@@ -85,9 +86,32 @@ class World:
         float
             The cost.
         """
-        if not self.g.is_edge(from_state, to_state):
+        edge = self.g.get_edge(from_state, to_state)
+        if edge is None:
             return math.inf
-        return self.g.get_edge(from_state, to_state).weight
+        return edge.weight
+
+    def get_neighbors_with_costs(self, state: int) -> list:
+        """Get all of the neighbors of the current state along with the cost
+        of transitioning to each of them. The results come from get_neighbors()
+        and get_cost(), so a subclass only needs to override those.
+
+        Parameters
+        ----------
+        state : int
+            The index of the current state.
+
+        Returns
+        -------
+        list of tuple
+            A (neighbor index, cost) pair for each neighboring state in the
+            same order as get_neighbors().
+        """
+        if type(self).get_neighbors is World.get_neighbors and type(self).get_cost is World.get_cost:
+            # Neither lookup is overridden, so read the edges directly.
+            node = self.g.nodes[state]
+            return [(other, node.edges[other].weight) for other in node.get_neighbors()]
+        return [(other, self.get_cost(state, other)) for other in self.get_neighbors(state)]
 
     def get_heuristic(self, state: int) -> float:
         """Get the heuristic value for a given state.
@@ -107,13 +131,194 @@ class World:
         return math.sqrt((pos1[0] - pos2[0]) ** 2 + (pos1[1] - pos2[1]) ** 2)
 
 
+class CachedWorld:
+    """A wrapper around a world that caches the results of the neighbor, cost,
+    and heuristic lookups. Each cache holds at most max_size entries and drops
+    the least recently used entry when full.
+
+    The cached results are returned directly, so callers should not modify them.
+
+    Attributes
+    ----------
+    w : World
+        The wrapped world.
+    max_size : int
+        The maximum number of entries in each cache.
+    caches : dict
+        Maps each cache's name ("neighbors", "neighbors_with_costs", "cost",
+        or "heuristic") to an OrderedDict of its entries.
+    hits : dict
+        Maps each cache's name to the number of lookups found in the cache.
+    misses : dict
+        Maps each cache's name to the number of lookups that called the world.
+    """
+
+    def __init__(self, w: World, max_size: int = 100000):
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1. Found {max_size}.")
+
+        self.w = w
+        self.max_size: int = max_size
+        self.caches: dict = {}
+        self.hits: dict = {}
+        self.misses: dict = {}
+        for name in ["neighbors", "neighbors_with_costs", "cost", "heuristic"]:
+            self.caches[name] = OrderedDict()
+            self.hits[name] = 0
+            self.misses[name] = 0
+
+    def _lookup(self, name: str, key, compute):
+        """Look up a value in one of the caches, computing and storing it if needed.
+
+        Parameters
+        ----------
+        name : str
+            The name of the cache.
+        key : any
+            The key of the value in the cache.
+        compute : function
+            A function of no arguments that computes the value.
+
+        Returns
+        -------
+        value : any
+            The cached or computed value.
+        """
+        cache: OrderedDict = self.caches[name]
+        if key in cache:
+            self.hits[name] += 1
+            cache.move_to_end(key)
+            return cache[key]
+
+        self.misses[name] += 1
+        value = compute()
+        cache[key] = value
+        if len(cache) > self.max_size:
+            cache.popitem(last=False)
+        return value
+
+    def hit_rate(self, name: str) -> float:
+        """Return the fraction of lookups in a cache that were hits (0.0 if there were no lookups).
+
+        Parameters
+        ----------
+        name : str
+            The name of the cache.
+        """
+        total: int = self.hits[name] + self.misses[name]
+        if total == 0:
+            return 0.0
+        return self.hits[name] / total
+
+    def clear(self):
+        """Empty all of the caches and reset the counters."""
+        for name in self.caches:
+            self.caches[name].clear()
+            self.hits[name] = 0
+            self.misses[name] = 0
+
+    def get_num_states(self) -> int:
+        """Get the number of states in the world."""
+        return self.w.get_num_states()
+
+    def is_goal(self, state: int) -> bool:
+        """Check whether the current state is the goal.
+
+        Parameters
+        ----------
+        state : int
+            The index of the current state.
+
+        Returns
+        -------
+        bool
+            True if the state is the goal and False otherwise.
+        """
+        return self.w.is_goal(state)
+
+    def get_start_index(self) -> int:
+        """Get the index of the starting state."""
+        return self.w.get_start_index()
+
+    def get_neighbors(self, state: int) -> set:
+        """Get all of the neighbors of the current state.
+
+        Parameters
+        ----------
+        state : int
+            The index of the current state.
+
+        Returns
+        -------
+        set of int
+            The indices of the neighboring states.
+        """
+        return self._lookup("neighbors", state, lambda: self.w.get_neighbors(state))
+
+    def get_cost(self, from_state: int, to_state: int) -> float:
+        """Get the cost of transitioning between two states.
+
+        Parameters
+        ----------
+        from_state : int
+            The origin state.
+        to_state : int
+            The destination state.
+
+        Returns
+        -------
+        float
+            The cost.
+        """
+        return self._lookup("cost", (from_state, to_state), lambda: self.w.get_cost(from_state, to_state))
+
+    def get_neighbors_with_costs(self, state: int) -> list:
+        """Get all of the neighbors of the current state along with the cost
+        of transitioning to each of them. Uses the wrapped world's batched
+        lookup if it has one.
+
+        Parameters
+        ----------
+        state : int
+            The index of the current state.
+
+        Returns
+        -------
+        list of tuple
+            A (neighbor index, cost) pair for each neighboring state.
+        """
+
+        def compute() -> list:
+            if hasattr(self.w, "get_neighbors_with_costs"):
+                return self.w.get_neighbors_with_costs(state)
+            return [(other, self.w.get_cost(state, other)) for other in self.w.get_neighbors(state)]
+
+        return self._lookup("neighbors_with_costs", state, compute)
+
+    def get_heuristic(self, state: int) -> float:
+        """Get the heuristic value for a given state.
+
+        Parameters
+        ----------
+        state : int
+            The index of the current state.
+
+        Returns
+        -------
+        float
+            The heuristic value for this state.
+        """
+        return self._lookup("heuristic", state, lambda: self.w.get_heuristic(state))
+
+
 def astar_dynamic(w: World):
     """The A* algorithm for exploring a world.
 
     Parameters
     ----------
     w : World
-        The World object.
+        The World object. If it provides get_neighbors_with_costs(), the
+        search uses that to look up each state's neighbors and costs at once.
 
     Returns
     -------
@@ -127,6 +332,9 @@ def astar_dynamic(w: World):
     pq: PriorityQueue = PriorityQueue(min_heap=True)
     visited_goal: bool = False
 
+    # Use the world's batched neighbor and cost lookup if it has one.
+    batched: bool = hasattr(w, "get_neighbors_with_costs")
+
     start: int = w.get_start_index()
     visited[start] = False
     last[start] = -1
@@ -138,18 +346,299 @@ def astar_dynamic(w: World):
         visited[index] = True
         visited_goal = w.is_goal(index)
 
-        for other in w.get_neighbors(index):
-            c: float = w.get_cost(index, other)
-            h: float = w.get_heuristic(other)
+        if batched:
+            neighbors: list = w.get_neighbors_with_costs(index)
+        else:
+            neighbors = [(other, w.get_cost(index, other)) for other in w.get_neighbors(index)]
 
+        for other, c in neighbors:
             if other not in visited:
                 visited[other] = False
                 last[other] = index
                 cost[other] = cost[index] + c
-                pq.enqueue(other, cost[other] + h)
+                pq.enqueue(other, cost[other] + w.get_heuristic(other))
             elif cost[other] > cost[index] + c:
                 last[other] = index
                 cost[other] = cost[index] + c
-                pq.update_priority(other, cost[other] + h)
+                pq.update_priority(other, cost[other] + w.get_heuristic(other))
 
     return last
+
+
+def ida_star(w: World, max_expansions: int = None) -> dict:
+    """The iterative deepening A* (IDA*) algorithm for exploring a world.
+
+    IDA* runs a series of depth-first searches that each prune any state
+    whose cost plus heuristic exceeds a threshold, raising the threshold to
+    the smallest pruned value after each pass. It only stores the current
+    path, so its memory use grows with the length of the path instead of
+    the number of states seen. With an admissible heuristic it finds the
+    lowest cost path.
+
+    The search stops once a pass prunes no states. Since it does not remember
+    the states it has seen, showing that the goal is unreachable means trying
+    every path in the start's component, which takes time exponential in the
+    number of states. Use max_expansions to bound the work.
+
+    Parameters
+    ----------
+    w : World
+        The World object.
+    max_expansions : int, optional
+        The maximum number of states to expand (summed over all passes)
+        before giving up. Defaults to no limit.
+
+    Returns
+    -------
+    last : dict
+        Maps the index of each state on the path to the goal to the index of
+        the state before it (-1 for the start). If no goal is reachable or the
+        search gave up only contains the start.
+    """
+    start: int = w.get_start_index()
+    if w.is_goal(start):
+        return {start: -1}
+
+    num_expansions: int = 0
+    threshold: float = w.get_heuristic(start)
+    while threshold < math.inf:
+        if max_expansions is not None and num_expansions >= max_expansions:
+            break
+        num_expansions += 1
+        next_threshold: float = math.inf
+        path: list = [start]
+        on_path: set = {start}
+        stack: list = [(start, 0.0, iter(w.get_neighbors(start)))]
+
+        while stack:
+            index, cost, neighbors = stack[-1]
+            for other in neighbors:
+                if other in on_path:
+                    continue
+
+                new_cost: float = cost + w.get_cost(index, other)
+                f: float = new_cost + w.get_heuristic(other)
+                if f > threshold:
+                    next_threshold = min(next_threshold, f)
+                    continue
+
+                path.append(other)
+                if w.is_goal(other):
+                    last: dict = {start: -1}
+                    for i in range(1, len(path)):
+                        last[path[i]] = path[i - 1]
+                    return last
+
+                if max_expansions is not None and num_expansions >= max_expansions:
+                    return {start: -1}
+                num_expansions += 1
+                on_path.add(other)
+                stack.append((other, new_cost, iter(w.get_neighbors(other))))
+                break
+            else:
+                stack.pop()
+                on_path.discard(path.pop())
+
+        threshold = next_threshold
+    return {start: -1}
+
+
+class SMANode:
+    """A node in the partial search tree kept by the SMA* algorithm.
+
+    Attributes
+    ----------
+    state : int
+        The index of the state.
+    parent : SMANode or None
+        The node's parent in the search tree (None for the root).
+    cost : float
+        The cost of the path from the start to this node.
+    f : float
+        A lower bound on the cost of any path to the goal through this node.
+        Backed up from the node's children once it is expanded.
+    depth : int
+        The number of steps from the start to this node.
+    successors : dict or None
+        Maps the state of each successor of the node to the cost of the path
+        from the start to it, or None if the node has not been expanded.
+    children : dict
+        Maps the state of each successor in memory to its SMANode.
+    forgotten : dict
+        Maps the state of each successor that was dropped from memory
+        to its f value when it was dropped.
+    """
+
+    def __init__(self, state: int, parent, cost: float, f: float, depth: int):
+        self.state: int = state
+        self.parent = parent
+        self.cost: float = cost
+        self.f: float = f
+        self.depth: int = depth
+        self.successors = None
+        self.children: dict = {}
+        self.forgotten: dict = {}
+
+    def priority(self) -> tuple:
+        """The node's priority for SMA*: ordered by f and then by depth (deepest first)."""
+        return (self.f, -self.depth)
+
+
+def _sma_backup(node: SMANode, open_nodes: PriorityQueue, leaves: PriorityQueue):
+    """Update the f values of an expanded node and its ancestors from their children.
+
+    Parameters
+    ----------
+    node : SMANode
+        The expanded node whose children changed.
+    open_nodes : PriorityQueue
+        The nodes with successors that are not in memory.
+    leaves : PriorityQueue
+        The nodes without any children in memory.
+    """
+    while node is not None:
+        best: float = math.inf
+        for child in node.children.values():
+            best = min(best, child.f)
+        for f in node.forgotten.values():
+            best = min(best, f)
+        if best == node.f:
+            return
+
+        node.f = best
+        open_nodes.update_priority(node, node.priority())
+        leaves.update_priority(node, node.priority())
+        node = node.parent
+
+
+def sma_star(w: World, max_nodes: int, max_expansions: int = None) -> dict:
+    """The simplified memory-bounded A* (SMA*) algorithm for exploring a world.
+
+    SMA* expands nodes in the same order as A*, adding one successor to the
+    search tree at a time, until the tree holds max_nodes nodes. It then drops
+    the leaf with the highest f value (the shallowest on ties) and remembers
+    that value in the leaf's parent, so the subtree is only regenerated once
+    every other path looks worse. A leaf is never dropped to make room for a
+    successor that looks worse than it. With an
+    admissible heuristic it finds the lowest cost path whenever that path
+    fits in memory (has fewer than max_nodes states).
+
+    The search stops once every node left in the tree has an infinite f
+    value. Dropped subtrees are regenerated as needed, so showing that the
+    goal is unreachable can take time exponential in the number of states.
+    Use max_expansions to bound the work.
+
+    Parameters
+    ----------
+    w : World
+        The World object.
+    max_nodes : int
+        The maximum number of search tree nodes to keep in memory.
+    max_expansions : int, optional
+        The maximum number of nodes to expand before giving up. Defaults to
+        no limit.
+
+    Returns
+    -------
+    last : dict
+        Maps the index of each state on the path to the goal to the index of
+        the state before it (-1 for the start). If no path was found or the
+        search gave up only contains the start.
+    """
+    if max_nodes < 1:
+        raise ValueError(f"max_nodes must be at least 1. Found {max_nodes}.")
+
+    start: int = w.get_start_index()
+    root: SMANode = SMANode(start, None, 0.0, w.get_heuristic(start), 0)
+    num_in_memory: int = 1
+
+    # The nodes that still have successors to generate (lowest f first) and the
+    # nodes that can be dropped from memory (highest f first).
+    open_nodes: PriorityQueue = PriorityQueue(min_heap=True)
+    leaves: PriorityQueue = PriorityQueue(min_heap=False)
+    open_nodes.enqueue(root, root.priority())
+
+    num_expansions: int = 0
+    while not open_nodes.is_empty():
+        node: SMANode = open_nodes.dequeue()
+        if node.f == math.inf:
+            break
+
+        if w.is_goal(node.state):
+            last: dict = {}
+            while node is not None:
+                last[node.state] = node.parent.state if node.parent is not None else -1
+                node = node.parent
+            return last
+
+        if max_expansions is not None and num_expansions >= max_expansions:
+            break
+        num_expansions += 1
+
+        if node.successors is None:
+            # Generate the successors' f values up front and treat them all
+            # as forgotten until they are added to memory one at a time.
+            on_path: set = set()
+            current: SMANode = node
+            while current is not None:
+                on_path.add(current.state)
+                current = current.parent
+            node.successors = {}
+            for other in w.get_neighbors(node.state):
+                if other in on_path:
+                    continue
+                cost: float = node.cost + w.get_cost(node.state, other)
+                f: float = max(node.f, cost + w.get_heuristic(other))
+                if node.depth + 2 > max_nodes or (node.depth + 2 == max_nodes and not w.is_goal(other)):
+                    # A path to the goal through this child could never fit in memory.
+                    f = math.inf
+                node.successors[other] = cost
+                node.forgotten[other] = f
+        leaves.remove(node)
+
+        # Add the best forgotten successor. Successors with an infinite f are
+        # pruned and never added back.
+        best_state: int = -1
+        best_f: float = math.inf
+        for other, f in node.forgotten.items():
+            if f < best_f:
+                best_state = other
+                best_f = f
+
+        if best_state != -1:
+            child_priority: tuple = (best_f, -(node.depth + 1))
+
+            # Make room by dropping the worst leaves, but never one that is at
+            # least as promising as the new child (or the node being expanded).
+            while num_in_memory >= max_nodes and not leaves.is_empty():
+                worst: SMANode = leaves.peek_top_value()
+                if worst.priority() <= child_priority:
+                    break
+                leaves.dequeue()
+                open_nodes.remove(worst)
+                parent: SMANode = worst.parent
+                del parent.children[worst.state]
+                parent.forgotten[worst.state] = worst.f
+                num_in_memory -= 1
+                if parent is not node:
+                    open_nodes.enqueue(parent, parent.priority())
+                    if not parent.children and parent.parent is not None:
+                        leaves.enqueue(parent, parent.priority())
+
+            if num_in_memory < max_nodes:
+                del node.forgotten[best_state]
+                child: SMANode = SMANode(
+                    best_state, node, node.successors[best_state], best_f, node.depth + 1
+                )
+                node.children[best_state] = child
+                num_in_memory += 1
+                open_nodes.enqueue(child, child.priority())
+                leaves.enqueue(child, child.priority())
+
+        _sma_backup(node, open_nodes, leaves)
+        if any(f < math.inf for f in node.forgotten.values()):
+            open_nodes.enqueue(node, node.priority())
+        if not node.children and node.parent is not None:
+            leaves.enqueue(node, node.priority())
+
+    return {start: -1}
@@ -9,9 +9,9 @@ I would normally recommend in production code.
 """
 
 import copy
-import queue
 from typing import Union
 
+from graph_algorithms_the_fun_way.frontier import DequeFrontier
 from graph_algorithms_the_fun_way.graph import Graph
 from graph_algorithms_the_fun_way.maxflow import edmonds_karp, ResidualGraph
 
@@ -31,7 +31,7 @@ def bipartite_labeling(g: Graph) -> Union[list, None]:
         Otherwise returns None.
     """
     label: list = [None] * g.num_nodes
-    pending: queue.Queue = queue.Queue()
+    pending: DequeFrontier = DequeFrontier()
 
     for start in range(g.num_nodes):
         if label[start] is not None:
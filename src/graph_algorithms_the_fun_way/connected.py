@@ -10,10 +10,18 @@ fully optimized and does not include all the validity checks that
 I would normally recommend in production code.
 """
 
-import queue
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 
-from graph_algorithms_the_fun_way.graph import Graph, make_transpose_graph
-from graph_algorithms_the_fun_way.search import dfs_connected_components
+from graph_algorithms_the_fun_way.csr_graph import CSRGraph
+from graph_algorithms_the_fun_way.frontier import DequeFrontier
+from graph_algorithms_the_fun_way.graph import Edge, Graph, make_transpose_graph
+from graph_algorithms_the_fun_way.union_find import ArrayUnionFind
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 def get_reachable(g: Graph, index: int) -> set:
@@ -32,7 +40,7 @@ def get_reachable(g: Graph, index: int) -> set:
         The set of nodes that are reachable from a given node.
     """
     seen: set = set()
-    pending: queue.Queue = queue.Queue()
+    pending: DequeFrontier = DequeFrontier()
 
     seen.add(index)
     pending.put(index)
@@ -95,6 +103,36 @@ def add_reachable(g: Graph, index: int, seen: list, reachable: list):
     reachable.append(index)
 
 
+def add_reachable_iterative(g: Graph, index: int, seen: list, reachable: list):
+    """An iterative version of add_reachable() that uses an explicit stack
+    instead of recursion. The nodes are added in the same finish order.
+
+    Parameters
+    ----------
+    g : Graph
+        The input graph.
+    index : int
+        The index of the starting node.
+    seen : list of bool
+        Whether each node in the graph has been marked seen.
+    reachable : int
+        The current list of the reachable nodes' indices.
+    """
+    seen[index] = True
+    to_explore: list = [(index, iter(g.nodes[index].get_edge_list()))]
+
+    while to_explore:
+        current, edges = to_explore[-1]
+        for edge in edges:
+            if not seen[edge.to_node]:
+                seen[edge.to_node] = True
+                to_explore.append((edge.to_node, iter(g.nodes[edge.to_node].get_edge_list())))
+                break
+        else:
+            to_explore.pop()
+            reachable.append(current)
+
+
 def kosaraju_sharir(g: Graph) -> list:
     """The Kosaraju-Sharir algorithm for strongly connected components.
 
@@ -112,7 +150,7 @@ def kosaraju_sharir(g: Graph) -> list:
     finish_ordered: list = []
     for ind in range(g.num_nodes):
         if not seen1[ind]:
-            add_reachable(g, ind, seen1, finish_ordered)
+            add_reachable_iterative(g, ind, seen1, finish_ordered)
 
     gT: Graph = make_transpose_graph(g)
 
@@ -122,12 +160,114 @@ def kosaraju_sharir(g: Graph) -> list:
         start: int = finish_ordered.pop()
         if not seen2[start]:
             new_component: list = []
-            add_reachable(gT, start, seen2, new_component)
+            add_reachable_iterative(gT, start, seen2, new_component)
             components.append(new_component)
 
     return components
 
 
+def tarjan_scc(g: Graph) -> tuple:
+    """Pearce's space-efficient variant of Tarjan's algorithm for strongly
+    connected components.
+
+    Unlike kosaraju_sharir(), this uses a single iterative depth-first search
+    and never builds the transpose graph. Each node's DFS index and, once its
+    component is found, its component number share a single integer array,
+    so the only other per-node storage is the root flags and the stacks.
+
+    Parameters
+    ----------
+    g : Graph
+        The input graph.
+
+    Returns
+    -------
+    components : list of list of int
+        The strongly connected components (each sorted by node index) in a
+        topological order of the condensation, so every edge between two
+        components goes from an earlier component to a later one.
+    component : array of int
+        Maps each node's index to the index of its component in components.
+    condensation : Graph
+        A directed acyclic graph with one node per component and an edge of
+        weight 1.0 from component i to component j if any edge of g goes from
+        a node in i to a node in j.
+    """
+    num_nodes: int = g.num_nodes
+    rindex: array = array("q", [0]) * num_nodes
+    is_root: bytearray = bytearray(num_nodes)
+    scc_stack: array = array("q")
+    next_index: int = 1
+    next_component: int = num_nodes - 1
+
+    for start in range(num_nodes):
+        if rindex[start] != 0:
+            continue
+        rindex[start] = next_index
+        next_index += 1
+        is_root[start] = 1
+        to_explore: list = [start]
+        neighbors: list = [iter(g.nodes[start].edges)]
+
+        while to_explore:
+            current: int = to_explore[-1]
+            descended: bool = False
+            for other in neighbors[-1]:
+                if rindex[other] == 0:
+                    rindex[other] = next_index
+                    next_index += 1
+                    is_root[other] = 1
+                    to_explore.append(other)
+                    neighbors.append(iter(g.nodes[other].edges))
+                    descended = True
+                    break
+                if rindex[other] < rindex[current]:
+                    rindex[current] = rindex[other]
+                    is_root[current] = 0
+            if descended:
+                continue
+
+            to_explore.pop()
+            neighbors.pop()
+            if is_root[current]:
+                # Pop the current node's component and give all of its nodes
+                # the next component number (counting down from num_nodes - 1
+                # so component numbers are never below an active DFS index).
+                next_index -= 1
+                while scc_stack and rindex[current] <= rindex[scc_stack[-1]]:
+                    rindex[scc_stack.pop()] = next_component
+                    next_index -= 1
+                rindex[current] = next_component
+                next_component -= 1
+            else:
+                scc_stack.append(current)
+
+            if to_explore:
+                parent: int = to_explore[-1]
+                if rindex[current] < rindex[parent]:
+                    rindex[parent] = rindex[current]
+                    is_root[parent] = 0
+
+    # Components are found in reverse topological order, so the first one
+    # found has the largest number.
+    num_components: int = num_nodes - 1 - next_component
+    component: array = array("q", [0]) * num_nodes
+    components: list = [[] for _ in range(num_components)]
+    for index in range(num_nodes):
+        component[index] = rindex[index] - next_component - 1
+        components[component[index]].append(index)
+
+    condensation: Graph = Graph(num_components, undirected=False)
+    for node in g.nodes:
+        from_component: int = component[node.index]
+        for other in node.edges:
+            to_component: int = component[other]
+            if from_component != to_component:
+                condensation.insert_edge(from_component, to_component, 1.0)
+
+    return components, component, condensation
+
+
 class DFSTreeStats:
     """A data structure for collecting statistics during a depth-first search.
 
@@ -202,6 +342,45 @@ def bridge_finding_dfs(g: Graph, index: int, stats: DFSTreeStats, results: list)
             stats.lowest[index] = min(stats.lowest[index], stats.order[neighbor])
 
 
+def bridge_finding_dfs_iterative(g: Graph, index: int, stats: DFSTreeStats, results: list):
+    """An iterative version of bridge_finding_dfs() that uses an explicit stack
+    instead of recursion. It produces the same statistics and list of bridges.
+
+    Parameters
+    ----------
+    g : Graph
+        The input graph.
+    index : int
+        The index of the starting node.
+    stats : DFSTreeStats
+        The statistics from the search so far.
+    results : list of Edge
+        A list of all bridges found so far.
+    """
+    stats.set_order_index(index)
+    to_explore: list = [(index, iter(g.nodes[index].get_sorted_edge_list()), None)]
+
+    while to_explore:
+        current, edges, _ = to_explore[-1]
+        for edge in edges:
+            neighbor: int = edge.to_node
+            if stats.order[neighbor] == -1:
+                stats.parent[neighbor] = current
+                stats.set_order_index(neighbor)
+                to_explore.append((neighbor, iter(g.nodes[neighbor].get_sorted_edge_list()), edge))
+                break
+            elif neighbor != stats.parent[current]:
+                stats.lowest[current] = min(stats.lowest[current], stats.order[neighbor])
+        else:
+            # Finished the current node, so update its parent using the tree edge.
+            _, _, tree_edge = to_explore.pop()
+            if tree_edge is not None:
+                parent: int = tree_edge.from_node
+                stats.lowest[parent] = min(stats.lowest[parent], stats.lowest[current])
+                if stats.lowest[current] >= stats.order[current]:
+                    results.append(tree_edge)
+
+
 def find_bridges(g: Graph) -> list:
     """The outer function for the bridge finding algorithm.
 
@@ -219,12 +398,56 @@ def find_bridges(g: Graph) -> list:
     stats: DFSTreeStats = DFSTreeStats(g.num_nodes)
     for index in range(g.num_nodes):
         if stats.order[index] == -1:
-            bridge_finding_dfs(g, index, stats, results)
+            bridge_finding_dfs_iterative(g, index, stats, results)
     return results
 
 
+def _reachable_without(
+    g: Graph, start: int, target: int, skip_from: int, skip_to: int, skip_node: int
+) -> bool:
+    """Check whether a target node can be reached from a start node while
+    ignoring one undirected edge and one node, without modifying the graph.
+
+    Parameters
+    ----------
+    g : Graph
+        The input graph.
+    start : int
+        The index of the starting node.
+    target : int
+        The index of the target node.
+    skip_from : int
+        One end of the edge to ignore (-1 to ignore no edge).
+    skip_to : int
+        The other end of the edge to ignore.
+    skip_node : int
+        The index of the node to ignore (-1 to ignore no node).
+
+    Returns
+    -------
+    bool
+        True if the target is reachable.
+    """
+    seen: set = set([start])
+    to_explore: list = [start]
+    while to_explore:
+        current: int = to_explore.pop()
+        if current == target:
+            return True
+        for other in g.nodes[current].edges:
+            if other == skip_node or other in seen:
+                continue
+            if (current == skip_from and other == skip_to) or (current == skip_to and other == skip_from):
+                continue
+            seen.add(other)
+            to_explore.append(other)
+    return False
+
+
 def find_bridges_exh(g: Graph) -> list:
     """An exhaustive iterative search for finding bridges (for testing).
+    Each edge is checked with a separate search that ignores it, so the
+    graph is never modified.
 
     Parameters
     ----------
@@ -236,19 +459,11 @@ def find_bridges_exh(g: Graph) -> list:
     results : list of Edge
         A list of all bridges found.
     """
-    num_comp = max(dfs_connected_components(g)) + 1
-    all_edges = g.make_edge_list()
-
     results = []
-    for edge in all_edges:
-        if edge.to_node < edge.from_node:
+    for edge in g.make_edge_list():
+        if edge.to_node <= edge.from_node:
             continue
-
-        g.remove_edge(edge.from_node, edge.to_node)
-        new_comp = max(dfs_connected_components(g)) + 1
-        g.insert_edge(edge.from_node, edge.to_node, 1.0)
-
-        if new_comp > num_comp:
+        if not _reachable_without(g, edge.from_node, edge.to_node, edge.from_node, edge.to_node, -1):
             results.append(edge)
 
     return results
@@ -283,6 +498,45 @@ def articulation_point_dfs(g: Graph, index: int, stats: DFSTreeStats, results: s
             stats.lowest[index] = min(stats.lowest[index], stats.order[neighbor])
 
 
+def articulation_point_dfs_iterative(g: Graph, index: int, stats: DFSTreeStats, results: set):
+    """An iterative version of articulation_point_dfs() that uses an explicit stack
+    instead of recursion. It produces the same statistics and articulation points.
+
+    Parameters
+    ----------
+    g : Graph
+        The input graph.
+    index : int
+        The index of the starting node.
+    stats : DFSTreeStats
+        The statistics from the search so far.
+    results : set of int
+        A set of all articulation points found so far.
+    """
+    stats.set_order_index(index)
+    to_explore: list = [(index, iter(g.nodes[index].get_edge_list()))]
+
+    while to_explore:
+        current, edges = to_explore[-1]
+        for edge in edges:
+            neighbor: int = edge.to_node
+            if stats.order[neighbor] == -1:
+                stats.parent[neighbor] = current
+                stats.set_order_index(neighbor)
+                to_explore.append((neighbor, iter(g.nodes[neighbor].get_edge_list())))
+                break
+            elif neighbor != stats.parent[current]:
+                stats.lowest[current] = min(stats.lowest[current], stats.order[neighbor])
+        else:
+            # Finished the current node, so update its parent (unless it is the start).
+            to_explore.pop()
+            if to_explore:
+                parent: int = stats.parent[current]
+                stats.lowest[parent] = min(stats.lowest[parent], stats.lowest[current])
+                if stats.lowest[current] >= stats.order[parent]:
+                    results.add(parent)
+
+
 def articulation_point_root(g: Graph, root: int, stats: DFSTreeStats, results: set):
     """The inner function for the articulation point finding algorithm at the root node.
 
@@ -304,7 +558,7 @@ def articulation_point_root(g: Graph, root: int, stats: DFSTreeStats, results: s
         neighbor: int = edge.to_node
         if stats.order[neighbor] == -1:
             stats.parent[neighbor] = root
-            articulation_point_dfs(g, neighbor, stats, results)
+            articulation_point_dfs_iterative(g, neighbor, stats, results)
             num_subtrees += 1
 
     if num_subtrees >= 2:
@@ -334,6 +588,8 @@ def find_articulation_points(g: Graph) -> set:
 
 def find_articulation_points_exh(g: Graph) -> list:
     """An exhaustive iterative search for finding articulation points (for testing).
+    Each node is checked with separate searches that ignore it, so the graph
+    is never modified.
 
     Parameters
     ----------
@@ -345,19 +601,465 @@ def find_articulation_points_exh(g: Graph) -> list:
     results : list of int
         A list of all articulation points found.
     """
-    comp_org = dfs_connected_components(g)
-
     results = []
     for i in range(g.num_nodes):
-        gc = g.make_copy()
+        # The node is an articulation point if its neighbors can no longer
+        # all reach the first one without it.
+        neighbors: list = [other for other in g.nodes[i].edges if other != i]
+        for other in neighbors[1:]:
+            if not _reachable_without(g, other, neighbors[0], -1, -1, i):
+                results.append(i)
+                break
+
+    return results
+
 
-        # Instead of remove the node, just remove all its edges.
-        for edge in g.nodes[i].get_edge_list():
-            gc.remove_edge(edge.from_node, edge.to_node)
+def _check_bridges(parent: array, order: array, lowest: array, pairs: list) -> list:
+    """Check candidate edges against the low-link certificates of a DFS forest.
 
-        # Use +1 here because the isolated node will be a sep component too.
-        new_comp = dfs_connected_components(gc)
-        if max(new_comp) > max(comp_org) + 1:
-            results.append(i)
+    Parameters
+    ----------
+    parent : array of int
+        The parent of each node in the DFS forest.
+    order : array of int
+        The DFS order index of each node.
+    lowest : array of int
+        The lowest order index reachable from each node's subtree with one back edge.
+    pairs : list of tuple
+        The (u, v) end points of the existing edges to check.
 
+    Returns
+    -------
+    list of bool
+        True for each edge that is a bridge.
+    """
+    results: list = []
+    for u, v in pairs:
+        if parent[u] == v:
+            u, v = v, u
+        results.append(parent[v] == u and lowest[v] > order[u])
+    return results
+
+
+def _check_articulation_points(parent: array, num_children: array, separates: bytearray, nodes: list) -> list:
+    """Check candidate nodes against the low-link certificates of a DFS forest.
+
+    Parameters
+    ----------
+    parent : array of int
+        The parent of each node in the DFS forest.
+    num_children : array of int
+        The number of children of each node in the DFS forest.
+    separates : bytearray
+        1 for each node with a child whose subtree has no back edge above it.
+    nodes : list of int
+        The indices of the nodes to check.
+
+    Returns
+    -------
+    list of bool
+        True for each node that is an articulation point.
+    """
+    results: list = []
+    for index in nodes:
+        if parent[index] == -1:
+            results.append(num_children[index] > 1)
+        else:
+            results.append(separates[index] == 1)
+    return results
+
+
+def _run_checks(check, certificates: tuple, candidates: list, num_workers: int) -> list:
+    """Run a certificate check over a list of candidates, optionally split
+    into chunks over a process pool.
+
+    Parameters
+    ----------
+    check : function
+        The check to run with (*certificates, candidates).
+    certificates : tuple
+        The certificate arrays to pass to the check.
+    candidates : list
+        The candidates to check.
+    num_workers : int
+        The number of worker processes (1 to check in this process).
+
+    Returns
+    -------
+    list of bool
+        The result for each candidate.
+    """
+    if num_workers < 1:
+        raise ValueError(f"num_workers must be at least 1. Found {num_workers}.")
+    if num_workers == 1 or len(candidates) < 2:
+        return check(*certificates, candidates)
+
+    chunk_size: int = (len(candidates) + num_workers - 1) // num_workers
+    results: list = []
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        futures: list = [
+            executor.submit(check, *certificates, candidates[i : i + chunk_size])
+            for i in range(0, len(candidates), chunk_size)
+        ]
+        for future in futures:
+            results.extend(future.result())
+    return results
+
+
+def low_link_certificates(g: Graph) -> tuple:
+    """Build a single DFS forest of an undirected graph and the low-link
+    values needed to check any edge for being a bridge or any node for being
+    an articulation point in constant time. The graph is not modified.
+
+    Parameters
+    ----------
+    g : Graph
+        The input graph.
+
+    Returns
+    -------
+    parent : array of int
+        The parent of each node in the DFS forest (-1 for roots).
+    order : array of int
+        The DFS order index of each node.
+    lowest : array of int
+        The lowest order index reachable from each node's subtree using at
+        most one back edge.
+    num_children : array of int
+        The number of children of each node in the DFS forest.
+    separates : bytearray
+        1 for each node with a child whose subtree has no back edge above
+        the node and 0 otherwise.
+    """
+    num_nodes: int = g.num_nodes
+    parent: array = array("q", [-1]) * num_nodes
+    order: array = array("q", [-1]) * num_nodes
+    lowest: array = array("q", [-1]) * num_nodes
+    num_children: array = array("q", [0]) * num_nodes
+    separates: bytearray = bytearray(num_nodes)
+    next_order: int = 0
+
+    for root in range(num_nodes):
+        if order[root] != -1:
+            continue
+        order[root] = next_order
+        lowest[root] = next_order
+        next_order += 1
+        to_explore: list = [(root, iter(g.nodes[root].edges))]
+
+        while to_explore:
+            current, neighbors = to_explore[-1]
+            for other in neighbors:
+                if order[other] == -1:
+                    parent[other] = current
+                    order[other] = next_order
+                    lowest[other] = next_order
+                    next_order += 1
+                    to_explore.append((other, iter(g.nodes[other].edges)))
+                    break
+                elif other != parent[current] and order[other] < lowest[current]:
+                    lowest[current] = order[other]
+            else:
+                to_explore.pop()
+                prev: int = parent[current]
+                if prev != -1:
+                    num_children[prev] += 1
+                    if lowest[current] < lowest[prev]:
+                        lowest[prev] = lowest[current]
+                    if lowest[current] >= order[prev]:
+                        separates[prev] = 1
+
+    return parent, order, lowest, num_children, separates
+
+
+def verify_bridges(g: Graph, candidates: list, num_workers: int = 1) -> list:
+    """Check whether each of a list of edges is a bridge of an undirected
+    graph using the low-link certificates of a single DFS forest. The graph
+    is not modified.
+
+    Parameters
+    ----------
+    g : Graph
+        The input graph.
+    candidates : list
+        The edges to check, each as an Edge or a (u, v) tuple.
+    num_workers : int
+        The number of worker processes used to check the candidates. Each
+        check takes constant time, while each worker is sent its own copy of
+        the certificate arrays, so more than one worker only pays off for
+        very large lists of candidates.
+
+    Returns
+    -------
+    list of bool
+        True for each candidate that is an edge of the graph and a bridge.
+    """
+    parent, order, lowest, _, _ = low_link_certificates(g)
+
+    results: list = [False] * len(candidates)
+    positions: list = []
+    pairs: list = []
+    for i, candidate in enumerate(candidates):
+        if isinstance(candidate, Edge):
+            u, v = candidate.from_node, candidate.to_node
+        else:
+            u, v = candidate
+        if g.is_edge(u, v) and u != v:
+            positions.append(i)
+            pairs.append((u, v))
+
+    checks: list = _run_checks(_check_bridges, (parent, order, lowest), pairs, num_workers)
+    for i, is_bridge in zip(positions, checks):
+        results[i] = is_bridge
     return results
+
+
+def verify_articulation_points(g: Graph, candidates: list, num_workers: int = 1) -> list:
+    """Check whether each of a list of nodes is an articulation point of an
+    undirected graph using the low-link certificates of a single DFS forest.
+    The graph is not modified.
+
+    Parameters
+    ----------
+    g : Graph
+        The input graph.
+    candidates : list of int
+        The indices of the nodes to check.
+    num_workers : int
+        The number of worker processes used to check the candidates. Each
+        check takes constant time, while each worker is sent its own copy of
+        the certificate arrays, so more than one worker only pays off for
+        very large lists of candidates.
+
+    Returns
+    -------
+    list of bool
+        True for each candidate that is an articulation point.
+    """
+    for index in candidates:
+        if index < 0 or index >= g.num_nodes:
+            raise IndexError
+    parent, _, _, num_children, separates = low_link_certificates(g)
+    return _run_checks(
+        _check_articulation_points, (parent, num_children, separates), list(candidates), num_workers
+    )
+
+
+def biconnected_components(g: Graph) -> tuple:
+    """Find the bridges, articulation points, and biconnected components
+    (blocks) of an undirected graph with a single iterative depth-first search.
+
+    The search keeps a stack of the edges it has seen. When it finishes a
+    node whose subtree has no back edge above its parent, the edges on the
+    stack down to the tree edge into that node form one block. Each node's
+    neighbors are visited in the adjacency list's order (without sorting),
+    so the search runs in time linear in the size of the graph.
+
+    Parameters
+    ----------
+    g : Graph
+        The input graph. It is treated as undirected and self edges are ignored.
+
+    Returns
+    -------
+    bridges : list of Edge
+        The bridges (each from the parent to the child in the DFS tree).
+    articulation_points : set of int
+        The articulation points.
+    blocks : list of list of int
+        The sorted node indices of each block. Every edge (other than self
+        edges) is in exactly one block and isolated nodes are in none.
+    block_cut_tree : Graph
+        An undirected forest with one node labeled "block_i" for each block i
+        followed by one node labeled "cut_v" for each articulation point v (in
+        increasing order of v). Each block is linked to the articulation points
+        it contains.
+    """
+    num_nodes: int = g.num_nodes
+    order: array = array("q", [-1]) * num_nodes
+    lowest: array = array("q", [-1]) * num_nodes
+    block_mark: array = array("q", [-1]) * num_nodes
+    next_order: int = 0
+
+    bridges: list = []
+    articulation_points: set = set()
+    blocks: list = []
+    edge_from: array = array("q")
+    edge_to: array = array("q")
+
+    for root in range(num_nodes):
+        if order[root] != -1:
+            continue
+        order[root] = next_order
+        lowest[root] = next_order
+        next_order += 1
+        root_children: int = 0
+        to_explore: list = [(root, iter(g.nodes[root].edges), -1)]
+
+        while to_explore:
+            current, neighbors, parent = to_explore[-1]
+            for other in neighbors:
+                if order[other] == -1:
+                    edge_from.append(current)
+                    edge_to.append(other)
+                    order[other] = next_order
+                    lowest[other] = next_order
+                    next_order += 1
+                    to_explore.append((other, iter(g.nodes[other].edges), current))
+                    break
+                elif other != parent and order[other] < order[current]:
+                    edge_from.append(current)
+                    edge_to.append(other)
+                    if order[other] < lowest[current]:
+                        lowest[current] = order[other]
+            else:
+                to_explore.pop()
+                if parent == -1:
+                    continue
+                if lowest[current] < lowest[parent]:
+                    lowest[parent] = lowest[current]
+                if lowest[current] < order[parent]:
+                    continue
+
+                # The parent separates the current node's subtree from the
+                # rest of the graph, so pop the subtree's block.
+                if lowest[current] > order[parent]:
+                    bridges.append(g.nodes[parent].edges[current])
+                if parent == root:
+                    root_children += 1
+                    if root_children > 1:
+                        articulation_points.add(root)
+                else:
+                    articulation_points.add(parent)
+
+                block_id: int = len(blocks)
+                block: list = []
+                while True:
+                    from_node: int = edge_from.pop()
+                    to_node: int = edge_to.pop()
+                    for node in (from_node, to_node):
+                        if block_mark[node] != block_id:
+                            block_mark[node] = block_id
+                            block.append(node)
+                    if from_node == parent and to_node == current:
+                        break
+                block.sort()
+                blocks.append(block)
+
+    cut_points: list = sorted(articulation_points)
+    cut_index: dict = {}
+    block_cut_tree: Graph = Graph(len(blocks) + len(cut_points), undirected=True)
+    for i, v in enumerate(cut_points):
+        cut_index[v] = len(blocks) + i
+        block_cut_tree.label_node(cut_index[v], f"cut_{v}")
+    for i, block in enumerate(blocks):
+        block_cut_tree.label_node(i, f"block_{i}")
+        for v in block:
+            if v in cut_index:
+                block_cut_tree.insert_edge(i, cut_index[v], 1.0)
+
+    return bridges, articulation_points, blocks, block_cut_tree
+
+
+def union_find_components(num_nodes: int, edges) -> tuple:
+    """Find the connected components of an undirected graph with a single
+    pass of union-find over its edges. The edges can come from any iterable,
+    such as g.make_edge_list() or a stream read from a file, so the graph's
+    adjacency lists are never needed.
+
+    The components are numbered in the same order as dfs_connected_components()
+    (by the smallest node index in each component).
+
+    Parameters
+    ----------
+    num_nodes : int
+        The number of nodes in the graph.
+    edges : iterable of Edge
+        The graph's edges.
+
+    Returns
+    -------
+    component : list of int
+        Maps each node's index to the number of its component.
+    sizes : list of int
+        The number of nodes in each component.
+    """
+    djs: ArrayUnionFind = ArrayUnionFind(num_nodes)
+    for edge in edges:
+        djs.union_sets(edge.from_node, edge.to_node)
+
+    component: list = [-1] * num_nodes
+    root_component: dict = {}
+    sizes: list = []
+    for index in range(num_nodes):
+        root: int = djs.find_set(index)
+        if root not in root_component:
+            root_component[root] = len(sizes)
+            sizes.append(djs.set_sizes[root])
+        component[index] = root_component[root]
+    return component, sizes
+
+
+def label_propagation_components(csr: CSRGraph) -> tuple:
+    """Find the connected components of a graph with vectorized min-label
+    propagation over its compressed sparse row arrays (requires numpy).
+
+    Each node starts with its own index as its label. Every round each node
+    takes the smallest label among itself and its neighbors, and then the labels
+    are shortcut by repeatedly replacing each label with its own label. The
+    rounds stop when no label changes, leaving each node labeled with the
+    smallest index in its component. For directed graphs the edges are
+    followed in both directions (finding weakly connected components).
+
+    The components are numbered in the same order as dfs_connected_components()
+    (by the smallest node index in each component).
+
+    Parameters
+    ----------
+    csr : CSRGraph
+        The input graph.
+
+    Returns
+    -------
+    component : numpy.ndarray of int
+        Maps each node's index to the number of its component.
+    sizes : numpy.ndarray of int
+        The number of nodes in each component.
+    """
+    if np is None:
+        raise ImportError("label_propagation_components requires numpy.")
+
+    num_nodes: int = csr.num_nodes
+    offsets = np.frombuffer(csr.offsets, dtype=np.int64)
+    targets = np.frombuffer(csr.targets, dtype=np.int64)
+    degrees = np.diff(offsets)
+    has_edges = degrees > 0
+    sources = np.repeat(np.arange(num_nodes, dtype=np.int64), degrees)
+
+    labels = np.arange(num_nodes, dtype=np.int64)
+    while True:
+        # Each node's edges are contiguous in the targets array, so the smallest
+        # neighbor label of every node is a single segmented reduction.
+        new_labels = labels.copy()
+        if len(targets) > 0:
+            neighbor_min = np.minimum.reduceat(labels[targets], offsets[:-1][has_edges])
+            np.minimum(new_labels[has_edges], neighbor_min, out=neighbor_min)
+            new_labels[has_edges] = neighbor_min
+            if not csr.undirected:
+                np.minimum.at(new_labels, targets, labels[sources])
+
+        # Labels always point at smaller indices in the same component, so
+        # shortcut each label to its label's label until they are stable.
+        while True:
+            jumped = new_labels[new_labels]
+            if np.array_equal(jumped, new_labels):
+                break
+            new_labels = jumped
+
+        if np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+
+    roots, component = np.unique(labels, return_inverse=True)
+    sizes = np.bincount(component, minlength=len(roots))
+    return component.astype(np.int64), sizes
@@ -0,0 +1,184 @@
+"""A compact, array-backed (compressed sparse row) representation of
+a graph's adjacency structure for algorithms that need to scan large
+graphs quickly.
+
+Unlike the Graph class, a CSRGraph does not create a Node or Edge object
+for each node and edge. Instead the out-neighbors of node i are stored
+in targets[offsets[i]] through targets[offsets[i + 1] - 1] with the
+corresponding weights in the same positions of the weights array.
+"""
+
+from array import array
+
+from graph_algorithms_the_fun_way.graph import Graph
+
+
+class CSRGraph:
+    """A compressed sparse row representation of a graph.
+
+    Attributes
+    ----------
+    num_nodes : int
+        The total number of nodes in the graph.
+    undirected : bool
+        A Boolean indicating whether the graph is undirected (True) or
+        directed (False). Undirected edges are stored in both directions.
+    offsets : array of int
+        An array of length num_nodes + 1 where offsets[i] is the position in
+        targets of node i's first edge.
+    targets : array of int
+        The destination node of each edge grouped by origin node.
+    weights : array of float
+        The weight of each edge in the same order as targets.
+    """
+
+    def __init__(self, num_nodes: int, undirected: bool, offsets: array, targets: array, weights: array):
+        if len(offsets) != num_nodes + 1:
+            raise ValueError(f"Expected {num_nodes + 1} offsets. Found {len(offsets)}.")
+        if len(targets) != len(weights):
+            raise ValueError("The targets and weights arrays must be the same length.")
+
+        self.num_nodes: int = num_nodes
+        self.undirected: bool = undirected
+        self.offsets: array = offsets
+        self.targets: array = targets
+        self.weights: array = weights
+
+    def num_edges(self) -> int:
+        """Returns the number of stored (directed) edges."""
+        return len(self.targets)
+
+    def out_degree(self, index: int) -> int:
+        """Returns the out-degree of a node.
+
+        Parameters
+        ----------
+        index : int
+            The index of the node.
+        """
+        return self.offsets[index + 1] - self.offsets[index]
+
+    def get_neighbors(self, index: int) -> array:
+        """Return the indices of the node's out-neighbors.
+
+        Parameters
+        ----------
+        index : int
+            The index of the node.
+
+        Returns
+        -------
+        neighbors : array of int
+            The indices of the node's out-neighbors.
+        """
+        return self.targets[self.offsets[index] : self.offsets[index + 1]]
+
+    def make_transpose(self):
+        """Create the transpose of the graph, so each node's neighbors are its in-neighbors.
+
+        Returns
+        -------
+        gT : CSRGraph
+            The transposed graph.
+        """
+        if self.undirected:
+            return self
+
+        counts: array = array("q", [0]) * (self.num_nodes + 1)
+        for to_node in self.targets:
+            counts[to_node + 1] += 1
+        for i in range(self.num_nodes):
+            counts[i + 1] += counts[i]
+
+        offsets: array = array("q", counts)
+        targets: array = array("q", [0]) * len(self.targets)
+        weights: array = array("d", [0.0]) * len(self.weights)
+        for from_node in range(self.num_nodes):
+            for k in range(self.offsets[from_node], self.offsets[from_node + 1]):
+                to_node: int = self.targets[k]
+                pos: int = counts[to_node]
+                targets[pos] = from_node
+                weights[pos] = self.weights[k]
+                counts[to_node] = pos + 1
+        return CSRGraph(self.num_nodes, False, offsets, targets, weights)
+
+
+def make_csr_graph(g: Graph) -> CSRGraph:
+    """Create a compressed sparse row copy of a Graph. The neighbors of
+    each node are kept in the same order as node.get_edge_list().
+
+    Parameters
+    ----------
+    g : Graph
+        The input graph.
+
+    Returns
+    -------
+    csr : CSRGraph
+        The compressed graph.
+    """
+    offsets: array = array("q", [0]) * (g.num_nodes + 1)
+    targets: array = array("q")
+    weights: array = array("d")
+
+    for node in g.nodes:
+        for edge in node.get_edge_list():
+            targets.append(edge.to_node)
+            weights.append(edge.weight)
+        offsets[node.index + 1] = len(targets)
+    return CSRGraph(g.num_nodes, g.undirected, offsets, targets, weights)
+
+
+def make_csr_graph_from_edges(num_nodes: int, undirected: bool, edges) -> CSRGraph:
+    """Create a compressed sparse row graph from an iterable of edges
+    (such as a list or a stream read from a file) in a single pass over the edges.
+
+    Parameters
+    ----------
+    num_nodes : int
+        The total number of nodes in the graph.
+    undirected : bool
+        A Boolean indicating whether the graph is undirected (True) or
+        directed (False).
+    edges : iterable of Edge
+        The edges to add. For undirected graphs each edge only needs to
+        be listed once (edges listed in both directions are stored twice).
+
+    Returns
+    -------
+    csr : CSRGraph
+        The compressed graph.
+    """
+    from_nodes: array = array("q")
+    to_nodes: array = array("q")
+    edge_weights: array = array("d")
+    for edge in edges:
+        if edge.from_node < 0 or edge.from_node >= num_nodes:
+            raise IndexError
+        if edge.to_node < 0 or edge.to_node >= num_nodes:
+            raise IndexError
+
+        from_nodes.append(edge.from_node)
+        to_nodes.append(edge.to_node)
+        edge_weights.append(edge.weight)
+        if undirected and edge.from_node != edge.to_node:
+            from_nodes.append(edge.to_node)
+            to_nodes.append(edge.from_node)
+            edge_weights.append(edge.weight)
+
+    # Bucket the edges by their origin node (a counting sort).
+    counts: array = array("q", [0]) * (num_nodes + 1)
+    for from_node in from_nodes:
+        counts[from_node + 1] += 1
+    for i in range(num_nodes):
+        counts[i + 1] += counts[i]
+
+    offsets: array = array("q", counts)
+    targets: array = array("q", [0]) * len(to_nodes)
+    weights: array = array("d", [0.0]) * len(to_nodes)
+    for k in range(len(to_nodes)):
+        pos: int = counts[from_nodes[k]]
+        targets[pos] = to_nodes[k]
+        weights[pos] = edge_weights[k]
+        counts[from_nodes[k]] = pos + 1
+    return CSRGraph(num_nodes, undirected, offsets, targets, weights)
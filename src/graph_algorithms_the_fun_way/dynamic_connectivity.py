@@ -0,0 +1,433 @@
+"""Algorithms for connectivity questions on undirected graphs whose edges
+change over time.
+
+The offline algorithm takes the whole sequence of edge insertions,
+deletions, and connectivity queries at once. It computes the range of
+queries during which each edge exists and places each range in the nodes
+of a segment tree over the queries. A depth-first walk of the tree adds an
+edge to a RollbackUnionFind on entering a node that contains it and
+undoes the union on leaving. Each leaf then sees exactly the edges present
+at its query, for O((n + m) log m log n) total time for m events.
+
+The online IncrementalConnectivity structure only supports edge insertions
+but answers each query as soon as it arrives. It maintains the connected
+components and the 2-edge-connected components (the pieces left after
+removing every bridge) of the graph. The 2-edge-connected components of each
+connected component form a tree whose edges are exactly the bridges. A new
+edge between two trees links them with a new bridge, while a new edge within
+a tree turns every bridge on the tree path between its ends into a non-bridge
+and merges the path's 2-edge-connected components into one.
+"""
+
+from array import array
+
+from graph_algorithms_the_fun_way.union_find import RollbackUnionFind
+
+
+def _add_interval(tree_edges: dict, num_queries: int, start: int, end: int, edge: tuple):
+    """Add an edge to the segment tree nodes that exactly cover a range of queries.
+
+    Parameters
+    ----------
+    tree_edges : dict
+        Maps the index of each segment tree node to a list of its edges.
+    num_queries : int
+        The total number of queries.
+    start : int
+        The index of the first query in the range.
+    end : int
+        One past the index of the last query in the range.
+    edge : tuple
+        The (u, v) edge to add.
+    """
+    stack: list = [(1, 0, num_queries)]
+    while stack:
+        node, lo, hi = stack.pop()
+        if end <= lo or hi <= start:
+            continue
+        if start <= lo and hi <= end:
+            tree_edges.setdefault(node, []).append(edge)
+            continue
+
+        mid: int = (lo + hi) // 2
+        stack.append((2 * node, lo, mid))
+        stack.append((2 * node + 1, mid, hi))
+
+
+def offline_dynamic_connectivity(num_nodes: int, events: list) -> list:
+    """Answer a batch of connectivity queries on an undirected graph whose
+    edges are inserted and deleted over time.
+
+    Parameters
+    ----------
+    num_nodes : int
+        The number of nodes in the graph.
+    events : list of tuple
+        The events in time order. Each is ("insert", u, v) to add the edge
+        between nodes u and v, ("delete", u, v) to remove one copy of it, or
+        ("query", u, v) to ask whether u and v are connected.
+
+    Returns
+    -------
+    answers : list of bool
+        For each query in order, True if the two nodes are connected at the
+        time of the query and False otherwise.
+    """
+    # Find the range of queries during which each copy of each edge exists.
+    query_pairs: list = []
+    intervals: list = []
+    open_edges: dict = {}
+    for kind, u, v in events:
+        if u < 0 or u >= num_nodes or v < 0 or v >= num_nodes:
+            raise IndexError
+        edge: tuple = (u, v) if u <= v else (v, u)
+
+        if kind == "insert":
+            open_edges.setdefault(edge, []).append(len(query_pairs))
+        elif kind == "delete":
+            starts: list = open_edges.get(edge, [])
+            if not starts:
+                raise ValueError(f"Cannot delete missing edge ({u}, {v}).")
+            intervals.append((starts.pop(), len(query_pairs), edge))
+        elif kind == "query":
+            query_pairs.append((u, v))
+        else:
+            raise ValueError(f"Unknown event type {kind}.")
+
+    num_queries: int = len(query_pairs)
+    if num_queries == 0:
+        return []
+    for edge, starts in open_edges.items():
+        for start in starts:
+            intervals.append((start, num_queries, edge))
+
+    tree_edges: dict = {}
+    for start, end, edge in intervals:
+        if start < end:
+            _add_interval(tree_edges, num_queries, start, end, edge)
+
+    # Walk the segment tree depth-first. A negative checkpoint marks an entry
+    # the walk has not entered yet; otherwise the entry undoes the node's unions.
+    answers: list = [False] * num_queries
+    djs: RollbackUnionFind = RollbackUnionFind(num_nodes)
+    stack: list = [(1, 0, num_queries, -1)]
+    while stack:
+        node, lo, hi, checkpoint = stack.pop()
+        if checkpoint >= 0:
+            djs.rollback(checkpoint)
+            continue
+
+        checkpoint = djs.checkpoint()
+        for u, v in tree_edges.get(node, []):
+            djs.union_sets(u, v)
+
+        if hi - lo == 1:
+            u, v = query_pairs[lo]
+            answers[lo] = not djs.are_disjoint(u, v)
+            djs.rollback(checkpoint)
+        else:
+            mid: int = (lo + hi) // 2
+            stack.append((node, lo, hi, checkpoint))
+            stack.append((2 * node + 1, mid, hi, -1))
+            stack.append((2 * node, lo, mid, -1))
+    return answers
+
+
+class IncrementalConnectivity:
+    """An online structure for the connected components and bridges of an
+    undirected graph under edge insertions.
+
+    Each node belongs to a 2-edge-connected component, tracked with a
+    union-find with path compression, represented by one of its nodes. Each
+    representative points to its parent in its connected component's bridge
+    tree, and a second union-find over the representatives tracks the
+    connected components. Linking two trees re-roots the smaller one, so each
+    insertion takes amortized O(log n) time and each query amortized near
+    constant time.
+
+    Attributes
+    ----------
+    num_nodes : int
+        The number of nodes in the graph.
+    num_components : int
+        The current number of connected components.
+    num_bridges : int
+        The current number of bridges.
+    ecc_parent : array of int
+        The union-find parent of each node for the 2-edge-connected components.
+    cc_parent : array of int
+        The union-find parent of each representative for the connected components.
+    cc_size : array of int
+        The number of representatives in each connected component (stored at
+        the component's root).
+    tree_parent : array of int
+        The parent of each representative in the bridge tree (-1 for the root).
+    tree_edge : list of tuple
+        The (u, v) graph edge that forms the bridge to each representative's
+        tree parent, with u on the representative's side.
+    edges : set of tuple
+        The inserted edges as (min(u, v), max(u, v)) tuples.
+
+    Parameters
+    ----------
+    num_nodes : int
+        The number of nodes in the graph.
+    """
+
+    def __init__(self, num_nodes: int):
+        self.num_nodes: int = num_nodes
+        self.num_components: int = num_nodes
+        self.num_bridges: int = 0
+        self.ecc_parent: array = array("q", range(num_nodes))
+        self.cc_parent: array = array("q", range(num_nodes))
+        self.cc_size: array = array("q", [1]) * num_nodes
+        self.tree_parent: array = array("q", [-1]) * num_nodes
+        self.tree_edge: list = [None] * num_nodes
+        self.edges: set = set()
+
+        self._last_visit: array = array("q", [0]) * num_nodes
+        self._visit_iteration: int = 0
+
+    def _check_node(self, index: int):
+        """Raise an IndexError if a node index is out of range."""
+        if index < 0 or index >= self.num_nodes:
+            raise IndexError
+
+    def _find_ecc(self, index: int) -> int:
+        """Find the representative of a node's 2-edge-connected component.
+
+        Parameters
+        ----------
+        index : int
+            The index of the node (or -1).
+
+        Returns
+        -------
+        int
+            The index of the representative (or -1 if index is -1).
+        """
+        if index == -1:
+            return -1
+        root: int = index
+        while self.ecc_parent[root] != root:
+            root = self.ecc_parent[root]
+        while self.ecc_parent[index] != root:
+            next_index: int = self.ecc_parent[index]
+            self.ecc_parent[index] = root
+            index = next_index
+        return root
+
+    def _find_cc(self, index: int) -> int:
+        """Find the root of a node's connected component.
+
+        Parameters
+        ----------
+        index : int
+            The index of the node.
+
+        Returns
+        -------
+        int
+            The representative at the root of the component's bridge tree.
+        """
+        index = self._find_ecc(index)
+        root: int = index
+        while self.cc_parent[root] != root:
+            root = self.cc_parent[root]
+        while self.cc_parent[index] != root:
+            next_index: int = self.cc_parent[index]
+            self.cc_parent[index] = root
+            index = next_index
+        return root
+
+    def _make_root(self, index: int):
+        """Re-root a bridge tree at a node's 2-edge-connected component by
+        reversing the tree path from it to the current root. Each bridge on
+        the path is flipped to keep its child's end first.
+
+        Parameters
+        ----------
+        index : int
+            The index of the node.
+        """
+        current: int = self._find_ecc(index)
+        root: int = current
+        child: int = -1
+        child_edge = None
+        while current != -1:
+            parent: int = self._find_ecc(self.tree_parent[current])
+            edge = self.tree_edge[current]
+            self.tree_parent[current] = child
+            self.tree_edge[current] = child_edge
+            self.cc_parent[current] = root
+            child = current
+            child_edge = (edge[1], edge[0]) if edge is not None else None
+            current = parent
+        self.cc_size[root] = self.cc_size[child]
+
+    def _merge_path(self, a: int, b: int):
+        """Merge the 2-edge-connected components on the bridge tree path
+        between two representatives in the same tree.
+
+        Parameters
+        ----------
+        a : int
+            The first representative.
+        b : int
+            The second representative.
+        """
+        # Walk up from both ends one step at a time until one walk reaches a
+        # representative the other has already visited (their lowest common
+        # ancestor).
+        self._visit_iteration += 1
+        path_a: list = []
+        path_b: list = []
+        lca: int = -1
+        while lca == -1:
+            if a != -1:
+                a = self._find_ecc(a)
+                path_a.append(a)
+                if self._last_visit[a] == self._visit_iteration:
+                    lca = a
+                    break
+                self._last_visit[a] = self._visit_iteration
+                a = self.tree_parent[a]
+            if b != -1:
+                b = self._find_ecc(b)
+                path_b.append(b)
+                if self._last_visit[b] == self._visit_iteration:
+                    lca = b
+                    break
+                self._last_visit[b] = self._visit_iteration
+                b = self.tree_parent[b]
+
+        for path in (path_a, path_b):
+            for current in path:
+                self.ecc_parent[current] = lca
+                if current == lca:
+                    break
+                self.num_bridges -= 1
+
+    def insert_edge(self, u: int, v: int):
+        """Insert an undirected edge.
+
+        Parameters
+        ----------
+        u : int
+            The index of the first node.
+        v : int
+            The index of the second node.
+        """
+        self._check_node(u)
+        self._check_node(v)
+        self.edges.add((u, v) if u <= v else (v, u))
+
+        a: int = self._find_ecc(u)
+        b: int = self._find_ecc(v)
+        if a == b:
+            return
+
+        ca: int = self._find_cc(a)
+        cb: int = self._find_cc(b)
+        if ca != cb:
+            # Hang the smaller tree below the new edge's end in the larger one.
+            self.num_bridges += 1
+            self.num_components -= 1
+            if self.cc_size[ca] > self.cc_size[cb]:
+                a, b = b, a
+                u, v = v, u
+                ca, cb = cb, ca
+            self._make_root(a)
+            self.tree_parent[a] = b
+            self.tree_edge[a] = (u, v)
+            self.cc_parent[a] = b
+            self.cc_size[cb] += self.cc_size[a]
+        else:
+            self._merge_path(a, b)
+
+    def component(self, index: int) -> int:
+        """Get an identifier for a node's connected component. Two nodes have
+        the same identifier exactly when they are connected, but a component's
+        identifier can change when edges are inserted.
+
+        Parameters
+        ----------
+        index : int
+            The index of the node.
+
+        Returns
+        -------
+        int
+            The index of the component's representative node.
+        """
+        self._check_node(index)
+        return self._find_cc(index)
+
+    def are_connected(self, u: int, v: int) -> bool:
+        """Check whether two nodes are connected.
+
+        Parameters
+        ----------
+        u : int
+            The index of the first node.
+        v : int
+            The index of the second node.
+
+        Returns
+        -------
+        bool
+            True if there is a path between u and v.
+        """
+        return self.component(u) == self.component(v)
+
+    def two_edge_component(self, index: int) -> int:
+        """Get an identifier for a node's 2-edge-connected component, which
+        can change when edges are inserted.
+
+        Parameters
+        ----------
+        index : int
+            The index of the node.
+
+        Returns
+        -------
+        int
+            The index of the component's representative node.
+        """
+        self._check_node(index)
+        return self._find_ecc(index)
+
+    def is_bridge(self, u: int, v: int) -> bool:
+        """Check whether the edge between two nodes is a bridge.
+
+        Parameters
+        ----------
+        u : int
+            The index of the first node.
+        v : int
+            The index of the second node.
+
+        Returns
+        -------
+        bool
+            True if the edge exists and removing it would disconnect u and v.
+        """
+        self._check_node(u)
+        self._check_node(v)
+        if ((u, v) if u <= v else (v, u)) not in self.edges:
+            return False
+        return self._find_ecc(u) != self._find_ecc(v)
+
+    def get_bridges(self) -> list:
+        """Get all of the current bridges.
+
+        Returns
+        -------
+        bridges : list of tuple
+            The (u, v) node pairs of the bridges.
+        """
+        bridges: list = []
+        for index in range(self.num_nodes):
+            if self.ecc_parent[index] == index and self.tree_parent[index] != -1:
+                bridges.append(self.tree_edge[index])
+        return bridges
@@ -112,6 +112,57 @@ def save_graph_to_csv(g: Graph, filename: str):
                 graph_writer.writerow([edge.from_node, edge.to_node, edge.weight])
 
 
+def save_edges_to_csv(edges, filename: str) -> int:
+    """Save a stream of edges to a weighted CSV file with one
+    from_node,to_node,weight row per edge. The edges are written as they
+    are produced, so the stream never needs to be held in memory.
+
+    Parameters
+    ----------
+    edges : iterable of Edge
+        The edges to save (such as a list or a generator).
+    filename : str
+        The name of the file to which to write the edges.
+
+    Returns
+    -------
+    num_edges : int
+        The number of edges written.
+    """
+    num_edges: int = 0
+    with open(filename, "w", newline="\n") as f:
+        graph_writer = csv.writer(f, delimiter=",")
+        for edge in edges:
+            graph_writer.writerow([edge.from_node, edge.to_node, edge.weight])
+            num_edges += 1
+    return num_edges
+
+
+def read_edge_stream(filename: str):
+    """Read the edges from a CSV file with one from_node,to_node[,weight]
+    row per edge (such as the files written by save_edges_to_csv()),
+    yielding them one at a time so the file is never held in memory.
+    Rows without a weight have a weight of 1.0.
+
+    Parameters
+    ----------
+    filename : str
+        The name of the file to read.
+
+    Yields
+    ------
+    edge : Edge
+        The next edge in the file.
+    """
+    with open(filename) as f:
+        edge_reader = csv.reader(f, delimiter=",")
+        for row in edge_reader:
+            if len(row) < 2:
+                continue
+            weight: float = float(row[2]) if len(row) > 2 else 1.0
+            yield Edge(int(row[0]), int(row[1]), weight)
+
+
 def make_graph_from_multi_csv(filename: str) -> Graph:
     """Read a graph a CSV with multiple node names per line (co-occurrence graph).
 
@@ -0,0 +1,128 @@
+"""First-in, first-out frontiers for breadth-first style searches.
+
+Python's queue.Queue is designed for passing work between threads, so it
+acquires a lock on every put() and get(). The single-threaded searches in
+this package do not need that, so they use one of the frontiers below. Both
+provide the same put(), get(), and empty() methods as queue.Queue.
+"""
+
+from array import array
+from collections import deque
+
+
+class DequeFrontier:
+    """A first-in, first-out frontier backed by a collections.deque. It can
+    hold any type of item and grows as needed.
+
+    Attributes
+    ----------
+    items : deque
+        The items in the frontier in the order they were added.
+    """
+
+    def __init__(self):
+        self.items: deque = deque()
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def empty(self) -> bool:
+        """Return whether the frontier is empty."""
+        return not self.items
+
+    def put(self, item):
+        """Add an item to the back of the frontier.
+
+        Parameters
+        ----------
+        item : any
+            The item to add.
+        """
+        self.items.append(item)
+
+    def get(self):
+        """Remove and return the item at the front of the frontier.
+
+        Returns
+        -------
+        item : any
+            The oldest item in the frontier.
+        """
+        if not self.items:
+            raise IndexError("get from an empty frontier")
+        return self.items.popleft()
+
+
+class RingBufferFrontier:
+    """A first-in, first-out frontier of node indices stored in a preallocated
+    circular array. A search that adds each node at most once can use a
+    capacity equal to the number of nodes.
+
+    The DequeFrontier is faster per operation, but this frontier uses a fixed
+    8 bytes per slot and never reallocates, which bounds the memory of
+    searches over very large graphs.
+
+    Attributes
+    ----------
+    buffer : array of int
+        The preallocated storage.
+    capacity : int
+        The maximum number of items the frontier can hold.
+    head : int
+        The position in buffer of the front item.
+    size : int
+        The number of items in the frontier.
+
+    Parameters
+    ----------
+    capacity : int
+        The maximum number of items the frontier can hold.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity: int = max(capacity, 1)
+        self.buffer: array = array("q", [0]) * self.capacity
+        self.head: int = 0
+        self.size: int = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def empty(self) -> bool:
+        """Return whether the frontier is empty."""
+        return self.size == 0
+
+    def put(self, item: int):
+        """Add an index to the back of the frontier.
+
+        Parameters
+        ----------
+        item : int
+            The index to add.
+        """
+        if self.size == self.capacity:
+            raise IndexError("put to a full frontier")
+
+        pos: int = self.head + self.size
+        if pos >= self.capacity:
+            pos -= self.capacity
+        self.buffer[pos] = item
+        self.size += 1
+
+    def get(self) -> int:
+        """Remove and return the index at the front of the frontier.
+
+        Returns
+        -------
+        item : int
+            The oldest index in the frontier.
+        """
+        if self.size == 0:
+            raise IndexError("get from an empty frontier")
+
+        item: int = self.buffer[self.head]
+        self.head += 1
+        if self.head == self.capacity:
+            self.head = 0
+        self.size -= 1
+        return item
@@ -10,9 +10,12 @@ I would normally recommend in production code.
 """
 
 import random
+from array import array
+from typing import Union
 
+from graph_algorithms_the_fun_way.frontier import DequeFrontier
 from graph_algorithms_the_fun_way.graph import Edge, Graph
-from graph_algorithms_the_fun_way.union_find import UnionFind
+from graph_algorithms_the_fun_way.union_find import ArrayUnionFind
 
 
 def make_grid_graph(width: int, height: int) -> Graph:
@@ -79,6 +82,353 @@ def make_grid_with_obstacles(width: int, height: int, obstacles: set) -> Graph:
     return g
 
 
+class ImplicitGridNode:
+    """A lightweight view of a single node in an ImplicitGridGraph. The
+    node's edges are computed from its index when requested.
+
+    Attributes
+    ----------
+    g : ImplicitGridGraph
+        The graph containing the node.
+    index : int
+        The node's unique numerical index.
+    label : None
+        Implicit grid nodes do not have labels.
+    """
+
+    def __init__(self, g, index: int):
+        self.g = g
+        self.index: int = index
+        self.label = None
+
+    @property
+    def edges(self) -> dict:
+        """A dictionary mapping each neighbor's index to the corresponding Edge object."""
+        edges: dict = {}
+        for neighbor in self.g.get_neighbor_indices(self.index):
+            edges[neighbor] = Edge(self.index, neighbor, 1.0)
+        return edges
+
+    def num_edges(self) -> int:
+        """Returns the number of edges."""
+        return len(self.g.get_neighbor_indices(self.index))
+
+    def out_degree(self) -> int:
+        """Returns the out-degree of the node."""
+        return len(self.g.get_neighbor_indices(self.index))
+
+    def get_edge(self, neighbor: int) -> Union[Edge, None]:
+        """Returns an edge or None if no such edge exists.
+
+        Parameters
+        ----------
+        neighbor : int
+            The index of the destination node.
+
+        Returns
+        -------
+        edge : Edge or None
+            The Edge object linking the current node and the neighbor or
+            None if no such edge exists.
+        """
+        if neighbor in self.g.get_neighbor_indices(self.index):
+            return Edge(self.index, neighbor, 1.0)
+        return None
+
+    def get_edge_list(self) -> list:
+        """Returns a list of all the edges out of the node."""
+        return [Edge(self.index, neighbor, 1.0) for neighbor in self.g.get_neighbor_indices(self.index)]
+
+    def get_sorted_edge_list(self) -> list:
+        """Returns a list of all the edges out of the node sorted by
+        neighbor index (the order they are computed in)."""
+        return self.get_edge_list()
+
+    def get_neighbors(self) -> set:
+        """Return a set of the indices to all neighbors of the node.
+
+        Returns
+        -------
+        neighbors : set
+            The indices to all neighbors.
+        """
+        return set(self.g.get_neighbor_indices(self.index))
+
+    def get_out_neighbors(self) -> set:
+        """Return a set of the indices to all neighbors of the node. Since the
+        graph is undirected, these are the same as get_neighbors().
+
+        Returns
+        -------
+        neighbors : set
+            The indices to all neighbors.
+        """
+        return set(self.g.get_neighbor_indices(self.index))
+
+
+class ImplicitGridNodes:
+    """A read-only list-like view of the nodes in an ImplicitGridGraph
+    that creates each ImplicitGridNode when it is accessed.
+
+    Attributes
+    ----------
+    g : ImplicitGridGraph
+        The graph containing the nodes.
+    """
+
+    def __init__(self, g):
+        self.g = g
+
+    def __len__(self) -> int:
+        return self.g.num_nodes
+
+    def __getitem__(self, index: int) -> ImplicitGridNode:
+        if index < 0:
+            index += self.g.num_nodes
+        if index < 0 or index >= self.g.num_nodes:
+            raise IndexError
+        return ImplicitGridNode(self.g, index)
+
+    def __iter__(self):
+        for index in range(self.g.num_nodes):
+            yield ImplicitGridNode(self.g, index)
+
+
+class ImplicitGridGraph:
+    """An undirected graph representing a rectangular grid with obstacles
+    that computes each node's neighbors from its index instead of storing
+    Node and Edge objects. The only per-node state is one bit marking
+    whether the cell is blocked, so it can represent grids far too large for
+    make_grid_graph() or make_grid_with_obstacles().
+
+    The nodes are indexed (and their edges are listed) in the same order as
+    make_grid_with_obstacles(), so searches return the same results on both.
+    Blocked cells are nodes without any edges.
+
+    Attributes
+    ----------
+    width : int
+        The width of the grid.
+    height : int
+        The height of the grid.
+    num_nodes : int
+        The total number of nodes in the graph.
+    undirected : bool
+        Always True.
+    bits : bytearray
+        A packed bitmap where bit (index % 8) of byte (index // 8) is set
+        if the cell with that index is blocked.
+    nodes : ImplicitGridNodes
+        A list-like view of the graph's nodes.
+
+    Parameters
+    ----------
+    width : int
+        The width of the grid.
+    height : int
+        The height of the grid.
+    obstacles : set, optional
+        A set of (r, c) tuples indicating the location of obstacles.
+    """
+
+    def __init__(self, width: int, height: int, obstacles: set = None):
+        self.width: int = width
+        self.height: int = height
+        self.num_nodes: int = width * height
+        self.undirected: bool = True
+        self.bits: bytearray = bytearray((self.num_nodes + 7) // 8)
+        self.nodes: ImplicitGridNodes = ImplicitGridNodes(self)
+
+        if obstacles is not None:
+            for r, c in obstacles:
+                self.set_blocked(r, c, True)
+
+    def set_blocked(self, r: int, c: int, blocked: bool = True):
+        """Mark a cell as blocked or open.
+
+        Parameters
+        ----------
+        r : int
+            The cell's row.
+        c : int
+            The cell's column.
+        blocked : bool
+            Whether the cell is blocked.
+        """
+        if r < 0 or r >= self.height or c < 0 or c >= self.width:
+            raise IndexError
+        index: int = r * self.width + c
+        if blocked:
+            self.bits[index >> 3] |= 1 << (index & 7)
+        else:
+            self.bits[index >> 3] &= ~(1 << (index & 7))
+
+    def is_blocked(self, index: int) -> bool:
+        """Check whether the cell with a given index is blocked.
+
+        Parameters
+        ----------
+        index : int
+            The index of the cell.
+
+        Returns
+        -------
+        bool
+            True if the cell is blocked and False otherwise.
+        """
+        return (self.bits[index >> 3] >> (index & 7)) & 1 == 1
+
+    def get_neighbor_indices(self, index: int) -> list:
+        """Compute the indices of a node's neighbors in the order
+        above, left, right, below.
+
+        Parameters
+        ----------
+        index : int
+            The index of the node.
+
+        Returns
+        -------
+        neighbors : list of int
+            The indices of the open neighboring cells (empty if the cell is blocked).
+        """
+        if index < 0 or index >= self.num_nodes:
+            raise IndexError
+        if self.is_blocked(index):
+            return []
+
+        width: int = self.width
+        c: int = index % width
+        neighbors: list = []
+        if index >= width and not self.is_blocked(index - width):
+            neighbors.append(index - width)
+        if c > 0 and not self.is_blocked(index - 1):
+            neighbors.append(index - 1)
+        if c < width - 1 and not self.is_blocked(index + 1):
+            neighbors.append(index + 1)
+        if index + width < self.num_nodes and not self.is_blocked(index + width):
+            neighbors.append(index + width)
+        return neighbors
+
+    def get_edge(self, from_node: int, to_node: int) -> Union[Edge, None]:
+        """Lookup an edge in the graph.
+
+        Parameters
+        ----------
+        from_node : int
+            The node index of the edge's origin.
+        to_node : int
+            The node index to the edge's destination.
+
+        Returns
+        -------
+        edge : Edge or None
+            The corresponding Edge object if an edge exists or None
+            if no such edge exists.
+        """
+        if from_node < 0 or from_node >= self.num_nodes:
+            raise IndexError
+        if to_node < 0 or to_node >= self.num_nodes:
+            raise IndexError
+        if self.is_blocked(from_node) or self.is_blocked(to_node):
+            return None
+
+        diff: int = abs(from_node - to_node)
+        if diff == self.width or (diff == 1 and from_node // self.width == to_node // self.width):
+            return Edge(from_node, to_node, 1.0)
+        return None
+
+    def is_edge(self, from_node: int, to_node: int) -> bool:
+        """Check if an edge is in the graph.
+
+        Parameters
+        ----------
+        from_node : int
+            The node index of the edge's origin.
+        to_node : int
+            The node index to the edge's destination.
+
+        Returns
+        -------
+        result : bool
+            True if the graph contains an edge from from_node to to_node
+            and False otherwise.
+        """
+        return self.get_edge(from_node, to_node) is not None
+
+    def make_edge_list(self) -> list:
+        """Return a list containing all edges in the graph.
+
+        Returns
+        -------
+        all_edges : list
+            A list of Edge objects containing all edges in the graph.
+        """
+        all_edges: list = []
+        for node in self.nodes:
+            all_edges.extend(node.get_edge_list())
+        return all_edges
+
+
+def _get_neighbor_list(g, index: int) -> list:
+    """Return a list of a node's neighbors, computing them directly for
+    implicit grids to avoid creating Edge objects.
+
+    Parameters
+    ----------
+    g : Graph or ImplicitGridGraph
+        The input graph.
+    index : int
+        The index of the node.
+
+    Returns
+    -------
+    neighbors : list of int
+        The indices of the node's neighbors.
+    """
+    if isinstance(g, ImplicitGridGraph):
+        return g.get_neighbor_indices(index)
+    return [edge.to_node for edge in g.nodes[index].get_edge_list()]
+
+
+def randomized_kruskals_stream(g):
+    """Generate a grid-based maze with randomized Kruskal's algorithm,
+    yielding the maze's edges one at a time.
+
+    The graph's edges are stored as a compact array of integer codes and
+    shuffled once, so the generator runs in (nearly) linear time and only
+    keeps O(1) words of state per edge. If the graph is not connected the
+    edges form a spanning tree of each connected component.
+
+    Parameters
+    ----------
+    g : Graph or ImplicitGridGraph
+        The input grid-based graph.
+
+    Yields
+    ------
+    edge : Edge
+        The next edge in the maze.
+    """
+    num_nodes: int = g.num_nodes
+    codes: array = array("q")
+    for index in range(num_nodes):
+        for neighbor in _get_neighbor_list(g, index):
+            if neighbor > index:
+                codes.append(index * num_nodes + neighbor)
+    random.shuffle(codes)
+
+    djs: ArrayUnionFind = ArrayUnionFind(num_nodes)
+    for code in codes:
+        if djs.num_disjoint_sets == 1:
+            break
+
+        from_node: int = code // num_nodes
+        to_node: int = code % num_nodes
+        if djs.union_sets(from_node, to_node):
+            yield g.get_edge(from_node, to_node)
+
+
 def randomized_kruskals(g: Graph) -> list:
     """Create a graph representing a grid-based maze.
 
@@ -92,22 +442,99 @@ def randomized_kruskals(g: Graph) -> list:
     maze_edges : list of Edge
         The edges in the maze.
     """
-    djs: UnionFind = UnionFind(g.num_nodes)
-    all_edges: list = []
-    maze_edges: list = []
+    return list(randomized_kruskals_stream(g))
+
+
+def wilsons_maze(g):
+    """Generate a grid-based maze with Wilson's algorithm, yielding the maze's
+    edges one at a time. Unlike randomized Kruskal's algorithm, Wilson's
+    algorithm picks uniformly at random from all spanning trees.
+
+    Each node that is not yet in the maze starts a random walk that continues
+    until it reaches the maze. The walk's path (with any loops erased) is
+    then added to the maze. If the graph is not connected the edges form a
+    spanning tree of each connected component.
+
+    Parameters
+    ----------
+    g : Graph or ImplicitGridGraph
+        The input grid-based graph.
 
-    for idx in range(g.num_nodes):
-        for edge in g.nodes[idx].get_edge_list():
-            if edge.to_node > edge.from_node:
-                all_edges.append(edge)
+    Yields
+    ------
+    edge : Edge
+        The next edge in the maze.
+    """
+    num_nodes: int = g.num_nodes
+    in_tree: bytearray = bytearray(num_nodes)
+    next_node: array = array("q", [-1]) * num_nodes
+
+    # Start the maze with the first node of each connected component, so
+    # every random walk has something to reach.
+    seen: bytearray = bytearray(num_nodes)
+    pending: DequeFrontier = DequeFrontier()
+    for root in range(num_nodes):
+        if seen[root]:
+            continue
+        in_tree[root] = 1
+        seen[root] = 1
+        pending.put(root)
+        while not pending.empty():
+            index: int = pending.get()
+            for neighbor in _get_neighbor_list(g, index):
+                if not seen[neighbor]:
+                    seen[neighbor] = 1
+                    pending.put(neighbor)
+
+    for start in range(num_nodes):
+        # Walk until reaching the maze. Overwriting next_node on each visit
+        # erases any loops in the walk.
+        current: int = start
+        while not in_tree[current]:
+            next_node[current] = random.choice(_get_neighbor_list(g, current))
+            current = next_node[current]
+
+        current = start
+        while not in_tree[current]:
+            in_tree[current] = 1
+            yield g.get_edge(current, next_node[current])
+            current = next_node[current]
+
+
+def recursive_backtracker_maze(g):
+    """Generate a grid-based maze with the recursive backtracker algorithm
+    (a randomized depth-first search), yielding the maze's edges one at a time.
+    The search uses an explicit stack, so it can handle very large grids.
+    If the graph is not connected the edges form a spanning tree of each
+    connected component.
+
+    Parameters
+    ----------
+    g : Graph or ImplicitGridGraph
+        The input grid-based graph.
+
+    Yields
+    ------
+    edge : Edge
+        The next edge in the maze.
+    """
+    num_nodes: int = g.num_nodes
+    visited: bytearray = bytearray(num_nodes)
 
-    while djs.num_disjoint_sets > 1:
-        num_edges: int = len(all_edges)
-        edge_ind: int = random.randint(0, num_edges - 1)
-        new_edge: Edge = all_edges.pop(edge_ind)
+    for start in range(num_nodes):
+        if visited[start]:
+            continue
+        visited[start] = 1
+        stack: array = array("q", [start])
 
-        if djs.are_disjoint(new_edge.to_node, new_edge.from_node):
-            maze_edges.append(new_edge)
-            djs.union_sets(new_edge.to_node, new_edge.from_node)
+        while stack:
+            current: int = stack[-1]
+            options: list = [x for x in _get_neighbor_list(g, current) if not visited[x]]
+            if not options:
+                stack.pop()
+                continue
 
-    return maze_edges
+            neighbor: int = random.choice(options)
+            visited[neighbor] = 1
+            stack.append(neighbor)
+            yield g.get_edge(current, neighbor)
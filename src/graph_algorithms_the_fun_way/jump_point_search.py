@@ -0,0 +1,393 @@
+"""Jump Point Search (JPS) for shortest paths on 4-connected grids with
+unit-cost moves and obstacles.
+
+A* search on an open grid expands almost every cell along the many
+equally short (symmetric) routes to the goal. Jump Point Search avoids
+this by scanning in straight lines from each expanded cell and only adding
+the "jump points" where a path may need to turn to the priority queue.
+The search works directly on the grid's geometry, so it never builds a
+Graph. Grid cells use the same indexing as grid_graphs.make_grid_with_obstacles:
+the cell in row r and column c has index r * width + c.
+
+The jump rules are those for grids without diagonal moves used by the
+PathFinding.js library. Since a scan can stop for reasons that do not depend
+on the goal, the JumpPointGrid precomputes the first such stopping point in
+each direction from every cell (as in JPS+), which makes each scan constant
+time. Build one JumpPointGrid and reuse it when running many searches on
+the same grid.
+"""
+
+from array import array
+
+from graph_algorithms_the_fun_way.priorityqueue import PriorityQueue
+
+
+class JumpPointGrid:
+    """A 4-connected grid with obstacles and the precomputed jump tables.
+
+    Attributes
+    ----------
+    width : int
+        The width of the grid.
+    height : int
+        The height of the grid.
+    blocked : bytearray
+        Maps each cell's index to 1 if it is blocked and 0 otherwise.
+    row_run : array of int
+        Maps each open cell to the index of the last open cell to its right
+        before a wall, which identifies its horizontal run of open cells.
+    col_run : array of int
+        Maps each open cell to the index of the last open cell below it
+        before a wall, which identifies its vertical run of open cells.
+    jumps : dict
+        Maps each direction (dr, dc) to an array giving, for each cell, the
+        index of the first cell (at or after it in that direction and within
+        its run) where a scan in that direction must stop regardless of the
+        goal. The entry is -1 if there is no such cell or the cell is blocked.
+
+    Parameters
+    ----------
+    width : int
+        The width of the grid.
+    height : int
+        The height of the grid.
+    obstacles : set
+        A set of (r, c) tuples indicating the location of obstacles.
+    """
+
+    def __init__(self, width: int, height: int, obstacles: set):
+        self.width: int = width
+        self.height: int = height
+        num_cells: int = width * height
+
+        self.blocked: bytearray = bytearray(num_cells)
+        for r, c in obstacles:
+            if 0 <= r < height and 0 <= c < width:
+                self.blocked[r * width + c] = 1
+
+        self.row_run: array = array("q", [-1]) * num_cells
+        self.col_run: array = array("q", [-1]) * num_cells
+        self.jumps: dict = {}
+        for direction in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
+            self.jumps[direction] = array("q", [-1]) * num_cells
+
+        # The horizontal tables must be built first since they determine the
+        # vertical jump points.
+        self._build_horizontal()
+        self._build_vertical()
+
+    def _is_forced(self, index: int, dr: int, dc: int) -> bool:
+        """Check whether a scan moving in direction (dr, dc) must stop at an
+        open cell because one of the cells beside it is a forced neighbor (it
+        is open, but the cell beside the previous cell is blocked).
+
+        Parameters
+        ----------
+        index : int
+            The index of the cell.
+        dr : int
+            The row direction of the scan.
+        dc : int
+            The column direction of the scan.
+
+        Returns
+        -------
+        bool
+            True if the scan must stop.
+        """
+        width: int = self.width
+        r: int = index // width
+        c: int = index % width
+        prev_r: int = r - dr
+        prev_c: int = c - dc
+        if prev_r < 0 or prev_r >= self.height or prev_c < 0 or prev_c >= width:
+            return False
+        prev: int = index - dr * width - dc
+
+        if dr == 0:
+            if r > 0 and not self.blocked[index - width] and self.blocked[prev - width]:
+                return True
+            if r < self.height - 1 and not self.blocked[index + width] and self.blocked[prev + width]:
+                return True
+        else:
+            if c > 0 and not self.blocked[index - 1] and self.blocked[prev - 1]:
+                return True
+            if c < width - 1 and not self.blocked[index + 1] and self.blocked[prev + 1]:
+                return True
+        return False
+
+    def _build_horizontal(self):
+        """Fill in the row runs and the horizontal jump tables."""
+        width: int = self.width
+        right: array = self.jumps[(0, 1)]
+        left: array = self.jumps[(0, -1)]
+
+        for r in range(self.height):
+            row_start: int = r * width
+            run_end: int = -1
+            next_jump: int = -1
+            for index in range(row_start + width - 1, row_start - 1, -1):
+                if self.blocked[index]:
+                    run_end = -1
+                    next_jump = -1
+                    continue
+                if run_end == -1:
+                    run_end = index
+                if self._is_forced(index, 0, 1):
+                    next_jump = index
+                self.row_run[index] = run_end
+                right[index] = next_jump
+
+            next_jump = -1
+            for index in range(row_start, row_start + width):
+                if self.blocked[index]:
+                    next_jump = -1
+                    continue
+                if self._is_forced(index, 0, -1):
+                    next_jump = index
+                left[index] = next_jump
+
+    def _is_vertical_stop(self, index: int, dr: int) -> bool:
+        """Check whether a vertical scan must stop at an open cell regardless
+        of the goal, either because of a forced neighbor or because a
+        horizontal scan from the cell would stop.
+
+        Parameters
+        ----------
+        index : int
+            The index of the cell.
+        dr : int
+            The row direction of the scan.
+
+        Returns
+        -------
+        bool
+            True if the scan must stop.
+        """
+        if self._is_forced(index, dr, 0):
+            return True
+        c: int = index % self.width
+        if c < self.width - 1 and self.jumps[(0, 1)][index + 1] != -1:
+            return True
+        return c > 0 and self.jumps[(0, -1)][index - 1] != -1
+
+    def _build_vertical(self):
+        """Fill in the column runs and the vertical jump tables."""
+        width: int = self.width
+        down: array = self.jumps[(1, 0)]
+        up: array = self.jumps[(-1, 0)]
+
+        for c in range(width):
+            run_end: int = -1
+            next_jump: int = -1
+            for r in range(self.height - 1, -1, -1):
+                index: int = r * width + c
+                if self.blocked[index]:
+                    run_end = -1
+                    next_jump = -1
+                    continue
+                if run_end == -1:
+                    run_end = index
+                if self._is_vertical_stop(index, 1):
+                    next_jump = index
+                self.col_run[index] = run_end
+                down[index] = next_jump
+
+            next_jump = -1
+            for r in range(self.height):
+                index = r * width + c
+                if self.blocked[index]:
+                    next_jump = -1
+                    continue
+                if self._is_vertical_stop(index, -1):
+                    next_jump = index
+                up[index] = next_jump
+
+    def is_open(self, r: int, c: int) -> bool:
+        """Check whether a cell is inside the grid and not blocked.
+
+        Parameters
+        ----------
+        r : int
+            The cell's row.
+        c : int
+            The cell's column.
+
+        Returns
+        -------
+        bool
+            True if the cell is open and False otherwise.
+        """
+        return 0 <= r < self.height and 0 <= c < self.width and not self.blocked[r * self.width + c]
+
+    def jump(self, index: int, dr: int, dc: int, goal: int) -> int:
+        """Scan from a cell in one direction for the next jump point.
+
+        Parameters
+        ----------
+        index : int
+            The index of the first cell of the scan.
+        dr : int
+            The row direction of the scan.
+        dc : int
+            The column direction of the scan.
+        goal : int
+            The index of the goal cell.
+
+        Returns
+        -------
+        int
+            The index of the jump point or -1 if the scan reached a wall.
+        """
+        if self.blocked[index]:
+            return -1
+        next_jump: int = self.jumps[(dr, dc)][index]
+
+        # The scan also stops at the goal or, for a vertical scan, at the
+        # cell in the goal's row if the goal is in the same horizontal run.
+        if dr == 0:
+            stop: int = goal
+            step: int = dc
+            if self.row_run[stop] != self.row_run[index]:
+                return next_jump
+        else:
+            stop = (goal // self.width) * self.width + index % self.width
+            step = dr * self.width
+            if self.blocked[stop] or self.col_run[stop] != self.col_run[index]:
+                return next_jump
+            if self.row_run[stop] != self.row_run[goal]:
+                return next_jump
+
+        if (stop - index) * step >= 0 and (next_jump == -1 or (next_jump - stop) * step >= 0):
+            return stop
+        return next_jump
+
+    def pruned_directions(self, index: int, parent: int) -> list:
+        """Find the directions in which to scan from a jump point.
+
+        Parameters
+        ----------
+        index : int
+            The index of the current jump point.
+        parent : int
+            The index of the previous jump point on the path (-1 for the start).
+
+        Returns
+        -------
+        directions : list of tuple
+            The (dr, dc) direction of each open neighbor to scan toward.
+        """
+        width: int = self.width
+        r: int = index // width
+        c: int = index % width
+
+        if parent == -1:
+            candidates: list = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+        elif parent // width == r:
+            dc: int = 1 if c > parent % width else -1
+            candidates = [(-1, 0), (1, 0), (0, dc)]
+        else:
+            dr: int = 1 if r > parent // width else -1
+            candidates = [(0, -1), (0, 1), (dr, 0)]
+
+        directions: list = []
+        for dr, dc in candidates:
+            if self.is_open(r + dr, c + dc):
+                directions.append((dr, dc))
+        return directions
+
+    def find_path(self, start: int, goal: int) -> list:
+        """Find a shortest path between two cells using Jump Point Search.
+
+        Parameters
+        ----------
+        start : int
+            The index of the starting cell.
+        goal : int
+            The index of the goal cell.
+
+        Returns
+        -------
+        path : list of int
+            The indices of every cell on the path from start to goal
+            (inclusive). An empty list if there is no path.
+        """
+        width: int = self.width
+        num_cells: int = width * self.height
+        if start < 0 or start >= num_cells or goal < 0 or goal >= num_cells:
+            raise IndexError
+        if self.blocked[start] or self.blocked[goal]:
+            return []
+
+        goal_r: int = goal // width
+        goal_c: int = goal % width
+
+        last: dict = {start: -1}
+        cost: dict = {start: 0}
+        closed: set = set()
+        pq: PriorityQueue = PriorityQueue(min_heap=True)
+        pq.enqueue(start, abs(start // width - goal_r) + abs(start % width - goal_c))
+
+        while not pq.is_empty():
+            index: int = pq.dequeue()
+            if index == goal:
+                break
+            closed.add(index)
+
+            r: int = index // width
+            c: int = index % width
+            for dr, dc in self.pruned_directions(index, last[index]):
+                jump: int = self.jump(index + dr * width + dc, dr, dc, goal)
+                if jump == -1 or jump in closed:
+                    continue
+
+                jump_r: int = jump // width
+                jump_c: int = jump % width
+                new_cost: int = cost[index] + abs(jump_r - r) + abs(jump_c - c)
+                if jump not in cost or new_cost < cost[jump]:
+                    cost[jump] = new_cost
+                    last[jump] = index
+                    pq.enqueue(jump, new_cost + abs(jump_r - goal_r) + abs(jump_c - goal_c))
+
+        if goal not in last:
+            return []
+
+        # Fill in the cells between consecutive jump points.
+        reverse_path: list = [goal]
+        current: int = goal
+        while last[current] != -1:
+            prev: int = last[current]
+            step: int = 1 if prev // width == current // width else width
+            if prev > current:
+                step = -step
+            while current != prev:
+                current -= step
+                reverse_path.append(current)
+        return list(reversed(reverse_path))
+
+
+def jump_point_search(width: int, height: int, obstacles: set, start: int, goal: int) -> list:
+    """Find a shortest path between two cells of a 4-connected grid using
+    Jump Point Search.
+
+    Parameters
+    ----------
+    width : int
+        The width of the grid.
+    height : int
+        The height of the grid.
+    obstacles : set
+        A set of (r, c) tuples indicating the location of obstacles.
+    start : int
+        The index of the starting cell.
+    goal : int
+        The index of the goal cell.
+
+    Returns
+    -------
+    path : list of int
+        The indices of every cell on the path from start to goal (inclusive).
+        An empty list if there is no path.
+    """
+    grid: JumpPointGrid = JumpPointGrid(width, height, obstacles)
+    return grid.find_path(start, goal)
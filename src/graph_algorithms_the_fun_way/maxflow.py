@@ -8,10 +8,10 @@ fully optimized and does not include all the validity checks that
 I would normally recommend in production code.
 """
 
+from graph_algorithms_the_fun_way.frontier import DequeFrontier
 from graph_algorithms_the_fun_way.graph import Graph, Node
 
 import math
-import queue
 from typing import Union
 
 
@@ -259,6 +259,41 @@ def augmenting_path_dfs_recursive(g: ResidualGraph, current: int, seen: list, la
             augmenting_path_dfs_recursive(g, n, seen, last)
 
 
+def augmenting_path_dfs_iterative(g: ResidualGraph, current: int, seen: list, last: list):
+    """An iterative version of augmenting_path_dfs_recursive() that uses an
+    explicit stack instead of recursion. It produces the same list of previous nodes.
+
+    Parameters
+    ----------
+    g : ResidualGraph
+        The input graph.
+    current : int
+        The index of the starting node.
+    seen : list of bool
+        Whether each node in the graph has been marked seen.
+    last : list of int
+        Maps the index of each node in the graph to the index of the node
+        before it on the path.
+    """
+    seen[current] = True
+    to_explore: list = [(current, iter(g.all_neighbors[current]))]
+
+    while to_explore:
+        current, neighbors = to_explore[-1]
+        for n in neighbors:
+            if not seen[n] and g.get_residual(current, n) > 0:
+                last[n] = current
+                if last[g.sink_index] != -1:
+                    # Return from the current node as the recursive version does.
+                    to_explore.pop()
+                else:
+                    seen[n] = True
+                    to_explore.append((n, iter(g.all_neighbors[n])))
+                break
+        else:
+            to_explore.pop()
+
+
 def find_augmenting_path_dfs(g: ResidualGraph) -> list:
     """The outer wrapper function to find an augmenting path using depth-first search.
 
@@ -275,7 +310,7 @@ def find_augmenting_path_dfs(g: ResidualGraph) -> list:
     """
     seen: list = [False] * g.num_nodes
     last: list = [-1] * g.num_nodes
-    augmenting_path_dfs_recursive(g, g.source_index, seen, last)
+    augmenting_path_dfs_iterative(g, g.source_index, seen, last)
     return last
 
 
@@ -295,7 +330,7 @@ def find_augmenting_path_bfs(g: ResidualGraph) -> list:
     """
     seen: list = [False] * g.num_nodes
     last: list = [-1] * g.num_nodes
-    pending: queue.Queue = queue.Queue()
+    pending: DequeFrontier = DequeFrontier()
 
     seen[g.source_index] = True
     pending.put(g.source_index)
@@ -10,7 +10,7 @@ I would normally recommend in production code.
 
 from typing import Union
 
-from graph_algorithms_the_fun_way.union_find import UnionFind
+from graph_algorithms_the_fun_way.union_find import ArrayUnionFind, UnionFind
 from graph_algorithms_the_fun_way.graph import Graph, Node
 from graph_algorithms_the_fun_way.priorityqueue import PriorityQueue
 
@@ -119,7 +119,7 @@ def kruskals(g: Graph) -> Union[list, None]:
         The list of edges in the minimum spanning tree or None if no
         such tree exists.
     """
-    djs: UnionFind = UnionFind(g.num_nodes)
+    djs: ArrayUnionFind = ArrayUnionFind(g.num_nodes)
     all_edges: list = []
     mst_edges: list = []
 
@@ -320,6 +320,28 @@ class PriorityQueue:
             else:
                 self._propagate_up(index)
 
+    def remove(self, value):
+        """Remove an item from the priority queue. Does nothing if the
+        value is not in the priority queue.
+
+        Parameters
+        ----------
+        value : any
+            The value to remove.
+        """
+        if not value in self.indices:
+            return
+
+        index: int = self.indices[value]
+        self._swap_elements(index, self.last_index)
+        self.heap_array[self.last_index] = None
+        self.indices.pop(value)
+        self.last_index = self.last_index - 1
+
+        if index <= self.last_index:
+            self._propagate_up(index)
+            self._propagate_down(index)
+
     def peak_top(self) -> Union[HeapItem, None]:
         """Return the top HeapItem on the queue without modifying the queue.
 
@@ -358,6 +380,35 @@ class PriorityQueue:
             return None
         return obj.value
 
+    def peek_top_values(self, k: int) -> list:
+        """Return the values of the top k items in priority order without
+        modifying the queue.
+
+        Parameters
+        ----------
+        k : int
+            The number of values to return.
+
+        Returns
+        -------
+        values : list
+            The values of the top min(k, size) items in priority order.
+        """
+        values: list = []
+        candidates: list = [1] if self.last_index > 0 else []
+        while candidates and len(values) < k:
+            best: int = 0
+            for i in range(1, len(candidates)):
+                if self._elements_inverted(candidates[best], candidates[i]):
+                    best = i
+            index: int = candidates.pop(best)
+            values.append(self.heap_array[index].value)
+
+            for child in [2 * index, 2 * index + 1]:
+                if child <= self.last_index:
+                    candidates.append(child)
+        return values
+
 
 def pq_sort(arr, reverse=False):
     """Sort values using a priority queue.
@@ -9,9 +9,9 @@ I would normally recommend in production code.
 """
 
 import math
-import queue
 from typing import Union
 
+from graph_algorithms_the_fun_way.frontier import DequeFrontier
 from graph_algorithms_the_fun_way.graph import Graph, Node
 from graph_algorithms_the_fun_way.search import breadth_first_search
 
@@ -169,7 +169,7 @@ def create_prisoners_and_guards() -> Graph:
         The graph representing the puzzle.
     """
     indices: dict = {}
-    next_node: queue.Queue = queue.Queue()
+    next_node: DequeFrontier = DequeFrontier()
     g: Graph = Graph(0, undirected=True)
 
     initial_state: PGState = PGState(3, 3, "L")
@@ -0,0 +1,370 @@
+"""A precomputed index for answering many "can u reach v" queries on a
+mostly static directed graph.
+
+The index first collapses each strongly connected component into a single
+node (using connected.tarjan_scc), since every node in a component reaches
+the same set of nodes. The rest of the index is built on the condensation,
+which is a directed acyclic graph whose components are numbered in
+topological order.
+
+Each component is given interval labels from several randomized depth-first
+searches of the condensation (the GRAIL labeling). A component's interval
+contains the intervals of every component it can reach, so a missing
+containment proves that there is no path. The first search's spanning tree
+also provides a positive certificate: if v is a tree descendant of u then u
+reaches v. A query only falls back to a depth-first search of the
+condensation when neither test is conclusive, and that search is pruned using
+the same labels.
+"""
+
+import json
+import random
+from array import array
+
+from graph_algorithms_the_fun_way.connected import tarjan_scc
+from graph_algorithms_the_fun_way.graph import Graph
+
+
+class ReachabilityIndex:
+    """An index for answering reachability queries on a directed graph.
+
+    Attributes
+    ----------
+    component : array of int
+        Maps each node's index to the index of its strongly connected
+        component. Components are numbered in a topological order of the
+        condensation.
+    children : list of list of int
+        The out-neighbors of each component in the condensation.
+    members : list of list of int
+        The nodes in each component.
+    post : list of array of int
+        For each labeling, maps each component to its post-order rank.
+    low : list of array of int
+        For each labeling, maps each component to the smallest post-order rank
+        of any component it can reach (including itself).
+    tree_low : array of int
+        Maps each component to the smallest post-order rank of any of its
+        descendants in the first labeling's DFS tree.
+    num_queries : int
+        The number of can_reach() queries answered.
+    num_fallbacks : int
+        The number of can_reach() queries that needed a search.
+
+    Parameters
+    ----------
+    component : array of int
+        The component of each node.
+    children : list of list of int
+        The out-neighbors of each component in the condensation.
+    post : list of array of int
+        The post-order ranks for each labeling.
+    low : list of array of int
+        The lowest reachable post-order ranks for each labeling.
+    tree_low : array of int
+        The lowest post-order ranks in each component's DFS subtree for the
+        first labeling.
+    """
+
+    def __init__(self, component: array, children: list, post: list, low: list, tree_low: array):
+        if len(post) == 0 or len(post) != len(low):
+            raise ValueError("The index needs at least one labeling.")
+        self.component: array = component
+        self.children: list = children
+        self.post: list = post
+        self.low: list = low
+        self.tree_low: array = tree_low
+        self.num_queries: int = 0
+        self.num_fallbacks: int = 0
+
+        self.members: list = [[] for _ in range(len(children))]
+        for index in range(len(component)):
+            self.members[component[index]].append(index)
+
+    @property
+    def num_nodes(self) -> int:
+        """The number of nodes in the indexed graph."""
+        return len(self.component)
+
+    @property
+    def num_components(self) -> int:
+        """The number of strongly connected components in the indexed graph."""
+        return len(self.children)
+
+    def _check_node(self, index: int):
+        """Raise an IndexError if a node index is out of range."""
+        if index < 0 or index >= len(self.component):
+            raise IndexError
+
+    def _tree_contains(self, c1: int, c2: int) -> bool:
+        """Check whether c2 is a descendant of c1 in the first labeling's DFS
+        tree, which proves that c1 reaches c2."""
+        return self.tree_low[c1] <= self.post[0][c2] <= self.post[0][c1]
+
+    def _may_reach(self, c1: int, c2: int) -> bool:
+        """Check whether every labeling's interval for c1 contains the
+        interval for c2. If not, c1 cannot reach c2."""
+        return all(low[c1] <= low[c2] and post[c2] <= post[c1] for post, low in zip(self.post, self.low))
+
+    def can_reach_component(self, c1: int, c2: int) -> bool:
+        """Check whether component c1 can reach component c2.
+
+        Parameters
+        ----------
+        c1 : int
+            The index of the source component.
+        c2 : int
+            The index of the target component.
+
+        Returns
+        -------
+        bool
+            True if there is a path from c1 to c2.
+        """
+        if c1 == c2:
+            return True
+        if c1 > c2 or not self._may_reach(c1, c2):
+            return False
+        if self._tree_contains(c1, c2):
+            return True
+
+        # Fall back to a depth-first search that only enters components
+        # whose labels allow them to reach c2.
+        self.num_fallbacks += 1
+        seen: set = set([c1])
+        to_explore: list = [c1]
+        while to_explore:
+            current: int = to_explore.pop()
+            for other in self.children[current]:
+                if other == c2 or (other < c2 and self._tree_contains(other, c2)):
+                    return True
+                if other not in seen and other < c2 and self._may_reach(other, c2):
+                    seen.add(other)
+                    to_explore.append(other)
+        return False
+
+    def can_reach(self, from_node: int, to_node: int) -> bool:
+        """Check whether there is a path from one node to another.
+
+        Parameters
+        ----------
+        from_node : int
+            The index of the source node.
+        to_node : int
+            The index of the target node.
+
+        Returns
+        -------
+        bool
+            True if to_node is reachable from from_node. Every node can
+            reach itself.
+        """
+        self._check_node(from_node)
+        self._check_node(to_node)
+        self.num_queries += 1
+        return self.can_reach_component(self.component[from_node], self.component[to_node])
+
+    def are_strongly_connected(self, inds: list) -> bool:
+        """Check whether every node in a list can reach every other node in it.
+
+        Parameters
+        ----------
+        inds : list of int
+            The indices of the nodes to check.
+
+        Returns
+        -------
+        bool
+            True if all the nodes are in the same strongly connected component.
+        """
+        for index in inds:
+            self._check_node(index)
+            if self.component[index] != self.component[inds[0]]:
+                return False
+        return True
+
+    def get_reachable(self, index: int) -> set:
+        """Retrieve the set of nodes that are reachable from a given node.
+
+        Parameters
+        ----------
+        index : int
+            The index of the query node.
+
+        Returns
+        -------
+        reachable : set of int
+            The set of nodes that are reachable from the given node.
+        """
+        self._check_node(index)
+        start: int = self.component[index]
+        seen: set = set([start])
+        to_explore: list = [start]
+        reachable: set = set()
+        while to_explore:
+            current: int = to_explore.pop()
+            reachable.update(self.members[current])
+            for other in self.children[current]:
+                if other not in seen:
+                    seen.add(other)
+                    to_explore.append(other)
+        return reachable
+
+
+def _label_condensation(children: list, roots: list, shuffle: random.Random = None) -> tuple:
+    """Assign the post-order ranks and interval labels for one depth-first
+    search of the condensation.
+
+    Parameters
+    ----------
+    children : list of list of int
+        The out-neighbors of each component.
+    roots : list of int
+        The components to start searches from, in order.
+    shuffle : random.Random, optional
+        If given, the order of each component's children is shuffled.
+
+    Returns
+    -------
+    post : array of int
+        Each component's post-order rank.
+    low : array of int
+        The smallest post-order rank reachable from each component.
+    tree_low : array of int
+        The smallest post-order rank in each component's DFS subtree.
+    """
+    num_components: int = len(children)
+    post: array = array("q", [-1]) * num_components
+    low: array = array("q", [0]) * num_components
+    tree_low: array = array("q", [0]) * num_components
+    next_rank: int = 0
+
+    def ordered_children(c: int):
+        if shuffle is None:
+            return iter(children[c])
+        shuffled: list = list(children[c])
+        shuffle.shuffle(shuffled)
+        return iter(shuffled)
+
+    for root in roots:
+        if post[root] != -1:
+            continue
+        post[root] = -2
+        tree_low[root] = num_components
+        to_explore: list = [(root, ordered_children(root))]
+
+        while to_explore:
+            current, others = to_explore[-1]
+            for other in others:
+                if post[other] == -1:
+                    post[other] = -2
+                    tree_low[other] = num_components
+                    to_explore.append((other, ordered_children(other)))
+                    break
+            else:
+                to_explore.pop()
+                post[current] = next_rank
+                tree_low[current] = min(tree_low[current], next_rank)
+                next_rank += 1
+
+                # The condensation is acyclic, so all of the current
+                # component's children are finished.
+                lowest: int = post[current]
+                for other in children[current]:
+                    if low[other] < lowest:
+                        lowest = low[other]
+                low[current] = lowest
+
+                if to_explore:
+                    parent: int = to_explore[-1][0]
+                    if tree_low[current] < tree_low[parent]:
+                        tree_low[parent] = tree_low[current]
+
+    return post, low, tree_low
+
+
+def make_reachability_index(g: Graph, num_labelings: int = 2, seed: int = None) -> ReachabilityIndex:
+    """Build a reachability index for a directed graph.
+
+    Parameters
+    ----------
+    g : Graph
+        The input graph.
+    num_labelings : int
+        The number of interval labelings to compute. More labelings rule out
+        more unreachable pairs without a search but use more memory.
+    seed : int, optional
+        The seed for the random search orders of the extra labelings.
+
+    Returns
+    -------
+    index : ReachabilityIndex
+        The reachability index.
+    """
+    if num_labelings < 1:
+        raise ValueError(f"num_labelings must be at least 1. Found {num_labelings}.")
+
+    _, component, condensation = tarjan_scc(g)
+    children: list = [list(node.edges) for node in condensation.nodes]
+
+    # The first labeling visits the components in topological order. The rest
+    # use random root and child orders so their intervals differ.
+    rng: random.Random = random.Random(seed)
+    roots: list = list(range(len(children)))
+    post0, low0, tree_low = _label_condensation(children, roots)
+    post: list = [post0]
+    low: list = [low0]
+    for _ in range(num_labelings - 1):
+        rng.shuffle(roots)
+        post_i, low_i, _ = _label_condensation(children, roots, rng)
+        post.append(post_i)
+        low.append(low_i)
+
+    return ReachabilityIndex(component, children, post, low, tree_low)
+
+
+def save_reachability_index(index: ReachabilityIndex, filename: str):
+    """Save a reachability index to a JSON file.
+
+    Parameters
+    ----------
+    index : ReachabilityIndex
+        The index to save.
+    filename : str
+        The name of the file to write.
+    """
+    data: dict = {
+        "component": list(index.component),
+        "children": index.children,
+        "post": [list(p) for p in index.post],
+        "low": [list(lw) for lw in index.low],
+        "tree_low": list(index.tree_low),
+    }
+    with open(filename, "w") as f:
+        json.dump(data, f)
+
+
+def load_reachability_index(filename: str) -> ReachabilityIndex:
+    """Load a reachability index from a JSON file written by
+    save_reachability_index().
+
+    Parameters
+    ----------
+    filename : str
+        The name of the file to read.
+
+    Returns
+    -------
+    index : ReachabilityIndex
+        The reachability index.
+    """
+    with open(filename) as f:
+        data: dict = json.load(f)
+
+    return ReachabilityIndex(
+        array("q", data["component"]),
+        data["children"],
+        [array("q", p) for p in data["post"]],
+        [array("q", lw) for lw in data["low"]],
+        array("q", data["tree_low"]),
+    )
@@ -11,9 +11,11 @@ I would normally recommend in production code.
 """
 
 import math
-import queue
+import time
 
-from graph_algorithms_the_fun_way.graph import Graph, Node
+from graph_algorithms_the_fun_way.csr_graph import CSRGraph, make_csr_graph
+from graph_algorithms_the_fun_way.frontier import DequeFrontier
+from graph_algorithms_the_fun_way.graph import Graph, Node, make_transpose_graph
 from graph_algorithms_the_fun_way.priorityqueue import PriorityQueue
 
 
@@ -35,7 +37,7 @@ def breadth_first_search(g: Graph, start: int) -> list:
     """
     seen: list = [False] * g.num_nodes
     last: list = [-1] * g.num_nodes
-    pending: queue.Queue = queue.Queue()
+    pending: DequeFrontier = DequeFrontier()
 
     pending.put(start)
     seen[start] = True
@@ -54,6 +56,252 @@ def breadth_first_search(g: Graph, start: int) -> list:
     return last
 
 
+def iter_bfs(g: Graph, start: int):
+    """A breadth-first search that yields each node as it is removed from the
+    frontier, so the caller can stop the search early or stream the results.
+
+    Parameters
+    ----------
+    g : Graph
+        The input graph.
+    start : int
+        The index of the starting node.
+
+    Yields
+    ------
+    index : int
+        The index of the current node.
+    parent : int
+        The index of the node before it on the path (-1 for the start).
+    depth : int
+        The number of hops from the start.
+    """
+    seen: set = {start}
+    pending: DequeFrontier = DequeFrontier()
+    pending.put((start, -1, 0))
+
+    while not pending.empty():
+        index, parent, depth = pending.get()
+        yield index, parent, depth
+
+        for edge in g.nodes[index].get_edge_list():
+            neighbor: int = edge.to_node
+            if neighbor not in seen:
+                seen.add(neighbor)
+                pending.put((neighbor, index, depth + 1))
+
+
+def multi_source_bfs_levels(g: Graph, sources: list):
+    """A multi-source breadth-first search (MS-BFS) that runs a search from each
+    of the sources at the same time. Each node tracks the searches that have reached
+    it as a bitmask (bit i corresponds to sources[i]), so each edge is scanned once
+    per level for the whole batch instead of once per source.
+
+    Parameters
+    ----------
+    g : Graph
+        The input graph.
+    sources : list of int
+        The indices of the starting nodes. For the bitmasks to fit in a
+        single machine word this should contain at most 64 nodes.
+
+    Yields
+    ------
+    level : int
+        The number of hops from the sources.
+    index : int
+        The index of the node reached.
+    mask : int
+        A bitmask of the sources that first reached the node at this level.
+    """
+    seen: list = [0] * g.num_nodes
+    frontier: dict = {}
+    for i, start in enumerate(sources):
+        seen[start] |= 1 << i
+        frontier[start] = frontier.get(start, 0) | (1 << i)
+
+    level: int = 0
+    while frontier:
+        for index, mask in frontier.items():
+            yield level, index, mask
+
+        next_frontier: dict = {}
+        for index, mask in frontier.items():
+            for edge in g.nodes[index].get_edge_list():
+                neighbor: int = edge.to_node
+                new_mask: int = mask & ~seen[neighbor]
+                if new_mask:
+                    next_frontier[neighbor] = next_frontier.get(neighbor, 0) | new_mask
+
+        for index, mask in next_frontier.items():
+            seen[index] |= mask
+        frontier = next_frontier
+        level += 1
+
+
+def multi_source_bfs(g: Graph, sources: list, batch_size: int = 64) -> list:
+    """Compute the hop distances from each of the sources to every node by
+    running batches of multi-source breadth-first searches.
+
+    Parameters
+    ----------
+    g : Graph
+        The input graph.
+    sources : list of int
+        The indices of the starting nodes.
+    batch_size : int
+        The number of sources to search at the same time.
+
+    Returns
+    -------
+    dist : list of list of int
+        dist[i][j] is the number of hops from sources[i] to node j or -1 if
+        node j is not reachable from sources[i].
+    """
+    dist: list = [[-1] * g.num_nodes for _ in sources]
+    for offset in range(0, len(sources), batch_size):
+        batch: list = sources[offset : offset + batch_size]
+        for level, index, mask in multi_source_bfs_levels(g, batch):
+            while mask:
+                bit: int = mask & -mask
+                dist[offset + bit.bit_length() - 1][index] = level
+                mask ^= bit
+    return dist
+
+
+def multi_source_hop_sums(g: Graph, sources: list = None, batch_size: int = 64) -> tuple:
+    """Compute the sum of hop distances from each source to all the nodes it can
+    reach, such as for closeness centrality, without storing the distances.
+
+    Parameters
+    ----------
+    g : Graph
+        The input graph.
+    sources : list of int, optional
+        The indices of the starting nodes. Uses all nodes if None.
+    batch_size : int
+        The number of sources to search at the same time.
+
+    Returns
+    -------
+    totals : list of int
+        totals[i] is the sum of the hop distances from sources[i] to each
+        node it can reach.
+    reached : list of int
+        reached[i] is the number of nodes reachable from sources[i]
+        (including itself).
+    """
+    if sources is None:
+        sources = list(range(g.num_nodes))
+
+    totals: list = [0] * len(sources)
+    reached: list = [0] * len(sources)
+    for offset in range(0, len(sources), batch_size):
+        batch: list = sources[offset : offset + batch_size]
+        for level, _, mask in multi_source_bfs_levels(g, batch):
+            while mask:
+                bit: int = mask & -mask
+                source_ind: int = offset + bit.bit_length() - 1
+                totals[source_ind] += level
+                reached[source_ind] += 1
+                mask ^= bit
+    return totals, reached
+
+
+def direction_optimizing_bfs(
+    g, start: int, alpha: float = 14.0, beta: float = 24.0, in_g: CSRGraph = None
+) -> list:
+    """A direction-optimizing breadth-first search. The search expands the frontier
+    top-down (from each frontier node to its unseen neighbors) while the frontier is
+    small and switches to bottom-up scans (each unseen node looks for a neighbor in the
+    frontier) when the frontier's edges exceed a fraction of the unexplored edges.
+    It switches back to top-down once the frontier shrinks.
+
+    Parameters
+    ----------
+    g : Graph or CSRGraph
+        The input graph. A Graph is converted to a CSRGraph before the search.
+    start : int
+        The index of the starting node.
+    alpha : float
+        Switch to bottom-up when the frontier's out-edges exceed 1/alpha of
+        the edges out of the unexplored nodes.
+    beta : float
+        Switch back to top-down when the frontier is shrinking and holds fewer
+        than 1/beta of the graph's nodes.
+    in_g : CSRGraph, optional
+        The transpose of g (from g.make_transpose()) used by the bottom-up
+        scans. When running many searches on the same directed graph, build
+        it once and pass it in. Otherwise it is built the first time the
+        search switches to bottom-up.
+
+    Returns
+    -------
+    last : list of int
+        Maps the index of each node in the graph to the index of the node
+        before it on the path.
+    """
+    if not isinstance(g, CSRGraph):
+        g = make_csr_graph(g)
+    if in_g is not None and in_g.num_nodes != g.num_nodes:
+        raise ValueError(f"Expected a transpose with {g.num_nodes} nodes. Found {in_g.num_nodes}.")
+
+    offsets = g.offsets
+    targets = g.targets
+
+    seen: bytearray = bytearray(g.num_nodes)
+    last: list = [-1] * g.num_nodes
+    frontier: list = [start]
+    seen[start] = 1
+    edges_unexplored: int = g.num_edges() - g.out_degree(start)
+    top_down: bool = True
+    last_size: int = 0
+
+    while frontier:
+        frontier_edges: int = 0
+        for index in frontier:
+            frontier_edges += offsets[index + 1] - offsets[index]
+        if top_down and frontier_edges > edges_unexplored / alpha:
+            top_down = False
+        elif not top_down and len(frontier) < last_size and len(frontier) < g.num_nodes / beta:
+            top_down = True
+        last_size = len(frontier)
+
+        next_frontier: list = []
+        if top_down:
+            for index in frontier:
+                for k in range(offsets[index], offsets[index + 1]):
+                    neighbor: int = targets[k]
+                    if not seen[neighbor]:
+                        seen[neighbor] = 1
+                        last[neighbor] = index
+                        next_frontier.append(neighbor)
+        else:
+            if in_g is None:
+                in_g = g.make_transpose()
+            in_offsets = in_g.offsets
+            in_targets = in_g.targets
+
+            in_frontier: bytearray = bytearray(g.num_nodes)
+            for index in frontier:
+                in_frontier[index] = 1
+            for index in range(g.num_nodes):
+                if not seen[index]:
+                    for k in range(in_offsets[index], in_offsets[index + 1]):
+                        if in_frontier[in_targets[k]]:
+                            last[index] = in_targets[k]
+                            next_frontier.append(index)
+                            break
+            for index in next_frontier:
+                seen[index] = 1
+
+        for index in next_frontier:
+            edges_unexplored -= offsets[index + 1] - offsets[index]
+        frontier = next_frontier
+
+    return last
+
+
 def dfs_recursive_basic(g: Graph, ind: int, seen: list):
     """The recursive function for the basic depth-first search.
 
@@ -75,6 +323,34 @@ def dfs_recursive_basic(g: Graph, ind: int, seen: list):
             dfs_recursive_basic(g, neighbor, seen)
 
 
+def dfs_iterative_basic(g: Graph, ind: int, seen: list):
+    """An iterative version of dfs_recursive_basic() that uses an explicit stack
+    instead of recursion, so it is not limited by Python's recursion depth.
+    It visits the nodes in the same order as the recursive function.
+
+    Parameters
+    ----------
+    g : Graph
+        The input graph.
+    ind : int
+        The index of the starting node.
+    seen : list of bool
+        Whether each node in the graph has been marked seen.
+    """
+    seen[ind] = True
+    to_explore: list = [iter(g.nodes[ind].get_edge_list())]
+
+    while to_explore:
+        for edge in to_explore[-1]:
+            neighbor: int = edge.to_node
+            if not seen[neighbor]:
+                seen[neighbor] = True
+                to_explore.append(iter(g.nodes[neighbor].get_edge_list()))
+                break
+        else:
+            to_explore.pop()
+
+
 def depth_first_search_basic(g: Graph, start: int):
     """The outer wrapper for the basic depth-first search.
 
@@ -86,7 +362,7 @@ def depth_first_search_basic(g: Graph, start: int):
         The index of the starting node.
     """
     seen: list = [False] * g.num_nodes
-    dfs_recursive_basic(g, start, seen)
+    dfs_iterative_basic(g, start, seen)
 
 
 def depth_first_search_basic_all(g: Graph):
@@ -101,7 +377,7 @@ def depth_first_search_basic_all(g: Graph):
     seen: list = [False] * g.num_nodes
     for ind in range(g.num_nodes):
         if not seen[ind]:
-            dfs_recursive_basic(g, ind, seen)
+            dfs_iterative_basic(g, ind, seen)
 
 
 def dfs_recursive_path(g: Graph, ind: int, seen: list, last: list):
@@ -130,6 +406,38 @@ def dfs_recursive_path(g: Graph, ind: int, seen: list, last: list):
             dfs_recursive_path(g, neighbor, seen, last)
 
 
+def dfs_iterative_path(g: Graph, ind: int, seen: list, last: list):
+    """An iterative version of dfs_recursive_path() that uses an explicit stack
+    instead of recursion. It produces the same list of previous nodes.
+
+    Parameters
+    ----------
+    g : Graph
+        The input graph.
+    ind : int
+        The index of the starting node.
+    seen : list of bool
+        Whether each node in the graph has been marked seen.
+    last : list of int
+        Maps the index of each node in the graph to the index of the node
+        before it on the path.
+    """
+    seen[ind] = True
+    to_explore: list = [(ind, iter(g.nodes[ind].get_edge_list()))]
+
+    while to_explore:
+        current, edges = to_explore[-1]
+        for edge in edges:
+            neighbor: int = edge.to_node
+            if not seen[neighbor]:
+                seen[neighbor] = True
+                last[neighbor] = current
+                to_explore.append((neighbor, iter(g.nodes[neighbor].get_edge_list())))
+                break
+        else:
+            to_explore.pop()
+
+
 def depth_first_search_path(g: Graph) -> list:
     """The outer wrapper function for the basic depth-first search
     that also returns the path of previous nodes.
@@ -150,7 +458,7 @@ def depth_first_search_path(g: Graph) -> list:
 
     for ind in range(g.num_nodes):
         if not seen[ind]:
-            dfs_recursive_path(g, ind, seen, last)
+            dfs_iterative_path(g, ind, seen, last)
     return last
 
 
@@ -192,6 +500,99 @@ def depth_first_search_stack(g: Graph, start: int) -> list:
     return last
 
 
+def iter_dfs(g: Graph, start: int):
+    """A depth-first search that yields each node when it is first visited
+    (in the same order as dfs_recursive_path), so the caller can stop the
+    search early or stream the results.
+
+    Parameters
+    ----------
+    g : Graph
+        The input graph.
+    start : int
+        The index of the starting node.
+
+    Yields
+    ------
+    index : int
+        The index of the current node.
+    parent : int
+        The index of the node's parent in the DFS tree (-1 for the start).
+    depth : int
+        The depth of the node in the DFS tree.
+    """
+    seen: set = {start}
+    to_explore: list = [(start, iter(g.nodes[start].get_edge_list()))]
+    yield start, -1, 0
+
+    while to_explore:
+        current, edges = to_explore[-1]
+        for edge in edges:
+            neighbor: int = edge.to_node
+            if neighbor not in seen:
+                seen.add(neighbor)
+                yield neighbor, current, len(to_explore)
+                to_explore.append((neighbor, iter(g.nodes[neighbor].get_edge_list())))
+                break
+        else:
+            to_explore.pop()
+
+
+def iter_dfs_edges(g: Graph, start: int):
+    """A depth-first search that yields each edge as it is examined along with
+    its classification in the DFS tree:
+
+    - "tree": The edge leads to a newly visited node.
+    - "back": The edge leads to an ancestor of the current node (a cycle).
+    - "forward": The edge leads to an already finished descendant.
+    - "cross": The edge leads to an already finished node in another subtree.
+
+    For undirected graphs, the edge back to a node's parent is skipped and each
+    non-tree edge is only reported once (as a back edge).
+
+    Parameters
+    ----------
+    g : Graph
+        The input graph.
+    start : int
+        The index of the starting node.
+
+    Yields
+    ------
+    from_node : int
+        The index of the edge's origin.
+    to_node : int
+        The index of the edge's destination.
+    edge_type : str
+        The edge's classification.
+    """
+    order: dict = {start: 0}
+    active: set = {start}
+    to_explore: list = [(start, -1, iter(g.nodes[start].get_edge_list()))]
+
+    while to_explore:
+        current, parent, edges = to_explore[-1]
+        for edge in edges:
+            neighbor: int = edge.to_node
+            if neighbor not in order:
+                order[neighbor] = len(order)
+                active.add(neighbor)
+                yield current, neighbor, "tree"
+                to_explore.append((neighbor, current, iter(g.nodes[neighbor].get_edge_list())))
+                break
+            elif g.undirected and (neighbor == parent or neighbor not in active):
+                continue
+            elif neighbor in active:
+                yield current, neighbor, "back"
+            elif order[neighbor] > order[current]:
+                yield current, neighbor, "forward"
+            else:
+                yield current, neighbor, "cross"
+        else:
+            to_explore.pop()
+            active.remove(current)
+
+
 def dfs_recursive_cc(g: Graph, ind: int, component: list, curr_comp: int):
     """The recursive helper function for the depth-first connected component search.
 
@@ -215,6 +616,35 @@ def dfs_recursive_cc(g: Graph, ind: int, component: list, curr_comp: int):
             dfs_recursive_cc(g, neighbor, component, curr_comp)
 
 
+def dfs_iterative_cc(g: Graph, ind: int, component: list, curr_comp: int):
+    """An iterative version of dfs_recursive_cc() that uses an explicit stack
+    instead of recursion.
+
+    Parameters
+    ----------
+    g : Graph
+        The input graph.
+    ind : int
+        The index of the starting node.
+    component : list of int
+        The indices of the nodes in the current connected component.
+    curr_comp : int
+        The index of the current component.
+    """
+    component[ind] = curr_comp
+    to_explore: list = [iter(g.nodes[ind].get_edge_list())]
+
+    while to_explore:
+        for edge in to_explore[-1]:
+            neighbor: int = edge.to_node
+            if component[neighbor] == -1:
+                component[neighbor] = curr_comp
+                to_explore.append(iter(g.nodes[neighbor].get_edge_list()))
+                break
+        else:
+            to_explore.pop()
+
+
 def dfs_connected_components(g: Graph) -> list:
     """Perform a depth-first search to find the connected components.
 
@@ -233,7 +663,7 @@ def dfs_connected_components(g: Graph) -> list:
 
     for ind in range(g.num_nodes):
         if component[ind] == -1:
-            dfs_recursive_cc(g, ind, component, curr_comp)
+            dfs_iterative_cc(g, ind, component, curr_comp)
             curr_comp += 1
 
     return component
@@ -326,6 +756,213 @@ def astar_search(g: Graph, h: list, start: int, goal: int) -> list:
     return last
 
 
+def bidirectional_astar_search(g: Graph, h: list, start: int, goal: int, h_start: list = None) -> tuple:
+    """A bidirectional A* search that searches forward from the start and backward
+    from the goal at the same time. To keep the searches consistent with each other,
+    both use the average potential p(v) = (h[v] - h_start[v]) / 2.
+
+    Parameters
+    ----------
+    g : Graph
+        The input graph.
+    h : list of float
+        A list of the (consistent) heuristic values for each node to the goal.
+    start : int
+        The index of the starting node.
+    goal : int
+        The index of the goal node.
+    h_start : list of float, optional
+        A list of the (consistent) heuristic values for each node to the start.
+        If None uses 0.0 for every node.
+
+    Returns
+    -------
+    last : list of int
+        Maps the index of each node in the graph to the index of the node
+        before it on the path.
+    bound : float
+        The suboptimality bound of the path. This is always 1.0 because the
+        bidirectional search returns an optimal path.
+    """
+    if h_start is None:
+        h_start = [0.0] * g.num_nodes
+    g_rev: Graph = g if g.undirected else make_transpose_graph(g)
+
+    last: list = [-1] * g.num_nodes
+    next_node: list = [-1] * g.num_nodes
+    cost_f: list = [math.inf] * g.num_nodes
+    cost_r: list = [math.inf] * g.num_nodes
+    pq_f: PriorityQueue = PriorityQueue(min_heap=True)
+    pq_r: PriorityQueue = PriorityQueue(min_heap=True)
+
+    cost_f[start] = 0.0
+    cost_r[goal] = 0.0
+    pq_f.enqueue(start, (h[start] - h_start[start]) / 2.0)
+    pq_r.enqueue(goal, (h_start[goal] - h[goal]) / 2.0)
+    best: float = 0.0 if start == goal else math.inf
+    meet: int = start if start == goal else -1
+
+    while not pq_f.is_empty() and not pq_r.is_empty():
+        if pq_f.peek_top_priority() + pq_r.peek_top_priority() >= best:
+            break
+
+        # Expand the search with the smaller frontier.
+        if len(pq_f) <= len(pq_r):
+            ind: int = pq_f.dequeue()
+            for edge in g.nodes[ind].get_edge_list():
+                neighbor: int = edge.to_node
+                if cost_f[neighbor] > cost_f[ind] + edge.weight:
+                    cost_f[neighbor] = cost_f[ind] + edge.weight
+                    last[neighbor] = ind
+                    pq_f.enqueue(neighbor, cost_f[neighbor] + (h[neighbor] - h_start[neighbor]) / 2.0)
+                if cost_f[neighbor] + cost_r[neighbor] < best:
+                    best = cost_f[neighbor] + cost_r[neighbor]
+                    meet = neighbor
+        else:
+            ind = pq_r.dequeue()
+            for edge in g_rev.nodes[ind].get_edge_list():
+                neighbor = edge.to_node
+                if cost_r[neighbor] > cost_r[ind] + edge.weight:
+                    cost_r[neighbor] = cost_r[ind] + edge.weight
+                    next_node[neighbor] = ind
+                    pq_r.enqueue(neighbor, cost_r[neighbor] + (h_start[neighbor] - h[neighbor]) / 2.0)
+                if cost_f[neighbor] + cost_r[neighbor] < best:
+                    best = cost_f[neighbor] + cost_r[neighbor]
+                    meet = neighbor
+
+    # Join the backward half of the path onto the forward search's path.
+    if meet != -1:
+        current: int = meet
+        while current != goal:
+            last[next_node[current]] = current
+            current = next_node[current]
+    return last, 1.0
+
+
+def anytime_astar_search(
+    g: Graph,
+    h: list,
+    start: int,
+    goal: int,
+    weight: float = 3.0,
+    weight_step: float = 0.5,
+    max_expansions: int = None,
+    time_limit: float = None,
+) -> tuple:
+    """An anytime weighted A* search (ARA*). The search starts with a heavily
+    weighted heuristic to find a first path quickly, then lowers the weight and
+    reuses its previous work to improve the path until either the path is optimal
+    or the expansion or time budget runs out.
+
+    Parameters
+    ----------
+    g : Graph
+        The input graph.
+    h : list of float
+        A list of the (consistent) heuristic values for each node.
+    start : int
+        The index of the starting node.
+    goal : int
+        The index of the goal node.
+    weight : float
+        The initial weight on the heuristic (at least 1.0).
+    weight_step : float
+        The amount to decrease the weight after each improved path.
+    max_expansions : int, optional
+        The maximum number of nodes to expand. If None there is no limit.
+    time_limit : float, optional
+        The maximum run time in seconds. If None there is no limit.
+
+    Returns
+    -------
+    last : list of int
+        Maps the index of each node in the graph to the index of the node
+        before it on the path.
+    bound : float
+        The cost of the path is at most bound times the cost of the optimal path.
+        Set to math.inf if no path was found within the budget.
+    """
+    if weight < 1.0:
+        raise ValueError(f"Weight must be at least 1.0. Given {weight}.")
+    if weight_step <= 0.0:
+        raise ValueError(f"Weight step must be positive. Given {weight_step}.")
+    end_time: float = math.inf if time_limit is None else time.perf_counter() + time_limit
+
+    last: list = [-1] * g.num_nodes
+    cost: list = [math.inf] * g.num_nodes
+    pq: PriorityQueue = PriorityQueue(min_heap=True)
+    inconsistent: set = set()
+    num_expanded: int = 0
+
+    cost[start] = 0.0
+    pq.enqueue(start, weight * h[start])
+    best_last: list = list(last)
+    best_bound: float = math.inf
+
+    while True:
+        # Improve the path with the current weight.
+        closed: list = [False] * g.num_nodes
+        out_of_budget: bool = False
+        while not pq.is_empty() and cost[goal] + weight * h[goal] > pq.peek_top_priority():
+            if (max_expansions is not None and num_expanded >= max_expansions) or (
+                time_limit is not None and time.perf_counter() > end_time
+            ):
+                out_of_budget = True
+                break
+
+            ind: int = pq.dequeue()
+            closed[ind] = True
+            num_expanded += 1
+            for edge in g.nodes[ind].get_edge_list():
+                neighbor: int = edge.to_node
+                if cost[neighbor] > cost[ind] + edge.weight:
+                    cost[neighbor] = cost[ind] + edge.weight
+                    last[neighbor] = ind
+                    if closed[neighbor]:
+                        inconsistent.add(neighbor)
+                    else:
+                        pq.enqueue(neighbor, cost[neighbor] + weight * h[neighbor])
+
+        if cost[goal] == math.inf:
+            break
+
+        # Bound the optimal cost from below using the nodes that still need expanding.
+        lower: float = math.inf
+        for i in range(1, pq.size() + 1):
+            value: int = pq.heap_array[i].value
+            lower = min(lower, cost[value] + h[value])
+        for value in inconsistent:
+            lower = min(lower, cost[value] + h[value])
+
+        if lower >= cost[goal]:
+            bound: float = 1.0
+        elif lower > 0.0:
+            bound = cost[goal] / lower
+        else:
+            bound = math.inf
+        if not out_of_budget:
+            bound = min(bound, weight)
+
+        if bound <= best_bound:
+            best_last = list(last)
+            best_bound = bound
+        if out_of_budget or best_bound <= 1.0:
+            break
+
+        # Lower the weight and move the inconsistent nodes back into the queue.
+        weight = max(1.0, weight - weight_step)
+        old_pq: PriorityQueue = pq
+        pq = PriorityQueue(min_heap=True)
+        for i in range(1, old_pq.size() + 1):
+            value = old_pq.heap_array[i].value
+            pq.enqueue(value, cost[value] + weight * h[value])
+        for value in inconsistent:
+            pq.enqueue(value, cost[value] + weight * h[value])
+        inconsistent = set()
+
+    return best_last, best_bound
+
+
 def dfs_preorder_recurse(g: Graph, ind: int, order: list, parents: list):
     """The inner recursive function for dfs_preorder().
 
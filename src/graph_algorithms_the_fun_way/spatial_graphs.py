@@ -11,7 +11,7 @@ I would normally recommend in production code.
 
 import math
 
-from graph_algorithms_the_fun_way.union_find import UnionFind
+from graph_algorithms_the_fun_way.union_find import ArrayUnionFind
 from graph_algorithms_the_fun_way.graph import Graph
 
 
@@ -115,7 +115,7 @@ def single_linkage_clustering(points: list) -> list:
         The linkages in the clustering.
     """
     num_pts: int = len(points)
-    djs: UnionFind = UnionFind(num_pts)
+    djs: ArrayUnionFind = ArrayUnionFind(num_pts)
     all_links: list = []
     cluster_links: list = []
 
@@ -0,0 +1,222 @@
+"""Run the tasks of a dependency graph (such as one from
+file_reader.make_graph_from_dependencies) in parallel.
+
+An edge u -> v means that task u must finish before task v can start. The
+DAGExecutor follows Kahn's algorithm: it counts the unfinished predecessors
+of each task and hands a task to a thread or process pool as soon as that
+count reaches zero. When more tasks are ready than there are free workers,
+the task with the longest remaining chain of (estimated) work to any final
+task runs first, which keeps the critical path moving.
+"""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+from graph_algorithms_the_fun_way.graph import Graph
+from graph_algorithms_the_fun_way.priorityqueue import PriorityQueue
+from graph_algorithms_the_fun_way.topological import Kahns
+
+
+def _timed_call(task) -> tuple:
+    """Run a task and time it in the worker.
+
+    Parameters
+    ----------
+    task : callable
+        The task to run with no arguments.
+
+    Returns
+    -------
+    result : any
+        The task's return value.
+    duration : float
+        The number of seconds the task took.
+    """
+    start: float = time.perf_counter()
+    result = task()
+    return result, time.perf_counter() - start
+
+
+def critical_path_priorities(g: Graph, costs: list = None) -> list:
+    """Compute the total cost of the most expensive chain of tasks from
+    each task to any final task (including the task itself).
+
+    Parameters
+    ----------
+    g : Graph
+        The dependency graph.
+    costs : list of float, optional
+        The estimated cost of each task. Defaults to 1.0 for every task.
+
+    Returns
+    -------
+    priorities : list of float
+        The cost of the most expensive chain starting at each task.
+    """
+    order: list = Kahns(g)
+    if len(order) != g.num_nodes:
+        raise ValueError("The dependency graph contains a cycle.")
+    if costs is None:
+        costs = [1.0] * g.num_nodes
+    elif len(costs) != g.num_nodes:
+        raise ValueError(f"Expected {g.num_nodes} costs. Found {len(costs)}.")
+
+    priorities: list = [0.0] * g.num_nodes
+    for index in reversed(order):
+        longest: float = 0.0
+        for other in g.nodes[index].edges:
+            if priorities[other] > longest:
+                longest = priorities[other]
+        priorities[index] = costs[index] + longest
+    return priorities
+
+
+class DAGExecutor:
+    """Runs the tasks of a dependency graph on a pool of workers.
+
+    Attributes
+    ----------
+    g : Graph
+        The dependency graph.
+    tasks : list of callable
+        The task for each node, called with no arguments.
+    max_workers : int
+        The maximum number of tasks to run at once.
+    use_processes : bool
+        Run tasks on a process pool instead of a thread pool. The tasks and
+        their results must then be picklable.
+    priorities : list of float
+        The critical path priority of each task.
+    status : list of str
+        The status of each task: "pending", "running", "done", "failed",
+        or "cancelled".
+    results : dict
+        Maps the index of each finished task to its return value.
+    durations : dict
+        Maps the index of each finished task to the seconds it ran (measured
+        in the worker).
+    start_times : dict
+        Maps the index of each started task to the seconds between the start
+        of run() and its submission to the pool.
+    finish_times : dict
+        Maps the index of each finished task to the seconds between the start
+        of run() and the executor seeing it finish.
+    makespan : float
+        The total number of seconds run() took.
+
+    Parameters
+    ----------
+    g : Graph
+        The dependency graph.
+    tasks : list of callable
+        The task for each node, called with no arguments.
+    max_workers : int
+        The maximum number of tasks to run at once.
+    use_processes : bool
+        Run tasks on a process pool instead of a thread pool.
+    costs : list of float, optional
+        The estimated cost of each task used to prioritize ready tasks.
+    """
+
+    def __init__(
+        self, g: Graph, tasks: list, max_workers: int = 4, use_processes: bool = False, costs: list = None
+    ):
+        if len(tasks) != g.num_nodes:
+            raise ValueError(f"Expected {g.num_nodes} tasks. Found {len(tasks)}.")
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1. Found {max_workers}.")
+        self.g: Graph = g
+        self.tasks: list = tasks
+        self.max_workers: int = max_workers
+        self.use_processes: bool = use_processes
+        self.priorities: list = critical_path_priorities(g, costs)
+
+        self.status: list = ["pending"] * g.num_nodes
+        self.results: dict = {}
+        self.durations: dict = {}
+        self.start_times: dict = {}
+        self.finish_times: dict = {}
+        self.makespan: float = 0.0
+        self._cancel_event: threading.Event = threading.Event()
+
+    def cancel(self):
+        """Stop starting new tasks. Tasks that are already running finish,
+        and run() returns once they have. This can be called from another
+        thread or from inside a task running on a thread pool.
+        """
+        self._cancel_event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancel() was called."""
+        return self._cancel_event.is_set()
+
+    def run(self, poll_interval: float = 0.1) -> dict:
+        """Run all of the tasks, respecting their dependencies.
+
+        If a task raises an exception, no new tasks are started and the
+        exception is raised again once the running tasks finish.
+
+        Parameters
+        ----------
+        poll_interval : float
+            The longest time in seconds to wait between checks for cancellation.
+
+        Returns
+        -------
+        results : dict
+            Maps the index of each task that finished to its return value.
+        """
+        run_start: float = time.perf_counter()
+        count: list = [0] * self.g.num_nodes
+        for current in self.g.nodes:
+            for other in current.edges:
+                count[other] = count[other] + 1
+
+        ready: PriorityQueue = PriorityQueue(size=self.g.num_nodes + 1)
+        for current in self.g.nodes:
+            if count[current.index] == 0:
+                ready.enqueue(current.index, self.priorities[current.index])
+
+        pool_type = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+        running: dict = {}
+        error: BaseException = None
+        with pool_type(max_workers=self.max_workers) as pool:
+            while running or (not ready.is_empty() and error is None and not self.cancelled):
+                while not ready.is_empty() and len(running) < self.max_workers:
+                    if error is not None or self.cancelled:
+                        break
+                    index: int = ready.dequeue()
+                    self.status[index] = "running"
+                    self.start_times[index] = time.perf_counter() - run_start
+                    running[pool.submit(_timed_call, self.tasks[index])] = index
+
+                if not running:
+                    break
+                finished, _ = wait(list(running), timeout=poll_interval, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    index = running.pop(future)
+                    self.finish_times[index] = time.perf_counter() - run_start
+                    try:
+                        self.results[index], self.durations[index] = future.result()
+                    except BaseException as exc:
+                        self.status[index] = "failed"
+                        if error is None:
+                            error = exc
+                        continue
+                    self.status[index] = "done"
+
+                    for other in self.g.nodes[index].edges:
+                        count[other] = count[other] - 1
+                        if count[other] == 0:
+                            ready.enqueue(other, self.priorities[other])
+
+        for index in range(self.g.num_nodes):
+            if self.status[index] == "pending":
+                self.status[index] = "cancelled"
+        self.makespan = time.perf_counter() - run_start
+
+        if error is not None:
+            raise error
+        return self.results
@@ -8,6 +8,9 @@ fully optimized and does not include all the validity checks that
 I would normally recommend in production code.
 """
 
+from array import array
+
+from graph_algorithms_the_fun_way.csr_graph import CSRGraph, make_csr_graph
 from graph_algorithms_the_fun_way.graph import Graph
 
 
@@ -114,11 +117,66 @@ def topological_dfs(g: Graph) -> list:
     s: list = []
     for ind in range(g.num_nodes):
         if not seen[ind]:
-            topological_dfs_recursive(g, ind, seen, s)
+            topological_dfs_iterative(g, ind, seen, s)
     s.reverse()
     return s
 
 
+def topological_dfs_cycle(g: Graph) -> tuple:
+    """Depth-first search for topological sort that also detects cycles
+    in the same pass.
+
+    Each node is white (unseen), gray (on the search's stack), or black
+    (finished). Reaching a gray node means the search has found a path back
+    to one of its own ancestors, so the stack from that node up to the
+    current node forms a cycle.
+
+    Parameters
+    ----------
+    g : Graph
+        The input graph.
+
+    Returns
+    -------
+    order : list of int or None
+        The node indices in topological order (the same order as
+        topological_dfs()), or None if the graph has a cycle.
+    cycle : list of int or None
+        The node indices on a cycle in path order (the last node has an edge
+        back to the first), or None if the graph is acyclic.
+    """
+    color: bytearray = bytearray(g.num_nodes)
+    s: list = []
+    for ind in range(g.num_nodes):
+        if color[ind] != 0:
+            continue
+        color[ind] = 1
+        to_explore: list = [(ind, iter(g.nodes[ind].edges))]
+
+        while to_explore:
+            current, neighbors = to_explore[-1]
+            for neighbor in neighbors:
+                if color[neighbor] == 0:
+                    color[neighbor] = 1
+                    to_explore.append((neighbor, iter(g.nodes[neighbor].edges)))
+                    break
+                if color[neighbor] == 1:
+                    cycle: list = [current]
+                    depth: int = len(to_explore) - 2
+                    while cycle[-1] != neighbor:
+                        cycle.append(to_explore[depth][0])
+                        depth -= 1
+                    cycle.reverse()
+                    return None, cycle
+            else:
+                to_explore.pop()
+                color[current] = 2
+                s.append(current)
+
+    s.reverse()
+    return s, None
+
+
 def topological_dfs_recursive(g: Graph, index: int, seen: list, s: list):
     """The recursive function for DFS topological sort.
 
@@ -142,6 +200,38 @@ def topological_dfs_recursive(g: Graph, index: int, seen: list, s: list):
     s.append(index)
 
 
+def topological_dfs_iterative(g: Graph, index: int, seen: list, s: list):
+    """An iterative version of topological_dfs_recursive() that uses an
+    explicit stack instead of recursion. The nodes are added to s in the
+    same order as the recursive function.
+
+    Parameters
+    ----------
+    g : Graph
+        The input graph.
+    index : int
+        The starting index.
+    seen : list of bool
+        Whether each node in the graph has been marked seen.
+    s : list
+        A list representing the stack.
+    """
+    seen[index] = True
+    to_explore: list = [(index, iter(g.nodes[index].get_edge_list()))]
+
+    while to_explore:
+        current, edges = to_explore[-1]
+        for edge in edges:
+            neighbor: int = edge.to_node
+            if not seen[neighbor]:
+                seen[neighbor] = True
+                to_explore.append((neighbor, iter(g.nodes[neighbor].get_edge_list())))
+                break
+        else:
+            to_explore.pop()
+            s.append(current)
+
+
 def sort_forward_pointers(options: list) -> list:
     """A function to sort forward pointers.
 
@@ -162,3 +252,297 @@ def sort_forward_pointers(options: list) -> list:
             if next_index != -1:
                 g.insert_edge(current, next_index, 1.0)
     return Kahns(g)
+
+
+def topological_levels(g) -> tuple:
+    """Split a DAG into levels where each node's level is the number of edges
+    on the longest path to it from a node with no incoming edges. All of the
+    nodes in a level can be processed in parallel once the earlier levels
+    are done.
+
+    The levels are found level by level with the in-degree counts of Kahn's
+    algorithm over a compressed sparse row copy of the graph.
+
+    Parameters
+    ----------
+    g : Graph or CSRGraph
+        The input graph.
+
+    Returns
+    -------
+    level : list of int
+        Maps each node's index to its level.
+    layers : list of list of int
+        The node indices in each level.
+    """
+    csr: CSRGraph = g if isinstance(g, CSRGraph) else make_csr_graph(g)
+    offsets: array = csr.offsets
+    targets: array = csr.targets
+    num_nodes: int = csr.num_nodes
+
+    count: array = array("q", [0]) * num_nodes
+    for to_node in targets:
+        count[to_node] += 1
+
+    level: list = [0] * num_nodes
+    layers: list = []
+    current: list = [index for index in range(num_nodes) if count[index] == 0]
+    num_seen: int = len(current)
+    while current:
+        layers.append(current)
+        next_layer: list = []
+        for index in current:
+            for i in range(offsets[index], offsets[index + 1]):
+                to_node: int = targets[i]
+                count[to_node] -= 1
+                if count[to_node] == 0:
+                    level[to_node] = len(layers)
+                    next_layer.append(to_node)
+        num_seen += len(next_layer)
+        current = next_layer
+
+    if num_seen != num_nodes:
+        raise ValueError("The graph contains a cycle.")
+    return level, layers
+
+
+def critical_path(g) -> tuple:
+    """Find the critical (longest weighted) path through a DAG and the
+    slack of each node: how much later than its earliest start time the
+    node could start without delaying the end of the critical path. Edge
+    weights are the durations between nodes.
+
+    Parameters
+    ----------
+    g : Graph or CSRGraph
+        The input graph.
+
+    Returns
+    -------
+    path : list of int
+        The node indices on a longest path in order (empty if the graph
+        has no nodes).
+    length : float
+        The total weight of the path.
+    slack : list of float
+        Maps each node's index to its slack. The nodes on the critical
+        path have a slack of 0.
+    """
+    csr: CSRGraph = g if isinstance(g, CSRGraph) else make_csr_graph(g)
+    offsets: array = csr.offsets
+    targets: array = csr.targets
+    weights: array = csr.weights
+    num_nodes: int = csr.num_nodes
+    if num_nodes == 0:
+        return [], 0.0, []
+
+    _, layers = topological_levels(csr)
+    order: list = [index for layer in layers for index in layer]
+
+    # Forward pass: the earliest time each node can be reached.
+    earliest: list = [0.0] * num_nodes
+    last: list = [-1] * num_nodes
+    for index in order:
+        for i in range(offsets[index], offsets[index + 1]):
+            to_node: int = targets[i]
+            if last[to_node] == -1 or earliest[index] + weights[i] > earliest[to_node]:
+                earliest[to_node] = earliest[index] + weights[i]
+                last[to_node] = index
+
+    end: int = max(range(num_nodes), key=lambda index: earliest[index])
+    length: float = earliest[end]
+
+    # Backward pass: the latest time each node can be reached without
+    # delaying the end of the path.
+    latest: list = [length] * num_nodes
+    for index in reversed(order):
+        for i in range(offsets[index], offsets[index + 1]):
+            if latest[targets[i]] - weights[i] < latest[index]:
+                latest[index] = latest[targets[i]] - weights[i]
+    slack: list = [latest[index] - earliest[index] for index in range(num_nodes)]
+
+    path: list = [end]
+    while last[path[-1]] != -1:
+        path.append(last[path[-1]])
+    path.reverse()
+    return path, length, slack
+
+
+class DynamicTopologicalOrder:
+    """A topological order of a DAG that is kept up to date as edges are
+    inserted, using the Pearce-Kelly algorithm.
+
+    Inserting an edge u -> v where u is already before v needs no work.
+    Otherwise only the nodes between v and u in the order can be affected:
+    a forward search from v (limited to nodes up to u's position) finds
+    the nodes that must move after u, and reaching u means the edge would
+    create a cycle. A backward search from u (limited to nodes from v's
+    position) finds the nodes that must stay before v. The two sets are
+    then rewritten into the positions they already occupied.
+
+    Attributes
+    ----------
+    g : Graph
+        The current graph.
+    in_neighbors : list of set
+        The in-neighbors of each node.
+    order : list of int
+        The node index at each position of the topological order.
+    position : list of int
+        Maps each node's index to its position in the order.
+
+    Parameters
+    ----------
+    num_nodes : int
+        The number of nodes in the graph (which starts with no edges).
+    """
+
+    def __init__(self, num_nodes: int):
+        self.g: Graph = Graph(num_nodes, undirected=False)
+        self.in_neighbors: list = [set() for _ in range(num_nodes)]
+        self.order: list = list(range(num_nodes))
+        self.position: list = list(range(num_nodes))
+
+    def node_at(self, pos: int) -> int:
+        """Get the node at a position of the topological order.
+
+        Parameters
+        ----------
+        pos : int
+            The position.
+
+        Returns
+        -------
+        int
+            The index of the node at that position.
+        """
+        return self.order[pos]
+
+    def position_of(self, index: int) -> int:
+        """Get a node's position in the topological order.
+
+        Parameters
+        ----------
+        index : int
+            The index of the node.
+
+        Returns
+        -------
+        int
+            The node's position.
+        """
+        return self.position[index]
+
+    def _forward(self, start: int, target: int, upper: int) -> tuple:
+        """Find the nodes reachable from start whose positions are at most upper.
+
+        Parameters
+        ----------
+        start : int
+            The index of the starting node.
+        target : int
+            The index of the node whose discovery means a cycle.
+        upper : int
+            The largest position to visit.
+
+        Returns
+        -------
+        visited : list of int
+            The nodes reached (if no cycle is found).
+        cycle : list of int or None
+            The path from start to target if target is reachable.
+        """
+        last: dict = {start: -1}
+        to_explore: list = [start]
+        while to_explore:
+            current: int = to_explore.pop()
+            for other in self.g.nodes[current].edges:
+                if other == target:
+                    cycle: list = [target, current]
+                    while last[cycle[-1]] != -1:
+                        cycle.append(last[cycle[-1]])
+                    cycle.reverse()
+                    return [], cycle
+                if other not in last and self.position[other] <= upper:
+                    last[other] = current
+                    to_explore.append(other)
+        return list(last), None
+
+    def _backward(self, start: int, lower: int) -> list:
+        """Find the nodes that can reach start whose positions are at least lower.
+
+        Parameters
+        ----------
+        start : int
+            The index of the starting node.
+        lower : int
+            The smallest position to visit.
+
+        Returns
+        -------
+        visited : list of int
+            The nodes reached.
+        """
+        seen: set = set([start])
+        to_explore: list = [start]
+        while to_explore:
+            current: int = to_explore.pop()
+            for other in self.in_neighbors[current]:
+                if other not in seen and self.position[other] >= lower:
+                    seen.add(other)
+                    to_explore.append(other)
+        return list(seen)
+
+    def insert_edge(self, from_node: int, to_node: int, weight: float = 1.0):
+        """Insert an edge and update the topological order. An edge that
+        would create a cycle is not inserted.
+
+        Parameters
+        ----------
+        from_node : int
+            The node index of the edge's origin.
+        to_node : int
+            The node index of the edge's destination.
+        weight : float
+            The weight of the edge.
+
+        Returns
+        -------
+        cycle : list of int or None
+            None if the edge was inserted. Otherwise the nodes on the cycle
+            the edge would create, starting with to_node and ending with
+            from_node.
+        """
+        if from_node < 0 or from_node >= self.g.num_nodes:
+            raise IndexError
+        if to_node < 0 or to_node >= self.g.num_nodes:
+            raise IndexError
+        if from_node == to_node:
+            return [from_node]
+
+        lower: int = self.position[to_node]
+        upper: int = self.position[from_node]
+        if upper < lower:
+            self.g.insert_edge(from_node, to_node, weight)
+            self.in_neighbors[to_node].add(from_node)
+            return None
+
+        # The nodes reachable from to_node must move after the nodes that
+        # reach from_node. Both sets keep their relative order and reuse
+        # the positions they already had.
+        forward, cycle = self._forward(to_node, from_node, upper)
+        if cycle is not None:
+            return cycle
+        backward: list = self._backward(from_node, lower)
+
+        forward.sort(key=lambda index: self.position[index])
+        backward.sort(key=lambda index: self.position[index])
+        moved: list = backward + forward
+        positions: list = sorted(self.position[index] for index in moved)
+        for pos, index in zip(positions, moved):
+            self.order[pos] = index
+            self.position[index] = pos
+
+        self.g.insert_edge(from_node, to_node, weight)
+        self.in_neighbors[to_node].add(from_node)
+        return None
@@ -0,0 +1,309 @@
+"""Transitive closure and transitive reduction of directed acyclic graphs,
+such as the dependency graphs from file_reader.make_graph_from_dependencies.
+
+The closure is computed one row at a time in reverse topological order
+(from topological.Kahns), so each node's row is the union of its children's
+rows. Rows are stored as bitsets. TransitiveClosure uses Python integers
+over the nodes' topological positions. Since a node can only reach nodes
+later in the order, each row is shifted to start just after the node's own
+position, which halves the memory on average. Rows can also be compressed
+with zlib, which is very effective on the sparse rows of typical dependency
+graphs. transitive_closure_numpy() builds a dense NumPy bit matrix instead.
+
+The transitive reduction keeps an edge u -> v only if v cannot be reached
+from any of u's other children, which the closure rows answer directly.
+"""
+
+import zlib
+
+from graph_algorithms_the_fun_way.graph import Graph
+from graph_algorithms_the_fun_way.topological import Kahns
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _topological_positions(g: Graph) -> tuple:
+    """Compute a topological order of the graph and each node's position in it.
+
+    Parameters
+    ----------
+    g : Graph
+        The input graph.
+
+    Returns
+    -------
+    order : list of int
+        The node indices in topological order.
+    position : list of int
+        Maps each node's index to its position in order.
+    """
+    order: list = Kahns(g)
+    if len(order) != g.num_nodes:
+        raise ValueError("The graph contains a cycle.")
+    position: list = [0] * g.num_nodes
+    for i, index in enumerate(order):
+        position[index] = i
+    return order, position
+
+
+class TransitiveClosure:
+    """The transitive closure of a directed acyclic graph stored as one
+    (optionally compressed) bitset row per node.
+
+    Attributes
+    ----------
+    num_nodes : int
+        The number of nodes in the graph.
+    order : list of int
+        The node indices in the topological order used for the bits.
+    position : list of int
+        Maps each node's index to its position in order.
+    rows : list
+        Maps each node's index to its row: an int whose bit i is set if the
+        node reaches the node at position[node] + 1 + i, or the zlib
+        compressed bytes of that int if compressed.
+    compressed : bool
+        Whether the rows are compressed.
+    memory_bytes : int
+        The approximate number of bytes used by the rows.
+
+    Parameters
+    ----------
+    g : Graph
+        The input graph.
+    compress : bool
+        Whether to compress the rows.
+    memory_budget : int, optional
+        The maximum number of bytes to use for the rows. If the uncompressed
+        rows exceed the budget, they are compressed. If the compressed rows
+        still exceed it, a MemoryError is raised.
+    """
+
+    def __init__(self, g: Graph, compress: bool = False, memory_budget: int = None):
+        self.num_nodes: int = g.num_nodes
+        self.order, self.position = _topological_positions(g)
+        self.rows: list = [None] * g.num_nodes
+        self.compressed: bool = False
+        self.memory_bytes: int = 0
+        if compress:
+            self._compress_rows()
+
+        for index in reversed(self.order):
+            start: int = self.position[index] + 1
+            row: int = 0
+            for other in g.nodes[index].edges:
+                # Move the child's row into this row's frame and add the child.
+                shift: int = self.position[other] - start
+                row |= ((self._get_row(other) << 1) | 1) << shift
+            self._set_row(index, row)
+
+            if memory_budget is not None and self.memory_bytes > memory_budget:
+                if self.compressed:
+                    raise MemoryError(f"The closure needs more than {memory_budget} bytes.")
+                self._compress_rows()
+                if self.memory_bytes > memory_budget:
+                    raise MemoryError(f"The closure needs more than {memory_budget} bytes.")
+
+    def _compress_rows(self):
+        """Compress all of the rows."""
+        self.compressed = True
+        self.memory_bytes = 0
+        for index in range(self.num_nodes):
+            if self.rows[index] is not None:
+                self._set_row(index, self.rows[index])
+
+    def _get_row(self, index: int) -> int:
+        """Get a node's row as an int (in its shifted frame)."""
+        row = self.rows[index]
+        if self.compressed:
+            return int.from_bytes(zlib.decompress(row), "little")
+        return row
+
+    def _set_row(self, index: int, row: int):
+        """Store a node's row (in its shifted frame)."""
+        num_bytes: int = (row.bit_length() + 7) // 8
+        if self.compressed:
+            stored: bytes = zlib.compress(row.to_bytes(num_bytes, "little"))
+            self.rows[index] = stored
+            self.memory_bytes += len(stored)
+        else:
+            self.rows[index] = row
+            self.memory_bytes += num_bytes
+
+    def get_position_bits(self, index: int) -> int:
+        """Get a node's row with bit i set if the node reaches the node at
+        position i of the topological order.
+
+        Parameters
+        ----------
+        index : int
+            The index of the node.
+
+        Returns
+        -------
+        int
+            The row as a bitset over topological positions.
+        """
+        return self._get_row(index) << (self.position[index] + 1)
+
+    def can_reach(self, from_node: int, to_node: int) -> bool:
+        """Check whether there is a path from one node to another.
+
+        Parameters
+        ----------
+        from_node : int
+            The index of the source node.
+        to_node : int
+            The index of the target node.
+
+        Returns
+        -------
+        bool
+            True if there is a path with at least one edge from from_node to
+            to_node.
+        """
+        if from_node < 0 or from_node >= self.num_nodes or to_node < 0 or to_node >= self.num_nodes:
+            raise IndexError
+        shift: int = self.position[to_node] - self.position[from_node] - 1
+        if shift < 0:
+            return False
+        return (self._get_row(from_node) >> shift) & 1 == 1
+
+    def descendants(self, index: int) -> set:
+        """Retrieve all of the nodes reachable from a given node (for a
+        dependency graph, everything that depends on it).
+
+        Parameters
+        ----------
+        index : int
+            The index of the node.
+
+        Returns
+        -------
+        set of int
+            The indices of the reachable nodes (not including the node itself).
+        """
+        if index < 0 or index >= self.num_nodes:
+            raise IndexError
+        start: int = self.position[index] + 1
+        result: set = set()
+        # The reversed binary string lists the bits from lowest to highest.
+        for i, bit in enumerate(bin(self._get_row(index))[:1:-1]):
+            if bit == "1":
+                result.add(self.order[start + i])
+        return result
+
+    def count_descendants(self, index: int) -> int:
+        """Count the nodes reachable from a given node.
+
+        Parameters
+        ----------
+        index : int
+            The index of the node.
+
+        Returns
+        -------
+        int
+            The number of reachable nodes (not including the node itself).
+        """
+        if index < 0 or index >= self.num_nodes:
+            raise IndexError
+        return bin(self._get_row(index)).count("1")
+
+
+def transitive_closure(g: Graph, compress: bool = False, memory_budget: int = None) -> TransitiveClosure:
+    """Compute the transitive closure of a directed acyclic graph.
+
+    Parameters
+    ----------
+    g : Graph
+        The input graph.
+    compress : bool
+        Whether to compress the rows.
+    memory_budget : int, optional
+        The maximum number of bytes to use for the rows.
+
+    Returns
+    -------
+    TransitiveClosure
+        The closure.
+    """
+    return TransitiveClosure(g, compress=compress, memory_budget=memory_budget)
+
+
+def transitive_closure_numpy(g: Graph, memory_budget: int = None):
+    """Compute the transitive closure of a directed acyclic graph as a
+    dense NumPy bit matrix (requires numpy).
+
+    Parameters
+    ----------
+    g : Graph
+        The input graph.
+    memory_budget : int, optional
+        The maximum number of bytes to use for the matrix.
+
+    Returns
+    -------
+    closure : numpy.ndarray of uint8
+        A num_nodes by ceil(num_nodes / 8) array where row u is the packed
+        bits (see numpy.unpackbits) of the nodes reachable from node u by a
+        path with at least one edge.
+    """
+    if np is None:
+        raise ImportError("transitive_closure_numpy requires numpy.")
+    order, _ = _topological_positions(g)
+
+    num_nodes: int = g.num_nodes
+    num_bytes: int = (num_nodes + 7) // 8
+    if memory_budget is not None and num_nodes * num_bytes > memory_budget:
+        raise MemoryError(f"The closure needs {num_nodes * num_bytes} bytes.")
+
+    closure = np.zeros((num_nodes, num_bytes), dtype=np.uint8)
+    for index in reversed(order):
+        children: list = list(g.nodes[index].edges)
+        if not children:
+            continue
+        row = closure[index]
+        np.bitwise_or.reduce(closure[children], axis=0, out=row)
+        for other in children:
+            row[other >> 3] |= 0x80 >> (other & 7)
+    return closure
+
+
+def transitive_reduction(g: Graph, closure: TransitiveClosure = None) -> Graph:
+    """Compute the transitive reduction of a directed acyclic graph: the
+    smallest subgraph with the same reachability.
+
+    Parameters
+    ----------
+    g : Graph
+        The input graph.
+    closure : TransitiveClosure, optional
+        The graph's closure if already computed.
+
+    Returns
+    -------
+    Graph
+        A new graph with only the edges u -> v where v cannot be reached
+        from u through any other path. The nodes keep their labels and
+        names, and the edges keep their weights.
+    """
+    if closure is None:
+        closure = transitive_closure(g)
+
+    g_new: Graph = Graph(g.num_nodes, undirected=g.undirected)
+    g_new.node_indices = dict(g.node_indices)
+    for node in g.nodes:
+        g_new.nodes[node.index].label = node.label
+
+        # Everything reachable through a child is redundant as a direct edge.
+        redundant: int = 0
+        for other in node.edges:
+            redundant |= closure.get_position_bits(other)
+        for other, edge in node.edges.items():
+            if not (redundant >> closure.position[other]) & 1:
+                g_new.insert_edge(node.index, other, edge.weight)
+    return g_new
@@ -8,6 +8,13 @@ fully optimized and does not include all the validity checks that
 I would normally recommend in production code.
 """
 
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class UnionFindNode:
     """A node for storing UnionFind information.
@@ -64,10 +71,17 @@ class UnionFind:
         if label < 0 or label >= len(self.nodes):
             raise IndexError
 
+        root: UnionFindNode = self.nodes[label]
+        while root.parent is not None:
+            root = root.parent
+
+        # Path compression: point every node on the path directly at the root.
         current: UnionFindNode = self.nodes[label]
         while current.parent is not None:
-            current = current.parent
-        return current.label
+            next_node: UnionFindNode = current.parent
+            current.parent = root
+            current = next_node
+        return root.label
 
     def are_disjoint(self, label1: int, label2: int) -> bool:
         """Checks whether two elements are in different sets.
@@ -117,3 +131,386 @@ class UnionFind:
         for x in self.nodes:
             root = self.find_set(x)
             print(x, ": ", root)
+
+
+def _sorted_unique(values):
+    """Return the sorted unique entries of a NumPy array of integers.
+
+    This sorts and compares neighbors directly, which is faster than
+    numpy.unique for large arrays of int64 labels.
+
+    Parameters
+    ----------
+    values : numpy.ndarray of int
+        The input values.
+
+    Returns
+    -------
+    numpy.ndarray of int
+        The sorted unique values.
+    """
+    values = np.sort(values)
+    if len(values) == 0:
+        return values
+    keep = np.empty(len(values), dtype=bool)
+    keep[0] = True
+    np.not_equal(values[1:], values[:-1], out=keep[1:])
+    return values[keep]
+
+
+class ArrayUnionFind:
+    """A UnionFind data structure that stores each element's parent and set
+    size in compact integer arrays instead of UnionFindNode objects. It uses
+    path halving in find_set() and union by size, so each operation takes
+    nearly constant amortized time.
+
+    Attributes
+    ----------
+    parent : array of int
+        Maps each element to its parent element. Roots are their own parent.
+    set_sizes : array of int
+        The size of each set indexed by the set's root (0 for non-roots).
+    num_disjoint_sets : int
+        The number of disjoint sets.
+
+    Parameters
+    ----------
+    num_sets : int
+        The initial number of disjoint sets.
+    """
+
+    def __init__(self, num_sets: int):
+        self.parent: array = array("q", range(num_sets))
+        self.set_sizes: array = array("q", [1]) * num_sets
+        self.num_disjoint_sets: int = num_sets
+
+    def find_set(self, label: int) -> int:
+        """Find the set ID to which the given element belongs.
+
+        Parameters
+        ----------
+        label : int
+            The label of the element to lookup.
+
+        Returns
+        -------
+        int
+            The ID of the set to which the given element belongs.
+        """
+        parent: array = self.parent
+        if label < 0 or label >= len(parent):
+            raise IndexError
+
+        # Path halving: point every other node on the path at its grandparent.
+        while parent[label] != label:
+            parent[label] = parent[parent[label]]
+            label = parent[label]
+        return label
+
+    def are_disjoint(self, label1: int, label2: int) -> bool:
+        """Checks whether two elements are in different sets.
+
+        Parameters
+        ----------
+        label1 : int
+            The label of the first element.
+        label2 : int
+            The label of the second element.
+
+        Returns
+        -------
+        bool
+            True if the elements are in different sets and False otherwise.
+        """
+        return self.find_set(label1) != self.find_set(label2)
+
+    def union_sets(self, label1: int, label2: int) -> bool:
+        """Union two disjoint sets into a single set.
+
+        Parameters
+        ----------
+        label1 : int
+            The label of the first element.
+        label2 : int
+            The label of the second element.
+
+        Returns
+        -------
+        bool
+            True if the sets were merged and False if the elements were
+            already in the same set.
+        """
+        set1_label: int = self.find_set(label1)
+        set2_label: int = self.find_set(label2)
+        if set1_label == set2_label:
+            return False
+
+        if self.set_sizes[set1_label] < self.set_sizes[set2_label]:
+            small: int = set1_label
+            large: int = set2_label
+        else:
+            small = set2_label
+            large = set1_label
+        self.parent[small] = large
+        self.set_sizes[large] += self.set_sizes[small]
+        self.set_sizes[small] = 0
+        self.num_disjoint_sets -= 1
+        return True
+
+    def find_many(self, labels) -> list:
+        """Find the set ID of each of a sequence of elements.
+
+        Parameters
+        ----------
+        labels : iterable of int
+            The labels of the elements to lookup.
+
+        Returns
+        -------
+        list of int
+            The ID of the set to which each element belongs.
+        """
+        return [self.find_set(label) for label in labels]
+
+    def union_many(self, pairs) -> int:
+        """Union the sets of each of a sequence of pairs of elements.
+
+        Parameters
+        ----------
+        pairs : iterable of tuple
+            The (label1, label2) pairs to union.
+
+        Returns
+        -------
+        int
+            The number of pairs that merged two different sets.
+        """
+        num_merged: int = 0
+        for label1, label2 in pairs:
+            if self.union_sets(label1, label2):
+                num_merged += 1
+        return num_merged
+
+    def _parent_view(self):
+        """Return a NumPy array that shares memory with the parent array."""
+        if np is None:
+            raise ImportError("The vectorized UnionFind operations require numpy.")
+        return np.frombuffer(self.parent, dtype=np.int64)
+
+    def find_many_numpy(self, labels):
+        """Find the set ID of each of an array of elements with vectorized
+        pointer jumping. Also points each of the elements directly at its root.
+
+        Parameters
+        ----------
+        labels : array-like of int
+            The labels of the elements to lookup.
+
+        Returns
+        -------
+        numpy.ndarray of int
+            The ID of the set to which each element belongs.
+        """
+        parent = self._parent_view()
+        labels = np.asarray(labels, dtype=np.int64)
+        if labels.size > 0 and (labels.min() < 0 or labels.max() >= len(parent)):
+            raise IndexError
+
+        roots = parent[labels]
+        while True:
+            next_roots = parent[roots]
+            if np.array_equal(next_roots, roots):
+                break
+            roots = next_roots
+        parent[labels] = roots
+        return roots
+
+    def union_many_numpy(self, pairs) -> int:
+        """Union the sets of each of an array of pairs of elements with
+        vectorized operations.
+
+        Each round finds the roots of every pair and links the larger root
+        index of each unmerged pair to the smaller one. When several pairs
+        link the same root only one of the links is kept, so the rounds
+        repeat until every pair is in a single set. Unlike union_sets() this
+        links sets by index instead of by size.
+
+        Parameters
+        ----------
+        pairs : array-like of int
+            An array with shape (k, 2) of the (label1, label2) pairs to union.
+
+        Returns
+        -------
+        int
+            The total number of merges (the decrease in the number of disjoint sets).
+        """
+        parent = self._parent_view()
+        pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+        if pairs.shape[0] == 0:
+            return 0
+
+        first = self.find_many_numpy(pairs[:, 0])
+        second = self.find_many_numpy(pairs[:, 1])
+        old_roots = _sorted_unique(np.concatenate([first, second]))
+
+        while True:
+            mask = first != second
+            if not np.any(mask):
+                break
+            low = np.minimum(first[mask], second[mask])
+            high = np.maximum(first[mask], second[mask])
+            parent[high] = low
+            first = self.find_many_numpy(first[mask])
+            second = self.find_many_numpy(second[mask])
+
+        # Move the sizes of the linked roots to their new roots.
+        sizes = np.frombuffer(self.set_sizes, dtype=np.int64)
+        new_roots = self.find_many_numpy(old_roots)
+        old_sizes = sizes[old_roots].copy()
+        sizes[old_roots] = 0
+        np.add.at(sizes, new_roots, old_sizes)
+
+        num_merged: int = len(old_roots) - len(_sorted_unique(new_roots))
+        self.num_disjoint_sets -= num_merged
+        return num_merged
+
+
+class RollbackUnionFind:
+    """A UnionFind data structure whose unions can be undone.
+
+    It uses union by rank without path compression, so each union changes
+    a constant number of entries. The changes are recorded in a history,
+    and rollback() undoes them in reverse order in time proportional to
+    the number of changes undone.
+
+    Attributes
+    ----------
+    parent : array of int
+        Maps each element to its parent element. Roots are their own parent.
+    rank : array of int
+        An upper bound on the height of each root's tree.
+    set_sizes : array of int
+        The size of each set indexed by the set's root. Each non-root keeps
+        the size its set had when it was linked, so unions can be undone.
+    num_disjoint_sets : int
+        The number of disjoint sets.
+    history : list of tuple
+        The (small root, large root, rank increased) triple for each union
+        performed, in order.
+
+    Parameters
+    ----------
+    num_sets : int
+        The initial number of disjoint sets.
+    """
+
+    def __init__(self, num_sets: int):
+        self.parent: array = array("q", range(num_sets))
+        self.rank: array = array("q", [0]) * num_sets
+        self.set_sizes: array = array("q", [1]) * num_sets
+        self.num_disjoint_sets: int = num_sets
+        self.history: list = []
+
+    def find_set(self, label: int) -> int:
+        """Find the set ID to which the given element belongs.
+
+        Parameters
+        ----------
+        label : int
+            The label of the element to lookup.
+
+        Returns
+        -------
+        int
+            The ID of the set to which the given element belongs.
+        """
+        parent: array = self.parent
+        if label < 0 or label >= len(parent):
+            raise IndexError
+        while parent[label] != label:
+            label = parent[label]
+        return label
+
+    def are_disjoint(self, label1: int, label2: int) -> bool:
+        """Checks whether two elements are in different sets.
+
+        Parameters
+        ----------
+        label1 : int
+            The label of the first element.
+        label2 : int
+            The label of the second element.
+
+        Returns
+        -------
+        bool
+            True if the elements are in different sets and False otherwise.
+        """
+        return self.find_set(label1) != self.find_set(label2)
+
+    def union_sets(self, label1: int, label2: int) -> bool:
+        """Union two disjoint sets into a single set.
+
+        Parameters
+        ----------
+        label1 : int
+            The label of the first element.
+        label2 : int
+            The label of the second element.
+
+        Returns
+        -------
+        bool
+            True if the sets were merged and False if the elements were
+            already in the same set.
+        """
+        set1_label: int = self.find_set(label1)
+        set2_label: int = self.find_set(label2)
+        if set1_label == set2_label:
+            return False
+
+        if self.rank[set1_label] < self.rank[set2_label]:
+            small: int = set1_label
+            large: int = set2_label
+        else:
+            small = set2_label
+            large = set1_label
+
+        rank_increased: bool = self.rank[small] == self.rank[large]
+        if rank_increased:
+            self.rank[large] += 1
+        self.parent[small] = large
+        self.set_sizes[large] += self.set_sizes[small]
+        self.num_disjoint_sets -= 1
+        self.history.append((small, large, rank_increased))
+        return True
+
+    def checkpoint(self) -> int:
+        """Return a marker for the current state that can be passed to rollback().
+
+        Returns
+        -------
+        int
+            The number of unions performed so far.
+        """
+        return len(self.history)
+
+    def rollback(self, checkpoint: int):
+        """Undo every union performed since a checkpoint.
+
+        Parameters
+        ----------
+        checkpoint : int
+            A value returned by checkpoint().
+        """
+        if checkpoint < 0 or checkpoint > len(self.history):
+            raise ValueError(f"Invalid checkpoint {checkpoint}.")
+
+        while len(self.history) > checkpoint:
+            small, large, rank_increased = self.history.pop()
+            self.parent[small] = small
+            self.set_sizes[large] -= self.set_sizes[small]
+            if rank_increased:
+                self.rank[large] -= 1
+            self.num_disjoint_sets += 1
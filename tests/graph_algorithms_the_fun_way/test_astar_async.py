@@ -0,0 +1,95 @@
+import asyncio
+import math
+import random
+import unittest
+
+from graph_algorithms_the_fun_way.astar_async import AsyncWorld, astar_dynamic_async
+from graph_algorithms_the_fun_way.astar_generate import CachedWorld, World, astar_dynamic
+from graph_algorithms_the_fun_way.graph import Graph
+
+
+def make_random_world_graph(num_nodes: int, max_dist: float) -> Graph:
+    """Make an undirected graph of random points connecting each pair of
+    points within max_dist by an edge weighted by their distance.
+    """
+    g = Graph(num_nodes, undirected=True)
+    for i in range(num_nodes):
+        g.nodes[i].label = [10.0 * random.random(), 10.0 * random.random()]
+    for i in range(num_nodes):
+        for j in range(i + 1, num_nodes):
+            pos1 = g.nodes[i].label
+            pos2 = g.nodes[j].label
+            dist = math.sqrt((pos1[0] - pos2[0]) ** 2 + (pos1[1] - pos2[1]) ** 2)
+            if dist < max_dist:
+                g.insert_edge(i, j, dist)
+    return g
+
+
+class TestAStarAsync(unittest.TestCase):
+    def test_astar_dynamic_async(self):
+        """Test the asynchronous A* search on the graph from Figure 8-8."""
+        g = Graph(7, undirected=True)
+        g.insert_edge(0, 1, 2.0)
+        g.insert_edge(0, 2, 2.83)
+        g.insert_edge(0, 3, 3.0)
+        g.insert_edge(1, 4, 1.41)
+        g.insert_edge(2, 3, 2.24)
+        g.insert_edge(3, 5, 1.14)
+        g.insert_edge(4, 6, 2.24)
+        g.insert_edge(5, 6, 3.16)
+        g.insert_edge(2, 4, 3.5)
+
+        g.nodes[0].label = [0, 0]
+        g.nodes[1].label = [0, 2]
+        g.nodes[2].label = [2, 2]
+        g.nodes[3].label = [3, 0]
+        g.nodes[4].label = [1, 3]
+        g.nodes[5].label = [4, 1]
+        g.nodes[6].label = [3, 4]
+
+        for prefetch in [1, 3]:
+            last = asyncio.run(astar_dynamic_async(AsyncWorld(World(g, 0, 6)), prefetch=prefetch))
+            expected = [-1, 0, 0, 0, 1, 6, 4]
+            for i in range(7):
+                self.assertEqual(last[i], expected[i])
+
+        with self.assertRaises(ValueError):
+            asyncio.run(astar_dynamic_async(AsyncWorld(World(g, 0, 6)), prefetch=0))
+        with self.assertRaises(ValueError):
+            asyncio.run(astar_dynamic_async(AsyncWorld(World(g, 0, 6)), max_concurrency=0))
+
+    def test_matches_astar_dynamic(self):
+        """Test that the asynchronous search returns the same mapping as astar_dynamic."""
+        random.seed(13)
+        for trial in range(5):
+            g = make_random_world_graph(60, 2.5)
+            w = World(g, trial, 59 - trial)
+            expected = astar_dynamic(w)
+
+            for prefetch, max_concurrency in [(1, 1), (4, 2), (8, 8)]:
+                async_world = AsyncWorld(CachedWorld(w))
+                last = asyncio.run(astar_dynamic_async(async_world, prefetch, max_concurrency))
+                self.assertEqual(last, expected)
+                self.assertLessEqual(async_world.max_in_flight, max_concurrency)
+                self.assertEqual(async_world.in_flight, 0)
+
+    def test_concurrent_lookups(self):
+        """Test that prefetching overlaps the simulated latency of the lookups."""
+        random.seed(14)
+        g = make_random_world_graph(60, 2.5)
+        w = World(g, 0, 59)
+        expected = astar_dynamic(w)
+
+        serial_world = AsyncWorld(w, latency=0.002)
+        self.assertEqual(asyncio.run(astar_dynamic_async(serial_world, 1, 1)), expected)
+        self.assertEqual(serial_world.max_in_flight, 1)
+
+        concurrent_world = AsyncWorld(w, latency=0.002)
+        self.assertEqual(asyncio.run(astar_dynamic_async(concurrent_world, 4, 16)), expected)
+        self.assertGreater(concurrent_world.max_in_flight, 1)
+        self.assertLessEqual(concurrent_world.max_in_flight, 16)
+        self.assertEqual(concurrent_world.in_flight, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,138 @@
+import math
+import random
 import unittest
 
-from graph_algorithms_the_fun_way.astar_generate import astar_dynamic, World
+from graph_algorithms_the_fun_way.astar_generate import (
+    astar_dynamic,
+    CachedWorld,
+    ida_star,
+    sma_star,
+    World,
+)
 from graph_algorithms_the_fun_way.graph import Graph
 
 
+def make_figure_8_8_graph() -> Graph:
+    """Make the graph from Figure 8-8 with each node labeled by its position."""
+    g = Graph(7, undirected=True)
+    g.insert_edge(0, 1, 2.0)
+    g.insert_edge(0, 2, 2.83)
+    g.insert_edge(0, 3, 3.0)
+    g.insert_edge(1, 4, 1.41)
+    g.insert_edge(2, 3, 2.24)
+    g.insert_edge(3, 5, 1.14)
+    g.insert_edge(4, 6, 2.24)
+    g.insert_edge(5, 6, 3.16)
+    g.insert_edge(2, 4, 3.5)
+
+    g.nodes[0].label = [0, 0]
+    g.nodes[1].label = [0, 2]
+    g.nodes[2].label = [2, 2]
+    g.nodes[3].label = [3, 0]
+    g.nodes[4].label = [1, 3]
+    g.nodes[5].label = [4, 1]
+    g.nodes[6].label = [3, 4]
+    return g
+
+
+def make_random_world_graph(num_nodes: int, max_dist: float) -> Graph:
+    """Make an undirected graph of random points connecting each pair of
+    points within max_dist by an edge weighted by their distance.
+    """
+    g = Graph(num_nodes, undirected=True)
+    for i in range(num_nodes):
+        g.nodes[i].label = [10.0 * random.random(), 10.0 * random.random()]
+    for i in range(num_nodes):
+        for j in range(i + 1, num_nodes):
+            pos1 = g.nodes[i].label
+            pos2 = g.nodes[j].label
+            dist = math.sqrt((pos1[0] - pos2[0]) ** 2 + (pos1[1] - pos2[1]) ** 2)
+            if dist < max_dist:
+                g.insert_edge(i, j, dist)
+    return g
+
+
+def last_dict_cost(g: Graph, last: dict, goal: int) -> float:
+    """Compute the cost of the path to the goal in a last dictionary (inf if there is none)."""
+    if goal not in last:
+        return math.inf
+    cost = 0.0
+    current = goal
+    while last[current] != -1:
+        cost += g.get_edge(last[current], current).weight
+        current = last[current]
+    return cost
+
+
+class CountingWorld(World):
+    """A World that counts the calls to each of its lookup functions."""
+
+    def __init__(self, g: Graph, start_ind: int, goal_ind: int):
+        super().__init__(g, start_ind, goal_ind)
+        self.counts = {"neighbors": 0, "cost": 0, "heuristic": 0}
+
+    def get_neighbors(self, state: int) -> set:
+        """Get the neighbors of a state and count the call."""
+        self.counts["neighbors"] += 1
+        return super().get_neighbors(state)
+
+    def get_cost(self, from_state: int, to_state: int) -> float:
+        """Get the cost of moving between two states and count the call."""
+        self.counts["cost"] += 1
+        return super().get_cost(from_state, to_state)
+
+    def get_heuristic(self, state: int) -> float:
+        """Get the heuristic for a state and count the call."""
+        self.counts["heuristic"] += 1
+        return super().get_heuristic(state)
+
+
+class BlockedWorld(World):
+    """A World that hides a set of blocked states from get_neighbors()."""
+
+    def __init__(self, g: Graph, start_ind: int, goal_ind: int, blocked: set):
+        super().__init__(g, start_ind, goal_ind)
+        self.blocked = blocked
+
+    def get_neighbors(self, state: int) -> set:
+        """Get the neighbors of a state that are not blocked."""
+        return super().get_neighbors(state) - self.blocked
+
+
+def make_random_directed_world_graph(seed: int) -> Graph:
+    """Make a small random graph (directed or undirected) of points with edge
+    weights of at least the distance between their points."""
+    random.seed(seed)
+    num_nodes = random.randint(3, 14)
+    g = Graph(num_nodes, undirected=random.random() < 0.5)
+    for i in range(num_nodes):
+        g.nodes[i].label = [random.random() * 5, random.random() * 5]
+    for _ in range(random.randint(num_nodes, 3 * num_nodes)):
+        a = random.randrange(num_nodes)
+        b = random.randrange(num_nodes)
+        if a != b and not g.is_edge(a, b):
+            dist = math.dist(g.nodes[a].label, g.nodes[b].label)
+            g.insert_edge(a, b, dist * random.uniform(1, 2))
+    return g
+
+
+class LimitedWorld(World):
+    """A World that raises an error once too many states have been checked as
+    goals, so a search that never finishes fails instead of hanging."""
+
+    def __init__(self, g: Graph, start_ind: int, goal_ind: int, max_checks: int):
+        super().__init__(g, start_ind, goal_ind)
+        self.num_checks = 0
+        self.max_checks = max_checks
+
+    def is_goal(self, state: int) -> bool:
+        """Check whether a state is the goal, raising an error after max_checks calls."""
+        self.num_checks += 1
+        if self.num_checks > self.max_checks:
+            raise RuntimeError("The search did not finish.")
+        return super().is_goal(state)
+
+
 class TestAStarGenerate(unittest.TestCase):
     def test_build_graph_from_points(self):
         """Test the dynamic A* search from Figure 8-8."""
@@ -33,6 +162,186 @@ class TestAStarGenerate(unittest.TestCase):
         for i in range(7):
             self.assertEqual(last[i], expected[i])
 
+    def test_ida_star(self):
+        """Test IDA* on the graph from Figure 8-8."""
+        g = make_figure_8_8_graph()
+        last = ida_star(World(g, 0, 6))
+        self.assertEqual(last, {0: -1, 1: 0, 4: 1, 6: 4})
+
+        last = ida_star(World(g, 3, 3))
+        self.assertEqual(last, {3: -1})
+
+        g.insert_node(label=[10, 10])
+        last = ida_star(World(g, 0, 7))
+        self.assertEqual(last, {0: -1})
+
+    def test_sma_star(self):
+        """Test SMA* on the graph from Figure 8-8."""
+        g = make_figure_8_8_graph()
+        for max_nodes in [4, 5, 10, 100]:
+            last = sma_star(World(g, 0, 6), max_nodes)
+            self.assertEqual(last, {0: -1, 1: 0, 4: 1, 6: 4})
+
+        # The path needs 4 nodes, so it cannot be found with less memory.
+        self.assertEqual(sma_star(World(g, 0, 6), 3), {0: -1})
+        self.assertEqual(sma_star(World(g, 3, 3), 1), {3: -1})
+
+        g.insert_node(label=[10, 10])
+        self.assertEqual(sma_star(World(g, 0, 7), 5), {0: -1})
+
+        with self.assertRaises(ValueError):
+            sma_star(World(g, 0, 6), 0)
+
+    def test_memory_bounded_random(self):
+        """Test that IDA* and SMA* find optimal paths on random worlds."""
+        random.seed(11)
+        for trial in range(5):
+            g = make_random_world_graph(40, 3.0)
+            goal = 39 - trial
+            w = World(g, trial, goal)
+            expected = last_dict_cost(g, astar_dynamic(w), goal)
+
+            self.assertAlmostEqual(last_dict_cost(g, ida_star(w), goal), expected)
+            for max_nodes in [15, 30, 1000]:
+                self.assertAlmostEqual(last_dict_cost(g, sma_star(w, max_nodes), goal), expected)
+
+    def test_sma_star_small_memory_finishes(self):
+        """Test that SMA* finishes with small memory bounds on worlds where a
+        dead end could otherwise keep pushing the goal path out of memory."""
+        g = make_random_directed_world_graph(12)
+        last = sma_star(LimitedWorld(g, 0, g.num_nodes - 1, 10000), 3)
+        self.assertEqual(last, {0: -1, 8: 0, 9: 8})
+
+        for seed in range(40):
+            g = make_random_directed_world_graph(seed)
+            goal = g.num_nodes - 1
+            expected = last_dict_cost(g, astar_dynamic(World(g, 0, goal)), goal)
+            for max_nodes in range(1, g.num_nodes + 3):
+                last = sma_star(LimitedWorld(g, 0, goal, 10000), max_nodes)
+                cost = last_dict_cost(g, last, goal)
+                if max_nodes > g.num_nodes:
+                    self.assertAlmostEqual(cost, expected)
+                else:
+                    self.assertGreaterEqual(cost, expected - 1e-9)
+
+    def test_unreachable_goal(self):
+        """Test that IDA* and SMA* give up on an unreachable goal after max_expansions."""
+        random.seed(15)
+        g = make_random_world_graph(30, 4.0)
+        goal = g.insert_node(label=[20.0, 20.0]).index
+
+        for max_expansions in [1, 10, 1000]:
+            w = CountingWorld(g, 0, goal)
+            self.assertEqual(ida_star(w, max_expansions=max_expansions), {0: -1})
+            self.assertLessEqual(w.counts["neighbors"], max_expansions)
+
+            w = CountingWorld(g, 0, goal)
+            self.assertEqual(sma_star(w, 10, max_expansions=max_expansions), {0: -1})
+            self.assertLessEqual(w.counts["neighbors"], max_expansions)
+
+        # The limit does not change the path when the goal is found in time.
+        g = make_figure_8_8_graph()
+        self.assertEqual(ida_star(World(g, 0, 6), max_expansions=100), {0: -1, 1: 0, 4: 1, 6: 4})
+        self.assertEqual(sma_star(World(g, 0, 6), 5, max_expansions=100), {0: -1, 1: 0, 4: 1, 6: 4})
+        self.assertEqual(ida_star(World(g, 0, 6), max_expansions=1), {0: -1})
+
+    def test_world_lookups(self):
+        """Test the World's cost and batched neighbor lookups."""
+        g = make_figure_8_8_graph()
+        w = World(g, 0, 6)
+        self.assertEqual(w.get_cost(0, 1), 2.0)
+        self.assertEqual(w.get_cost(0, 6), math.inf)
+        self.assertEqual(w.get_neighbors_with_costs(0), [(1, 2.0), (2, 2.83), (3, 3.0)])
+        self.assertEqual([x for x, _ in w.get_neighbors_with_costs(4)], list(w.get_neighbors(4)))
+
+    def test_world_overrides(self):
+        """Test that the searches use a World subclass's neighbor and cost lookups."""
+        g = Graph(3, undirected=True)
+        g.insert_edge(0, 1, 1.0)
+        g.insert_edge(1, 2, 1.0)
+        g.insert_edge(0, 2, 5.0)
+        for i in range(3):
+            g.nodes[i].label = [0, 0]
+
+        w = BlockedWorld(g, 0, 2, {1})
+        self.assertEqual(w.get_neighbors_with_costs(0), [(2, 5.0)])
+        self.assertEqual(last_dict_cost(g, astar_dynamic(w), 2), 5.0)
+        self.assertEqual(last_dict_cost(g, astar_dynamic(CachedWorld(w)), 2), 5.0)
+        self.assertNotIn(1, astar_dynamic(w))
+        self.assertEqual(last_dict_cost(g, astar_dynamic(World(g, 0, 2)), 2), 2.0)
+
+    def test_cached_world(self):
+        """Test that the CachedWorld returns the same values and counts hits and misses."""
+        g = make_figure_8_8_graph()
+        w = CountingWorld(g, 0, 6)
+        cached = CachedWorld(w)
+        self.assertEqual(cached.get_num_states(), 7)
+        self.assertEqual(cached.get_start_index(), 0)
+        self.assertTrue(cached.is_goal(6))
+        self.assertEqual(cached.hit_rate("cost"), 0.0)
+
+        expected = World(g, 0, 6).get_neighbors_with_costs(2)
+        for _ in range(3):
+            self.assertEqual(cached.get_neighbors(0), {1, 2, 3})
+            self.assertEqual(cached.get_cost(0, 3), 3.0)
+            self.assertAlmostEqual(cached.get_heuristic(0), 5.0)
+            self.assertEqual(cached.get_neighbors_with_costs(2), expected)
+
+        # The batched lookup goes through the world's get_neighbors() and
+        # get_cost() once for state 2's three neighbors.
+        self.assertEqual(w.counts, {"neighbors": 2, "cost": 4, "heuristic": 1})
+        self.assertEqual(cached.hits["neighbors"], 2)
+        self.assertEqual(cached.misses["neighbors"], 1)
+        self.assertEqual(cached.misses["neighbors_with_costs"], 1)
+        self.assertAlmostEqual(cached.hit_rate("heuristic"), 2.0 / 3.0)
+
+        cached.clear()
+        self.assertEqual(cached.hits["neighbors"], 0)
+        self.assertEqual(len(cached.caches["neighbors"]), 0)
+
+        with self.assertRaises(ValueError):
+            CachedWorld(w, max_size=0)
+
+    def test_cached_world_lru(self):
+        """Test that the CachedWorld drops the least recently used entries."""
+        g = make_figure_8_8_graph()
+        w = CountingWorld(g, 0, 6)
+        cached = CachedWorld(w, max_size=2)
+
+        cached.get_heuristic(0)
+        cached.get_heuristic(1)
+        cached.get_heuristic(0)
+        cached.get_heuristic(2)  # Drops state 1.
+        self.assertEqual(list(cached.caches["heuristic"].keys()), [0, 2])
+        self.assertEqual(w.counts["heuristic"], 3)
+
+        cached.get_heuristic(1)
+        self.assertEqual(w.counts["heuristic"], 4)
+        self.assertEqual(list(cached.caches["heuristic"].keys()), [2, 1])
+
+    def test_astar_dynamic_cached(self):
+        """Test that A* returns the same result with a cached world while calling the world less."""
+        random.seed(12)
+        for trial in range(5):
+            g = make_random_world_graph(60, 2.5)
+            goal = 59 - trial
+
+            w = CountingWorld(g, trial, goal)
+            expected = astar_dynamic(w)
+            self.assertGreater(w.counts["neighbors"], 0)
+            self.assertGreater(w.counts["cost"], 0)
+
+            w2 = CountingWorld(g, trial, goal)
+            cached = CachedWorld(w2)
+            self.assertEqual(astar_dynamic(cached), expected)
+            self.assertEqual(ida_star(cached), ida_star(w))
+
+            num_heuristic = w2.counts["heuristic"]
+            self.assertLessEqual(num_heuristic, w.counts["heuristic"])
+            self.assertLessEqual(num_heuristic, 60)
+            self.assertEqual(astar_dynamic(cached), expected)
+            self.assertEqual(w2.counts["heuristic"], num_heuristic)
+
 
 if __name__ == "__main__":
     unittest.main()
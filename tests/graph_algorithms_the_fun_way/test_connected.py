@@ -1,7 +1,13 @@
+import random
 import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
 
 from graph_algorithms_the_fun_way.connected import *
-from graph_algorithms_the_fun_way.graph import Graph, edge_in_list
+from graph_algorithms_the_fun_way.csr_graph import make_csr_graph, make_csr_graph_from_edges
+from graph_algorithms_the_fun_way.file_reader import read_edge_stream, save_edges_to_csv
+from graph_algorithms_the_fun_way.graph import Edge, Graph, edge_in_list
+from graph_algorithms_the_fun_way.search import dfs_connected_components
 
 
 class TestGraphConnected(unittest.TestCase):
@@ -698,6 +704,319 @@ class TestGraphConnected(unittest.TestCase):
         self.assertEqual(stats.parent, [-1, 0, 1, 1, 3])
         self.assertEqual(stats.order, [0, 1, 2, 3, 4])
 
+    def test_iterative_dfs_matches_recursive(self):
+        """Test that the iterative DFS functions match the recursive ones."""
+        random.seed(4)
+        for trial in range(5):
+            g = Graph(40, undirected=True)
+            g.add_random_edges(45, allow_self_edges=False)
+
+            seen1 = [False] * g.num_nodes
+            seen2 = [False] * g.num_nodes
+            reachable1 = []
+            reachable2 = []
+            add_reachable(g, trial, seen1, reachable1)
+            add_reachable_iterative(g, trial, seen2, reachable2)
+            self.assertEqual(seen1, seen2)
+            self.assertEqual(reachable1, reachable2)
+
+            stats1 = DFSTreeStats(g.num_nodes)
+            stats2 = DFSTreeStats(g.num_nodes)
+            results1 = []
+            results2 = []
+            bridge_finding_dfs(g, trial, stats1, results1)
+            bridge_finding_dfs_iterative(g, trial, stats2, results2)
+            self.assertEqual(stats1.order, stats2.order)
+            self.assertEqual(stats1.lowest, stats2.lowest)
+            self.assertEqual(stats1.parent, stats2.parent)
+            self.assertEqual(results1, results2)
+
+            stats1 = DFSTreeStats(g.num_nodes)
+            stats2 = DFSTreeStats(g.num_nodes)
+            results1 = set()
+            results2 = set()
+            articulation_point_dfs(g, trial, stats1, results1)
+            articulation_point_dfs_iterative(g, trial, stats2, results2)
+            self.assertEqual(stats1.order, stats2.order)
+            self.assertEqual(stats1.lowest, stats2.lowest)
+            self.assertEqual(stats1.parent, stats2.parent)
+            self.assertEqual(results1, results2)
+
+    def test_deep_chain(self):
+        """Test the DFS-based functions on a chain much deeper than the recursion limit."""
+        num_nodes = 20000
+        g = Graph(num_nodes, undirected=True)
+        for i in range(num_nodes - 1):
+            g.insert_edge(i, i + 1, 1.0)
+
+        self.assertEqual(len(find_bridges(g)), num_nodes - 1)
+        self.assertEqual(find_articulation_points(g), set(range(1, num_nodes - 1)))
+
+        g2 = Graph(num_nodes, undirected=False)
+        for i in range(num_nodes - 1):
+            g2.insert_edge(i + 1, i, 1.0)
+        g2.insert_edge(0, num_nodes - 1, 1.0)
+        components = kosaraju_sharir(g2)
+        self.assertEqual(len(components), 1)
+        self.assertEqual(len(components[0]), num_nodes)
+
+    def test_tarjan_scc_figure_12_5(self):
+        """Test the Tarjan SCC finder on an example graph."""
+        g = Graph(6, undirected=False)
+        g.insert_edge(0, 2, 1.0)
+        g.insert_edge(1, 0, 1.0)
+        g.insert_edge(2, 3, 1.0)
+        g.insert_edge(3, 0, 1.0)
+        g.insert_edge(3, 5, 1.0)
+        g.insert_edge(4, 5, 1.0)
+        g.insert_edge(5, 4, 1.0)
+
+        components, component, condensation = tarjan_scc(g)
+        self.assertEqual(components, [[1], [0, 2, 3], [4, 5]])
+        self.assertEqual(list(component), [1, 0, 1, 1, 2, 2])
+        self.assertEqual(condensation.num_nodes, 3)
+        self.assertEqual(len(condensation.make_edge_list()), 2)
+        self.assertTrue(condensation.is_edge(0, 1))
+        self.assertTrue(condensation.is_edge(1, 2))
+
+    def test_tarjan_scc_matches_kosaraju(self):
+        """Test that the Tarjan SCC finder matches Kosaraju-Sharir on random graphs."""
+        for _ in range(50):
+            num_nodes = random.randint(1, 40)
+            g = Graph(num_nodes, undirected=False)
+            g.add_random_edges(random.randint(0, 2 * num_nodes))
+
+            components, component, condensation = tarjan_scc(g)
+            expected = set(frozenset(c) for c in kosaraju_sharir(g))
+            self.assertEqual(set(frozenset(c) for c in components), expected)
+            self.assertEqual(len(components), condensation.num_nodes)
+
+            for c, nodes in enumerate(components):
+                self.assertEqual(nodes, sorted(nodes))
+                for index in nodes:
+                    self.assertEqual(component[index], c)
+
+            # Every edge must go forward in the topological order.
+            for edge in g.make_edge_list():
+                from_c = component[edge.from_node]
+                to_c = component[edge.to_node]
+                self.assertLessEqual(from_c, to_c)
+                if from_c != to_c:
+                    self.assertTrue(condensation.is_edge(from_c, to_c))
+            self.assertEqual(
+                len(condensation.make_edge_list()),
+                len(
+                    set((component[e.from_node], component[e.to_node]) for e in g.make_edge_list())
+                    - set((c, c) for c in range(len(components)))
+                ),
+            )
+
+    def test_tarjan_scc_deep_cycle(self):
+        """Test the Tarjan SCC finder on a cycle much deeper than the recursion limit."""
+        num_nodes = 20000
+        g = Graph(num_nodes, undirected=False)
+        for i in range(num_nodes - 1):
+            g.insert_edge(i, i + 1, 1.0)
+        g.insert_edge(num_nodes - 1, 0, 1.0)
+
+        components, component, condensation = tarjan_scc(g)
+        self.assertEqual(components, [list(range(num_nodes))])
+        self.assertEqual(condensation.num_nodes, 1)
+
+    def test_biconnected_components_simple(self):
+        """Test the biconnected components on two triangles joined by a bridge."""
+        g = Graph(7, undirected=True)
+        g.insert_edge(0, 1, 1.0)
+        g.insert_edge(1, 2, 1.0)
+        g.insert_edge(2, 0, 1.0)
+        g.insert_edge(2, 3, 1.0)
+        g.insert_edge(3, 4, 1.0)
+        g.insert_edge(4, 5, 1.0)
+        g.insert_edge(5, 3, 1.0)
+
+        bridges, points, blocks, tree = biconnected_components(g)
+        self.assertEqual(len(bridges), 1)
+        self.assertEqual(set([bridges[0].from_node, bridges[0].to_node]), set([2, 3]))
+        self.assertEqual(points, set([2, 3]))
+        self.assertEqual(sorted(blocks), [[0, 1, 2], [2, 3], [3, 4, 5]])
+
+        self.assertEqual(tree.num_nodes, 5)
+        labels = [node.label for node in tree.nodes]
+        self.assertEqual(labels, ["block_0", "block_1", "block_2", "cut_2", "cut_3"])
+        self.assertEqual(len(tree.make_edge_list()), 8)
+        for i, block in enumerate(blocks):
+            for v, cut_node in [(2, 3), (3, 4)]:
+                self.assertEqual(tree.is_edge(i, cut_node), v in block)
+
+    def test_biconnected_components_random(self):
+        """Test the biconnected components against the separate searches on random graphs."""
+        for _ in range(50):
+            num_nodes = random.randint(1, 30)
+            g = Graph(num_nodes, undirected=True)
+            g.add_random_edges(random.randint(0, 2 * num_nodes))
+
+            bridges, points, blocks, tree = biconnected_components(g)
+            expected_bridges = set((e.from_node, e.to_node) for e in find_bridges(g))
+            self.assertEqual(set((e.from_node, e.to_node) for e in bridges), expected_bridges)
+            self.assertEqual(points, find_articulation_points(g))
+
+            # Every edge is in exactly one block.
+            for edge in g.make_edge_list():
+                if edge.from_node != edge.to_node:
+                    count = sum(1 for b in blocks if edge.from_node in b and edge.to_node in b)
+                    self.assertEqual(count, 1)
+
+            # Only articulation points are in more than one block, and each block
+            # larger than a single edge has no articulation point of its own.
+            for v in range(num_nodes):
+                count = sum(1 for b in blocks if v in b)
+                self.assertEqual(count > 1, v in points)
+            for block in blocks:
+                if len(block) > 2:
+                    sub = Graph(len(block), undirected=True)
+                    for i, u in enumerate(block):
+                        for j, v in enumerate(block):
+                            if i < j and g.is_edge(u, v):
+                                sub.insert_edge(i, j, 1.0)
+                    self.assertEqual(find_articulation_points(sub), set())
+
+            self.assertEqual(tree.num_nodes, len(blocks) + len(points))
+            self.assertEqual(len(tree.make_edge_list()), 2 * sum(len(set(b) & points) for b in blocks))
+
+    def test_biconnected_components_deep_chain(self):
+        """Test the biconnected components on a chain much deeper than the recursion limit."""
+        num_nodes = 20000
+        g = Graph(num_nodes, undirected=True)
+        for i in range(num_nodes - 1):
+            g.insert_edge(i, i + 1, 1.0)
+
+        bridges, points, blocks, tree = biconnected_components(g)
+        self.assertEqual(len(bridges), num_nodes - 1)
+        self.assertEqual(points, set(range(1, num_nodes - 1)))
+        self.assertEqual(len(blocks), num_nodes - 1)
+
+    def test_exhaustive_checks_do_not_modify(self):
+        """Test that the exhaustive bridge and articulation point searches leave the graph unchanged."""
+        g = Graph(5, undirected=True)
+        g.insert_edge(0, 1, 2.5)
+        g.insert_edge(1, 2, 3.0)
+        g.insert_edge(2, 0, 0.5)
+        g.insert_edge(2, 3, 4.0)
+        g.insert_edge(3, 4, 1.5)
+        g2 = g.make_copy()
+
+        bridges = find_bridges_exh(g)
+        self.assertEqual(set((e.from_node, e.to_node) for e in bridges), set([(2, 3), (3, 4)]))
+        self.assertEqual(sorted(find_articulation_points_exh(g)), [2, 3])
+        self.assertTrue(g.is_same_structure(g2))
+        for edge in g2.make_edge_list():
+            self.assertEqual(g.get_edge(edge.from_node, edge.to_node).weight, edge.weight)
+
+    def test_verify_random(self):
+        """Test the certificate checks against the exhaustive searches on random graphs."""
+        for _ in range(30):
+            num_nodes = random.randint(1, 25)
+            g = Graph(num_nodes, undirected=True)
+            g.add_random_edges(random.randint(0, 2 * num_nodes))
+            g2 = g.make_copy()
+
+            expected = set((e.from_node, e.to_node) for e in find_bridges_exh(g))
+            candidates = [(i, j) for i in range(num_nodes) for j in range(num_nodes)]
+            results = verify_bridges(g, candidates)
+            for (i, j), result in zip(candidates, results):
+                self.assertEqual(result, (min(i, j), max(i, j)) in expected)
+            self.assertEqual(
+                verify_bridges(g, g.make_edge_list()),
+                [
+                    (min(e.from_node, e.to_node), max(e.from_node, e.to_node)) in expected
+                    for e in g.make_edge_list()
+                ],
+            )
+
+            points = set(find_articulation_points_exh(g))
+            self.assertEqual(points, find_articulation_points(g))
+            results = verify_articulation_points(g, list(range(num_nodes)))
+            self.assertEqual(results, [i in points for i in range(num_nodes)])
+            self.assertTrue(g.is_same_structure(g2))
+
+    def test_verify_process_pool(self):
+        """Test that the certificate checks give the same results over a process pool."""
+        num_nodes = 200
+        g = Graph(num_nodes, undirected=True)
+        g.add_random_edges(250)
+        candidates = [(e.from_node, e.to_node) for e in g.make_edge_list()] + [(0, 0)]
+
+        self.assertEqual(verify_bridges(g, candidates, num_workers=2), verify_bridges(g, candidates))
+        nodes = list(range(num_nodes))
+        self.assertEqual(
+            verify_articulation_points(g, nodes, num_workers=2), verify_articulation_points(g, nodes)
+        )
+        self.assertRaises(ValueError, verify_articulation_points, g, nodes, 0)
+        self.assertRaises(IndexError, verify_articulation_points, g, [num_nodes])
+
+    def test_union_find_components(self):
+        """Test that union-find components match the DFS components."""
+        for _ in range(20):
+            num_nodes = random.randint(1, 60)
+            g = Graph(num_nodes, undirected=True)
+            for _ in range(random.randint(0, num_nodes)):
+                g.insert_edge(random.randint(0, num_nodes - 1), random.randint(0, num_nodes - 1), 1.0)
+
+            expected = dfs_connected_components(g)
+            component, sizes = union_find_components(num_nodes, g.make_edge_list())
+            self.assertEqual(component, expected)
+            self.assertEqual(sizes, [expected.count(i) for i in range(len(sizes))])
+            self.assertEqual(len(sizes), max(expected) + 1)
+
+    @unittest.skipIf(np is None, "requires numpy")
+    def test_label_propagation_components(self):
+        """Test that label propagation components match the DFS components."""
+        for _ in range(20):
+            num_nodes = random.randint(1, 60)
+            g = Graph(num_nodes, undirected=True)
+            for _ in range(random.randint(0, num_nodes)):
+                g.insert_edge(random.randint(0, num_nodes - 1), random.randint(0, num_nodes - 1), 1.0)
+
+            expected = dfs_connected_components(g)
+            component, sizes = label_propagation_components(make_csr_graph(g))
+            self.assertEqual(component.tolist(), expected)
+            self.assertEqual(sizes.tolist(), [expected.count(i) for i in range(len(sizes))])
+
+    @unittest.skipIf(np is None, "requires numpy")
+    def test_label_propagation_directed(self):
+        """Test that label propagation follows directed edges both ways."""
+        g = Graph(6, undirected=False)
+        g.insert_edge(5, 0, 1.0)
+        g.insert_edge(3, 5, 1.0)
+        g.insert_edge(2, 4, 1.0)
+        component, sizes = label_propagation_components(make_csr_graph(g))
+        self.assertEqual(component.tolist(), [0, 1, 2, 0, 2, 0])
+        self.assertEqual(sizes.tolist(), [3, 1, 2])
+
+    @unittest.skipIf(np is None, "requires numpy")
+    def test_components_from_edge_stream(self):
+        """Test that both component finders work on edges streamed from disk."""
+        num_nodes = 200
+        edges = []
+        for _ in range(150):
+            edges.append(Edge(random.randint(0, num_nodes - 1), random.randint(0, num_nodes - 1), 1.0))
+        g = Graph(num_nodes, undirected=True)
+        for edge in edges:
+            g.insert_edge(edge.from_node, edge.to_node, edge.weight)
+        expected = dfs_connected_components(g)
+
+        with TemporaryDirectory() as tmpdir:
+            filename = Path(tmpdir) / "edges.csv"
+            save_edges_to_csv(edges, filename)
+
+            component1, sizes1 = union_find_components(num_nodes, read_edge_stream(filename))
+            csr = make_csr_graph_from_edges(num_nodes, True, read_edge_stream(filename))
+            component2, sizes2 = label_propagation_components(csr)
+
+        self.assertEqual(component1, expected)
+        self.assertEqual(component2.tolist(), expected)
+        self.assertEqual(sizes1, sizes2.tolist())
+
 
 if __name__ == "__main__":
     unittest.main()
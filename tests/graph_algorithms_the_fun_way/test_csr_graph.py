@@ -0,0 +1,77 @@
+import unittest
+
+from graph_algorithms_the_fun_way.csr_graph import CSRGraph, make_csr_graph, make_csr_graph_from_edges
+from graph_algorithms_the_fun_way.graph import Edge, Graph
+
+
+class TestCSRGraph(unittest.TestCase):
+    def test_make_csr_graph(self):
+        """Test converting a directed Graph into a CSRGraph."""
+        g = Graph(5, undirected=False)
+        g.insert_edge(0, 1, 1.0)
+        g.insert_edge(0, 3, 2.0)
+        g.insert_edge(1, 2, 3.0)
+        g.insert_edge(3, 1, 4.0)
+        g.insert_edge(3, 4, 5.0)
+        g.insert_edge(4, 0, 6.0)
+
+        csr = make_csr_graph(g)
+        self.assertEqual(csr.num_nodes, 5)
+        self.assertFalse(csr.undirected)
+        self.assertEqual(csr.num_edges(), 6)
+        self.assertEqual(list(csr.offsets), [0, 2, 3, 3, 5, 6])
+        self.assertEqual(list(csr.targets), [1, 3, 2, 1, 4, 0])
+        self.assertEqual(list(csr.weights), [1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+
+        self.assertEqual(csr.out_degree(0), 2)
+        self.assertEqual(csr.out_degree(2), 0)
+        self.assertEqual(list(csr.get_neighbors(3)), [1, 4])
+        self.assertEqual(list(csr.get_neighbors(2)), [])
+
+    def test_make_transpose(self):
+        """Test transposing a CSRGraph."""
+        g = Graph(4, undirected=False)
+        g.insert_edge(0, 1, 1.0)
+        g.insert_edge(0, 2, 2.0)
+        g.insert_edge(1, 2, 3.0)
+        g.insert_edge(3, 2, 4.0)
+        g.insert_edge(2, 0, 5.0)
+
+        gT = make_csr_graph(g).make_transpose()
+        self.assertEqual(list(gT.offsets), [0, 1, 2, 5, 5])
+        self.assertEqual(list(gT.targets), [2, 0, 0, 1, 3])
+        self.assertEqual(list(gT.weights), [5.0, 1.0, 2.0, 3.0, 4.0])
+
+        # Undirected graphs are their own transpose.
+        g2 = Graph(3, undirected=True)
+        g2.insert_edge(0, 1, 1.0)
+        csr2 = make_csr_graph(g2)
+        self.assertIs(csr2.make_transpose(), csr2)
+
+    def test_make_csr_graph_from_edges(self):
+        """Test building a CSRGraph from a stream of edges."""
+        edges = [Edge(0, 1, 1.0), Edge(2, 1, 2.0), Edge(1, 3, 3.0), Edge(0, 2, 4.0)]
+
+        csr = make_csr_graph_from_edges(4, False, iter(edges))
+        self.assertEqual(list(csr.offsets), [0, 2, 3, 4, 4])
+        self.assertEqual(list(csr.targets), [1, 2, 3, 1])
+        self.assertEqual(list(csr.weights), [1.0, 4.0, 3.0, 2.0])
+
+        csr = make_csr_graph_from_edges(4, True, iter(edges))
+        self.assertEqual(csr.num_edges(), 8)
+        self.assertEqual(sorted(csr.get_neighbors(1)), [0, 2, 3])
+        self.assertEqual(sorted(csr.get_neighbors(3)), [1])
+
+        with self.assertRaises(IndexError):
+            make_csr_graph_from_edges(2, False, edges)
+
+    def test_invalid_arrays(self):
+        """Test that mismatched arrays are rejected."""
+        with self.assertRaises(ValueError):
+            CSRGraph(3, False, [0, 0, 0], [], [])
+        with self.assertRaises(ValueError):
+            CSRGraph(1, False, [0, 1], [0], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
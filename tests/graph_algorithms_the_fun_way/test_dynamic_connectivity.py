@@ -0,0 +1,177 @@
+import random
+import unittest
+
+from graph_algorithms_the_fun_way.connected import find_bridges
+from graph_algorithms_the_fun_way.dynamic_connectivity import (
+    IncrementalConnectivity,
+    offline_dynamic_connectivity,
+)
+from graph_algorithms_the_fun_way.graph import Graph
+from graph_algorithms_the_fun_way.search import breadth_first_search, dfs_connected_components
+
+
+def brute_force_connectivity(num_nodes: int, events: list) -> list:
+    """Answer each connectivity query by rebuilding the graph and running BFS."""
+    edge_counts = {}
+    answers = []
+    for kind, u, v in events:
+        edge = (min(u, v), max(u, v))
+        if kind == "insert":
+            edge_counts[edge] = edge_counts.get(edge, 0) + 1
+        elif kind == "delete":
+            edge_counts[edge] -= 1
+        else:
+            g = Graph(num_nodes, undirected=True)
+            for (a, b), count in edge_counts.items():
+                if count > 0:
+                    g.insert_edge(a, b, 1.0)
+            last = breadth_first_search(g, u)
+            answers.append(u == v or last[v] != -1)
+    return answers
+
+
+class TestOfflineDynamicConnectivity(unittest.TestCase):
+    def test_simple(self):
+        """Test connectivity queries while a small graph changes."""
+        events = [
+            ("query", 0, 1),
+            ("insert", 0, 1),
+            ("insert", 1, 2),
+            ("query", 0, 2),
+            ("delete", 1, 0),
+            ("query", 0, 2),
+            ("query", 1, 2),
+            ("insert", 0, 2),
+            ("query", 0, 1),
+            ("query", 3, 3),
+        ]
+        self.assertEqual(
+            offline_dynamic_connectivity(4, events),
+            [False, True, False, True, True, True],
+        )
+        self.assertEqual(offline_dynamic_connectivity(4, [("insert", 0, 1)]), [])
+
+    def test_multi_edges(self):
+        """Test that deleting one copy of a repeated edge keeps the other."""
+        events = [
+            ("insert", 0, 1),
+            ("insert", 1, 0),
+            ("delete", 0, 1),
+            ("query", 0, 1),
+            ("delete", 0, 1),
+            ("query", 0, 1),
+        ]
+        self.assertEqual(offline_dynamic_connectivity(2, events), [True, False])
+
+    def test_invalid(self):
+        """Test invalid events."""
+        with self.assertRaises(ValueError):
+            offline_dynamic_connectivity(3, [("delete", 0, 1)])
+        with self.assertRaises(ValueError):
+            offline_dynamic_connectivity(3, [("merge", 0, 1)])
+        with self.assertRaises(IndexError):
+            offline_dynamic_connectivity(3, [("insert", 0, 3)])
+
+    def test_random(self):
+        """Test random event sequences against rebuilding the graph for each query."""
+        random.seed(23)
+        for _ in range(20):
+            num_nodes = random.randint(1, 10)
+            events = []
+            present = []
+            for _ in range(60):
+                r = random.random()
+                if r < 0.35:
+                    u = random.randint(0, num_nodes - 1)
+                    v = random.randint(0, num_nodes - 1)
+                    events.append(("insert", u, v))
+                    present.append((u, v))
+                elif r < 0.55 and present:
+                    u, v = present.pop(random.randint(0, len(present) - 1))
+                    events.append(("delete", v, u))
+                else:
+                    events.append(
+                        ("query", random.randint(0, num_nodes - 1), random.randint(0, num_nodes - 1))
+                    )
+
+            self.assertEqual(
+                offline_dynamic_connectivity(num_nodes, events),
+                brute_force_connectivity(num_nodes, events),
+            )
+
+
+class TestIncrementalConnectivity(unittest.TestCase):
+    def test_simple(self):
+        """Test the bridges as a path is closed into a cycle."""
+        ic = IncrementalConnectivity(5)
+        self.assertEqual(ic.num_components, 5)
+        ic.insert_edge(0, 1)
+        ic.insert_edge(1, 2)
+        ic.insert_edge(2, 3)
+        self.assertEqual(ic.num_components, 2)
+        self.assertEqual(ic.num_bridges, 3)
+        self.assertTrue(ic.is_bridge(1, 2))
+        self.assertTrue(ic.is_bridge(2, 1))
+        self.assertFalse(ic.is_bridge(0, 2))
+        self.assertTrue(ic.are_connected(0, 3))
+        self.assertFalse(ic.are_connected(0, 4))
+
+        ic.insert_edge(3, 1)
+        self.assertEqual(ic.num_bridges, 1)
+        self.assertTrue(ic.is_bridge(0, 1))
+        self.assertFalse(ic.is_bridge(1, 2))
+        self.assertFalse(ic.is_bridge(1, 3))
+        self.assertEqual(ic.two_edge_component(1), ic.two_edge_component(3))
+        self.assertEqual([tuple(sorted(e)) for e in ic.get_bridges()], [(0, 1)])
+
+        # A repeated edge is not a bridge.
+        ic.insert_edge(1, 0)
+        self.assertEqual(ic.num_bridges, 0)
+        self.assertFalse(ic.is_bridge(0, 1))
+        self.assertRaises(IndexError, ic.insert_edge, 0, 5)
+        self.assertRaises(IndexError, ic.component, -1)
+
+    def test_random(self):
+        """Test random insertion sequences against recomputing from scratch."""
+        random.seed(7)
+        for _ in range(30):
+            num_nodes = random.randint(1, 25)
+            ic = IncrementalConnectivity(num_nodes)
+            g = Graph(num_nodes, undirected=True)
+            for _ in range(2 * num_nodes):
+                u = random.randint(0, num_nodes - 1)
+                v = random.randint(0, num_nodes - 1)
+                if u == v or g.is_edge(u, v):
+                    continue
+                ic.insert_edge(u, v)
+                g.insert_edge(u, v, 1.0)
+
+                expected = set(
+                    (min(e.from_node, e.to_node), max(e.from_node, e.to_node)) for e in find_bridges(g)
+                )
+                bridges = set((min(a, b), max(a, b)) for a, b in ic.get_bridges())
+                self.assertEqual(bridges, expected)
+                self.assertEqual(ic.num_bridges, len(expected))
+
+                # Each bridge is stored child end first, even after re-rooting.
+                for index in range(num_nodes):
+                    if ic.two_edge_component(index) == index and ic.tree_parent[index] != -1:
+                        a, b = ic.tree_edge[index]
+                        self.assertEqual(ic.two_edge_component(a), index)
+                        self.assertEqual(
+                            ic.two_edge_component(b), ic.two_edge_component(ic.tree_parent[index])
+                        )
+
+                for edge in g.make_edge_list():
+                    key = (min(edge.from_node, edge.to_node), max(edge.from_node, edge.to_node))
+                    self.assertEqual(ic.is_bridge(edge.from_node, edge.to_node), key in expected)
+
+                components = dfs_connected_components(g)
+                self.assertEqual(ic.num_components, max(components) + 1)
+                for a in range(num_nodes):
+                    for b in range(num_nodes):
+                        self.assertEqual(ic.are_connected(a, b), components[a] == components[b])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,9 +7,11 @@ from graph_algorithms_the_fun_way.file_reader import (
     make_graph_from_multi_csv,
     make_graph_from_weighted_csv,
     make_graph_from_weighted_csv2,
+    read_edge_stream,
+    save_edges_to_csv,
     save_graph_to_csv,
 )
-from graph_algorithms_the_fun_way.graph import Graph
+from graph_algorithms_the_fun_way.graph import Edge, Graph
 
 
 class TestFileReaders(unittest.TestCase):
@@ -104,6 +106,34 @@ class TestFileReaders(unittest.TestCase):
             self.assertEqual(f.read(), "0\n1\n2\n0,1,3.5\n1,0,2.5\n")
             f.close()
 
+    def test_save_edges(self):
+        """Check that we can save a stream of edges as a csv."""
+
+        def edge_stream():
+            for i in range(3):
+                yield Edge(i, i + 1, 0.5 * i)
+
+        with TemporaryDirectory() as dir_name:
+            filename = f"{dir_name}/test.csv"
+            self.assertEqual(save_edges_to_csv(edge_stream(), filename), 3)
+
+            f = open(filename, "r")
+            self.assertEqual(f.read(), "0,1,0.0\n1,2,0.5\n2,3,1.0\n")
+            f.close()
+
+    def test_read_edge_stream(self):
+        """Check that we can stream the edges back from a saved csv."""
+        edges = [Edge(0, 1, 0.0), Edge(1, 2, 0.5), Edge(2, 3, 1.0)]
+        with TemporaryDirectory() as dir_name:
+            filename = f"{dir_name}/test.csv"
+            save_edges_to_csv(edges, filename)
+            read_edges = list(read_edge_stream(filename))
+        self.assertEqual(len(read_edges), 3)
+        for edge, read_edge in zip(edges, read_edges):
+            self.assertEqual(edge.from_node, read_edge.from_node)
+            self.assertEqual(edge.to_node, read_edge.to_node)
+            self.assertEqual(edge.weight, read_edge.weight)
+
     def test_write_then_read(self):
         """Check that we can save a graph as a csv and reload it."""
         g1 = Graph(6, undirected=False)
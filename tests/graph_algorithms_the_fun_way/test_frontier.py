@@ -0,0 +1,73 @@
+import unittest
+
+from graph_algorithms_the_fun_way.frontier import DequeFrontier, RingBufferFrontier
+
+
+class TestFrontier(unittest.TestCase):
+    def test_deque_frontier(self):
+        """Test the basic operations of the DequeFrontier."""
+        f = DequeFrontier()
+        self.assertTrue(f.empty())
+        self.assertEqual(len(f), 0)
+
+        f.put(3)
+        f.put("a")
+        f.put(1)
+        self.assertFalse(f.empty())
+        self.assertEqual(len(f), 3)
+        self.assertEqual(f.get(), 3)
+        self.assertEqual(f.get(), "a")
+        f.put(7)
+        self.assertEqual(f.get(), 1)
+        self.assertEqual(f.get(), 7)
+        self.assertTrue(f.empty())
+
+        with self.assertRaises(IndexError):
+            f.get()
+
+    def test_ring_buffer_frontier(self):
+        """Test the basic operations of the RingBufferFrontier including wrapping around."""
+        f = RingBufferFrontier(3)
+        self.assertTrue(f.empty())
+        with self.assertRaises(IndexError):
+            f.get()
+
+        f.put(0)
+        f.put(1)
+        f.put(2)
+        self.assertEqual(len(f), 3)
+        with self.assertRaises(IndexError):
+            f.put(3)
+
+        self.assertEqual(f.get(), 0)
+        self.assertEqual(f.get(), 1)
+        f.put(3)
+        f.put(4)
+        self.assertEqual(len(f), 3)
+        self.assertEqual(f.get(), 2)
+        self.assertEqual(f.get(), 3)
+        self.assertEqual(f.get(), 4)
+        self.assertTrue(f.empty())
+
+    def test_frontiers_match(self):
+        """Test that both frontiers return the same sequence as each other."""
+        f1 = DequeFrontier()
+        f2 = RingBufferFrontier(40)
+        results1 = []
+        results2 = []
+        for i in range(50):
+            f1.put(i)
+            f2.put(i)
+            if i % 3 == 0:
+                results1.append(f1.get())
+                results2.append(f2.get())
+        while not f1.empty():
+            results1.append(f1.get())
+        while not f2.empty():
+            results2.append(f2.get())
+        self.assertEqual(results1, list(range(50)))
+        self.assertEqual(results2, list(range(50)))
+
+
+if __name__ == "__main__":
+    unittest.main()
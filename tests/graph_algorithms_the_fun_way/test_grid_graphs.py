@@ -1,13 +1,19 @@
+import random
 import unittest
 
 from graph_algorithms_the_fun_way.graph import make_graph_from_edges
 from graph_algorithms_the_fun_way.grid_graphs import (
+    ImplicitGridGraph,
     make_grid_graph,
     make_grid_with_obstacles,
     randomized_kruskals,
+    randomized_kruskals_stream,
+    recursive_backtracker_maze,
+    wilsons_maze,
 )
 from graph_algorithms_the_fun_way.mst import compute_sum_weights, is_spanning_tree
-from graph_algorithms_the_fun_way.search import breadth_first_search
+from graph_algorithms_the_fun_way.search import astar_search, breadth_first_search
+from graph_algorithms_the_fun_way.shortest_path import Dijkstras
 
 
 class TestGrid(unittest.TestCase):
@@ -125,6 +131,90 @@ class TestGrid(unittest.TestCase):
                             self.assertFalse(g.is_edge(ind1, ind2))
 
 
+class TestImplicitGrid(unittest.TestCase):
+    def test_matches_grid_with_obstacles(self):
+        """Test that the implicit grid has the same structure as make_grid_with_obstacles."""
+        w = 4
+        h = 5
+        obstacles = set([(1, 1), (2, 2), (4, 3), (1, 3)])
+        g = make_grid_with_obstacles(w, h, obstacles)
+        g2 = ImplicitGridGraph(w, h, obstacles)
+
+        self.assertEqual(g2.num_nodes, 20)
+        self.assertEqual(len(g2.nodes), 20)
+        self.assertTrue(g2.undirected)
+        self.assertEqual(len(g2.bits), 3)
+        for ind1 in range(w * h):
+            node = g.nodes[ind1]
+            node2 = g2.nodes[ind1]
+            self.assertEqual(node2.index, ind1)
+            self.assertEqual(g2.is_blocked(ind1), (ind1 // w, ind1 % w) in obstacles)
+            self.assertEqual(node2.num_edges(), node.num_edges())
+            self.assertEqual(node2.get_neighbors(), node.get_neighbors())
+            self.assertEqual(node2.get_out_neighbors(), node.get_out_neighbors())
+            self.assertEqual(list(node2.edges.keys()), list(node.edges.keys()))
+            self.assertEqual(
+                [(e.from_node, e.to_node, e.weight) for e in node2.get_edge_list()],
+                [(e.from_node, e.to_node, e.weight) for e in node.get_edge_list()],
+            )
+
+            for ind2 in range(w * h):
+                self.assertEqual(g2.is_edge(ind1, ind2), g.is_edge(ind1, ind2))
+                self.assertEqual(node2.get_edge(ind2) is None, node.get_edge(ind2) is None)
+        self.assertEqual(len(g2.make_edge_list()), len(g.make_edge_list()))
+
+        self.assertEqual(g2.nodes[-1].index, 19)
+        with self.assertRaises(IndexError):
+            g2.nodes[20]
+        with self.assertRaises(IndexError):
+            g2.get_edge(0, 20)
+        with self.assertRaises(IndexError):
+            g2.set_blocked(5, 0)
+
+        g2.set_blocked(1, 1, False)
+        self.assertFalse(g2.is_blocked(5))
+        self.assertTrue(g2.is_edge(4, 5))
+
+    def test_searches(self):
+        """Test that searches return the same results on the implicit grid."""
+        random.seed(16)
+        w = 15
+        h = 12
+        obstacles = set()
+        for r in range(h):
+            for c in range(w):
+                if random.random() < 0.2:
+                    obstacles.add((r, c))
+        obstacles.discard((0, 0))
+
+        g = make_grid_with_obstacles(w, h, obstacles)
+        g2 = ImplicitGridGraph(w, h, obstacles)
+        self.assertEqual(breadth_first_search(g2, 0), breadth_first_search(g, 0))
+        self.assertEqual(Dijkstras(g2, 0), Dijkstras(g, 0))
+
+        goal = w * h - 1
+        heuristic = [abs(i // w - h + 1) + abs(i % w - w + 1) for i in range(w * h)]
+        self.assertEqual(astar_search(g2, heuristic, 0, goal), astar_search(g, heuristic, 0, goal))
+
+    def test_large_grid(self):
+        """Test that a large implicit grid only stores one bit per node."""
+        g = ImplicitGridGraph(10000, 10000)
+        self.assertEqual(g.num_nodes, 100000000)
+        self.assertEqual(len(g.bits), 12500000)
+        self.assertEqual(g.nodes[0].get_neighbors(), {1, 10000})
+        self.assertEqual(g.nodes[99999999].get_neighbors(), {99999998, 99989999})
+        self.assertTrue(g.is_edge(50005000, 50015000))
+        self.assertFalse(g.is_edge(9999, 10000))
+
+    def test_maze(self):
+        """Test creating mazes from implicit grids."""
+        for i in range(20):
+            g = ImplicitGridGraph(7, 6)
+            maze_edges = randomized_kruskals(g)
+            self.assertTrue(is_spanning_tree(g, maze_edges))
+            self.assertEqual(compute_sum_weights(maze_edges), (float)(7 * 6 - 1))
+
+
 class TestMaze(unittest.TestCase):
     def test_small(self):
         """Test a bunch of small mazes of various sizes."""
@@ -162,6 +252,50 @@ class TestMaze(unittest.TestCase):
             for i in range(1, len(last)):
                 self.assertNotEqual(last[i], -1)
 
+    def test_maze_generators(self):
+        """Test that each of the streaming maze generators creates a spanning tree."""
+        random.seed(17)
+        for generator in [randomized_kruskals_stream, wilsons_maze, recursive_backtracker_maze]:
+            for w, h in [(1, 1), (1, 5), (4, 3), (11, 9)]:
+                for g in [make_grid_graph(w, h), ImplicitGridGraph(w, h)]:
+                    stream = generator(g)
+                    self.assertFalse(isinstance(stream, list))
+                    maze_edges = list(stream)
+                    self.assertTrue(is_spanning_tree(g, maze_edges))
+                    for edge in maze_edges:
+                        self.assertTrue(g.is_edge(edge.from_node, edge.to_node))
+                    self.assertEqual(compute_sum_weights(maze_edges), (float)(w * h - 1))
+
+    def test_maze_generators_obstacles(self):
+        """Test that the maze generators span each component of a grid with obstacles."""
+        random.seed(18)
+        # The wall splits the grid into two components and the blocked cells
+        # are each their own component.
+        obstacles = set([(0, 2), (1, 2), (2, 2), (3, 2)])
+        for generator in [randomized_kruskals_stream, wilsons_maze, recursive_backtracker_maze]:
+            for g in [make_grid_with_obstacles(5, 4, obstacles), ImplicitGridGraph(5, 4, obstacles)]:
+                maze_edges = list(generator(g))
+                self.assertEqual(len(maze_edges), 20 - 4 - 2)
+
+                maze_graph = make_graph_from_edges(g.num_nodes, True, maze_edges)
+                last = breadth_first_search(maze_graph, 0)
+                for r in range(4):
+                    for c in range(5):
+                        index = r * 5 + c
+                        if index != 0 and c < 2:
+                            self.assertNotEqual(last[index], -1)
+                        elif c > 2:
+                            self.assertEqual(last[index], -1)
+
+    def test_large_stream(self):
+        """Test streaming a maze on a larger implicit grid."""
+        random.seed(19)
+        g = ImplicitGridGraph(200, 150)
+        num_edges = 0
+        for edge in randomized_kruskals_stream(g):
+            num_edges += 1
+        self.assertEqual(num_edges, 200 * 150 - 1)
+
 
 if __name__ == "__main__":
     unittest.main()
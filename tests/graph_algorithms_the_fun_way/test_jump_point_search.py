@@ -0,0 +1,94 @@
+import random
+import unittest
+
+from graph_algorithms_the_fun_way.grid_graphs import make_grid_with_obstacles
+from graph_algorithms_the_fun_way.jump_point_search import JumpPointGrid, jump_point_search
+from graph_algorithms_the_fun_way.paths import check_node_path_valid, make_node_path_from_last
+from graph_algorithms_the_fun_way.search import breadth_first_search
+
+
+class TestJumpPointSearch(unittest.TestCase):
+    def test_open_grid(self):
+        """Test Jump Point Search on a grid without obstacles."""
+        grid = JumpPointGrid(5, 4, set())
+        path = grid.find_path(0, 19)
+        self.assertEqual(len(path), 8)
+        self.assertEqual(path[0], 0)
+        self.assertEqual(path[-1], 19)
+        self.assertTrue(check_node_path_valid(make_grid_with_obstacles(5, 4, set()), path))
+
+        self.assertEqual(grid.find_path(7, 7), [7])
+        self.assertEqual(grid.find_path(5, 9), [5, 6, 7, 8, 9])
+        self.assertEqual(grid.find_path(16, 1), [16, 11, 6, 1])
+
+        # There are no forced neighbors on an open grid.
+        for direction in grid.jumps:
+            self.assertTrue(all(x == -1 for x in grid.jumps[direction]))
+
+    def test_obstacles(self):
+        """Test Jump Point Search around a wall."""
+        # A wall in column 2 with a gap at the bottom row:
+        #   . . X . .
+        #   . . X . .
+        #   . . X . .
+        #   . . . . .
+        obstacles = {(0, 2), (1, 2), (2, 2)}
+        g = make_grid_with_obstacles(5, 4, obstacles)
+
+        path = jump_point_search(5, 4, obstacles, 0, 4)
+        self.assertEqual(len(path), 11)
+        self.assertEqual(path[0], 0)
+        self.assertEqual(path[-1], 4)
+        self.assertTrue(check_node_path_valid(g, path))
+        self.assertIn(17, path)
+
+        grid = JumpPointGrid(5, 4, obstacles)
+        self.assertEqual(grid.find_path(0, 2), [])
+        self.assertTrue(grid.is_open(3, 2))
+        self.assertFalse(grid.is_open(1, 2))
+        self.assertFalse(grid.is_open(-1, 0))
+
+        with self.assertRaises(IndexError):
+            grid.find_path(0, 20)
+
+    def test_no_path(self):
+        """Test Jump Point Search when the goal is walled off."""
+        obstacles = {(0, 2), (1, 2), (2, 2), (3, 2)}
+        self.assertEqual(jump_point_search(5, 4, obstacles, 0, 4), [])
+        self.assertEqual(jump_point_search(5, 4, obstacles, 0, 1), [0, 1])
+
+    def test_matches_bfs(self):
+        """Test that Jump Point Search finds shortest paths on random grids."""
+        random.seed(15)
+        for _ in range(300):
+            width = random.randint(1, 15)
+            height = random.randint(1, 15)
+            prob = 0.5 * random.random()
+            obstacles = set()
+            for r in range(height):
+                for c in range(width):
+                    if random.random() < prob:
+                        obstacles.add((r, c))
+
+            g = make_grid_with_obstacles(width, height, obstacles)
+            grid = JumpPointGrid(width, height, obstacles)
+            for _ in range(5):
+                start = random.randint(0, width * height - 1)
+                goal = random.randint(0, width * height - 1)
+                path = grid.find_path(start, goal)
+                if grid.blocked[start] or grid.blocked[goal]:
+                    self.assertEqual(path, [])
+                    continue
+
+                expected = make_node_path_from_last(breadth_first_search(g, start), goal)
+                if expected[0] != start:
+                    self.assertEqual(path, [])
+                else:
+                    self.assertEqual(len(path), len(expected))
+                    self.assertEqual(path[0], start)
+                    self.assertEqual(path[-1], goal)
+                    self.assertTrue(check_node_path_valid(g, path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,4 @@
+import random
 import unittest
 
 from graph_algorithms_the_fun_way.graph import Graph
@@ -622,6 +623,42 @@ class TestMaxFlow(unittest.TestCase):
         self.assertAlmostEqual(g2.get_edge(3, 1).used, 5)
         self.assertAlmostEqual(g2.get_edge(4, 5).used, 3)
 
+    def test_augmenting_path_dfs_iterative(self):
+        """Test that the iterative augmenting path search matches the recursive one."""
+        random.seed(5)
+        for _ in range(10):
+            g = ResidualGraph(30, 0, 29)
+            for _ in range(80):
+                a = random.randint(0, 28)
+                b = random.randint(1, 29)
+                if a != b and g.get_edge(a, b) is None and g.get_edge(b, a) is None:
+                    g.insert_edge(a, b, random.randint(1, 5))
+
+            while True:
+                seen1 = [False] * g.num_nodes
+                seen2 = [False] * g.num_nodes
+                last1 = [-1] * g.num_nodes
+                last2 = [-1] * g.num_nodes
+                augmenting_path_dfs_recursive(g, g.source_index, seen1, last1)
+                augmenting_path_dfs_iterative(g, g.source_index, seen2, last2)
+                self.assertEqual(seen1, seen2)
+                self.assertEqual(last1, last2)
+
+                if last1[g.sink_index] == -1:
+                    break
+                g.update_along_path(last1, g.min_residual_on_path(last1))
+
+    def test_find_augmenting_path_dfs_deep_chain(self):
+        """Test the DFS augmenting path on a chain much deeper than the recursion limit."""
+        num_nodes = 20000
+        g = ResidualGraph(num_nodes, 0, num_nodes - 1)
+        for i in range(num_nodes - 1):
+            g.insert_edge(i, i + 1, 2)
+
+        last = find_augmenting_path_dfs(g)
+        self.assertEqual(last, [-1] + list(range(num_nodes - 1)))
+        self.assertEqual(g.min_residual_on_path(last), 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -177,6 +177,41 @@ class TestPriorityQueue(unittest.TestCase):
             self.assertTrue(pq.is_valid(True))
             self.assertFalse(pq.in_queue(key))
 
+    def test_remove_arbitrary(self):
+        """Test that we can remove elements from anywhere in the heap."""
+        for min_heap in [True, False]:
+            pq = PriorityQueue(4, min_heap=min_heap)
+            arr = [46, 35, 9, 28, 61, 8, 38, 40, 100, 5, 4, 3, 50, 51]
+            for i in range(len(arr)):
+                pq.enqueue(arr[i], arr[i])
+
+            for key in [61, 3, 28, 51, 99]:
+                pq.remove(key)
+                self.assertTrue(pq.is_valid(True))
+                self.assertFalse(pq.in_queue(key))
+            self.assertEqual(pq.size(), len(arr) - 4)
+
+            remaining = sorted([x for x in arr if x not in [61, 3, 28, 51]], reverse=not min_heap)
+            for value in remaining:
+                self.assertEqual(pq.dequeue(), value)
+            self.assertTrue(pq.is_empty())
+
+    def test_peek_top_values(self):
+        """Test that we can look at the top several values without modifying the queue."""
+        for min_heap in [True, False]:
+            pq = PriorityQueue(20, min_heap=min_heap)
+            self.assertEqual(pq.peek_top_values(3), [])
+
+            arr = [46, 35, 9, 28, 61, 8, 38, 40, 100, 5, 4, 3, 50, 51]
+            for i in range(len(arr)):
+                pq.enqueue(arr[i], arr[i])
+
+            s_arr = sorted(arr, reverse=not min_heap)
+            for k in [0, 1, 5, 14, 20]:
+                self.assertEqual(pq.peek_top_values(k), s_arr[:k])
+            self.assertEqual(pq.size(), len(arr))
+            self.assertTrue(pq.is_valid(True))
+
     def test_pq_sort_descending(self):
         """Test that we can use the PriorityQueue to sort elements."""
         s = pq_sort([10, -1, 0, 5, 3, 4, -5, 20], reverse=True)
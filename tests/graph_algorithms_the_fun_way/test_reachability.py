@@ -0,0 +1,102 @@
+import random
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from graph_algorithms_the_fun_way.connected import get_reachable
+from graph_algorithms_the_fun_way.graph import Graph
+from graph_algorithms_the_fun_way.reachability import *
+
+
+def make_random_dag_with_cycles(num_nodes: int, num_edges: int, num_back: int) -> Graph:
+    """Create a random graph that is mostly a DAG with a few back edges."""
+    g = Graph(num_nodes, undirected=False)
+    for _ in range(num_edges):
+        i = random.randint(0, num_nodes - 1)
+        j = random.randint(0, num_nodes - 1)
+        if i < j:
+            g.insert_edge(i, j, 1.0)
+    for _ in range(num_back):
+        i = random.randint(0, num_nodes - 1)
+        j = random.randint(0, num_nodes - 1)
+        g.insert_edge(i, j, 1.0)
+    return g
+
+
+class TestReachability(unittest.TestCase):
+    def test_simple(self):
+        """Test the reachability index on a small example graph."""
+        g = Graph(6, undirected=False)
+        g.insert_edge(0, 2, 1.0)
+        g.insert_edge(1, 0, 1.0)
+        g.insert_edge(2, 3, 1.0)
+        g.insert_edge(3, 0, 1.0)
+        g.insert_edge(3, 5, 1.0)
+        g.insert_edge(4, 5, 1.0)
+        g.insert_edge(5, 4, 1.0)
+
+        index = make_reachability_index(g)
+        self.assertEqual(index.num_nodes, 6)
+        self.assertEqual(index.num_components, 3)
+        self.assertTrue(index.can_reach(1, 4))
+        self.assertTrue(index.can_reach(2, 0))
+        self.assertTrue(index.can_reach(3, 3))
+        self.assertFalse(index.can_reach(0, 1))
+        self.assertFalse(index.can_reach(5, 3))
+        self.assertTrue(index.are_strongly_connected([0, 2, 3]))
+        self.assertFalse(index.are_strongly_connected([0, 1]))
+        self.assertEqual(index.get_reachable(0), set([0, 2, 3, 4, 5]))
+        self.assertRaises(IndexError, index.can_reach, 0, 6)
+        self.assertRaises(IndexError, index.can_reach, -1, 0)
+
+    def test_matches_bfs(self):
+        """Test that the index matches a breadth-first search on random graphs."""
+        for trial in range(20):
+            num_nodes = random.randint(1, 40)
+            g = make_random_dag_with_cycles(num_nodes, 2 * num_nodes, random.randint(0, 3))
+            index = make_reachability_index(g, num_labelings=random.randint(1, 4), seed=trial)
+
+            for i in range(num_nodes):
+                reachable = get_reachable(g, i)
+                self.assertEqual(index.get_reachable(i), reachable)
+                for j in range(num_nodes):
+                    self.assertEqual(index.can_reach(i, j), j in reachable)
+            self.assertEqual(index.num_queries, num_nodes * num_nodes)
+            self.assertLessEqual(index.num_fallbacks, index.num_queries)
+
+    def test_few_fallbacks(self):
+        """Test that most queries on a sparse DAG are answered without a search."""
+        random.seed(0)
+        num_nodes = 300
+        g = make_random_dag_with_cycles(num_nodes, num_nodes, 0)
+        index = make_reachability_index(g, num_labelings=3, seed=0)
+        for i in range(num_nodes):
+            for j in range(num_nodes):
+                index.can_reach(i, j)
+        self.assertLess(index.num_fallbacks, index.num_queries // 10)
+
+    def test_bad_labelings(self):
+        """Test that the index requires at least one labeling."""
+        g = Graph(3, undirected=False)
+        self.assertRaises(ValueError, make_reachability_index, g, 0)
+
+    def test_save_and_load(self):
+        """Test that a saved index answers queries the same after loading."""
+        num_nodes = 50
+        g = make_random_dag_with_cycles(num_nodes, 100, 5)
+        index = make_reachability_index(g, num_labelings=2, seed=1)
+
+        with TemporaryDirectory() as dir_name:
+            filename = Path(dir_name) / "index.json"
+            save_reachability_index(index, filename)
+            loaded = load_reachability_index(filename)
+
+        self.assertEqual(loaded.component, index.component)
+        self.assertEqual(loaded.post, index.post)
+        for i in range(num_nodes):
+            for j in range(num_nodes):
+                self.assertEqual(loaded.can_reach(i, j), index.can_reach(i, j))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,19 +1,41 @@
 import math
+import random
 import unittest
 
+from graph_algorithms_the_fun_way.csr_graph import make_csr_graph
 from graph_algorithms_the_fun_way.graph import Graph
-from graph_algorithms_the_fun_way.paths import last_path_length
+from graph_algorithms_the_fun_way.paths import (
+    check_last_path_valid,
+    compute_path_cost,
+    last_path_length,
+    make_node_path_from_last,
+)
 from graph_algorithms_the_fun_way.search import (
+    anytime_astar_search,
     astar_search,
+    bidirectional_astar_search,
     breadth_first_search,
     depth_first_search_basic,
     depth_first_search_basic_all,
     depth_first_search_path,
     depth_first_search_stack,
     dfs_connected_components,
+    dfs_iterative_basic,
+    dfs_iterative_cc,
+    dfs_iterative_path,
     dfs_preorder,
+    dfs_recursive_basic,
+    dfs_recursive_cc,
+    dfs_recursive_path,
+    direction_optimizing_bfs,
     greedy_search,
+    iter_bfs,
+    iter_dfs,
+    iter_dfs_edges,
+    multi_source_bfs,
+    multi_source_hop_sums,
 )
+from graph_algorithms_the_fun_way.shortest_path import Dijkstras
 
 
 def euclidean_dist(x1: float, y1: float, x2: float, y2: float) -> float:
@@ -38,6 +60,39 @@ def euclidean_dist(x1: float, y1: float, x2: float, y2: float) -> float:
     return math.sqrt((x1 - x2) * (x1 - x2) + (y1 - y2) * (y1 - y2))
 
 
+def make_random_spatial_graph(num_nodes: int, max_dist: float, undirected: bool) -> tuple:
+    """Make a graph of random points connecting each pair of points within
+    a given distance by an edge weighted by the distance.
+
+    Parameters
+    ----------
+    num_nodes : int
+        The number of nodes.
+    max_dist : float
+        The maximum distance between connected points.
+    undirected : bool
+        Whether the graph is undirected. Directed graphs only keep each edge
+        with probability 0.75.
+
+    Returns
+    -------
+    g : Graph
+        The constructed graph.
+    points : list of tuple
+        The (x, y) location of each node.
+    """
+    points = [(10.0 * random.random(), 10.0 * random.random()) for _ in range(num_nodes)]
+    g = Graph(num_nodes, undirected=undirected)
+    for i in range(num_nodes):
+        for j in range(num_nodes):
+            if i == j or (undirected and j < i):
+                continue
+            dist = euclidean_dist(points[i][0], points[i][1], points[j][0], points[j][1])
+            if dist < max_dist and (undirected or random.random() < 0.75):
+                g.insert_edge(i, j, dist)
+    return g, points
+
+
 class TestSearch(unittest.TestCase):
     def test_simple_bfs(self):
         """Test BFS on a graph with 3 nodes."""
@@ -112,6 +167,112 @@ class TestSearch(unittest.TestCase):
         self.assertEqual(last_path_length(path, 1, goal=0), 1)
         self.assertEqual(last_path_length(path, 2, goal=0), 1)
 
+    def test_multi_source_bfs10(self):
+        """Test multi-source BFS on the graph with 10 nodes."""
+        g = Graph(10, undirected=True)
+        g.insert_edge(0, 1, 1.0)
+        g.insert_edge(0, 5, 1.0)
+        g.insert_edge(0, 7, 1.0)
+        g.insert_edge(1, 2, 1.0)
+        g.insert_edge(2, 3, 1.0)
+        g.insert_edge(2, 4, 1.0)
+        g.insert_edge(2, 5, 1.0)
+        g.insert_edge(4, 9, 1.0)
+        g.insert_edge(5, 6, 1.0)
+        g.insert_edge(5, 8, 1.0)
+        g.insert_edge(6, 8, 1.0)
+        g.insert_edge(7, 8, 1.0)
+        g.insert_edge(8, 9, 1.0)
+
+        dist = multi_source_bfs(g, [0, 9, 0])
+        self.assertEqual(dist[0], [0, 1, 2, 3, 3, 1, 2, 1, 2, 3])
+        self.assertEqual(dist[1], [3, 3, 2, 3, 1, 2, 2, 2, 1, 0])
+        self.assertEqual(dist[2], dist[0])
+
+        totals, reached = multi_source_hop_sums(g, [0, 9])
+        self.assertEqual(totals, [18, 19])
+        self.assertEqual(reached, [10, 10])
+
+    def test_multi_source_bfs_random(self):
+        """Test multi-source BFS against single source BFS across several batches."""
+        random.seed(1)
+        g = Graph(150, undirected=False)
+        g.add_random_edges(400)
+
+        sources = list(range(0, 150, 2))
+        dist = multi_source_bfs(g, sources, batch_size=16)
+        totals, reached = multi_source_hop_sums(g, sources, batch_size=64)
+        for i, start in enumerate(sources):
+            last = breadth_first_search(g, start)
+            expected = [last_path_length(last, j, goal=start) for j in range(g.num_nodes)]
+            expected = [-1 if d is None else d for d in expected]
+            self.assertEqual(dist[i], expected)
+            self.assertEqual(totals[i], sum(d for d in expected if d > 0))
+            self.assertEqual(reached[i], sum(1 for d in expected if d >= 0))
+
+    def test_multi_source_hop_sums_disconnected(self):
+        """Test the hop sums default to all nodes on a disconnected graph."""
+        g = Graph(5, undirected=True)
+        g.insert_edge(0, 1, 1.0)
+        g.insert_edge(1, 2, 1.0)
+        g.insert_edge(3, 4, 1.0)
+
+        totals, reached = multi_source_hop_sums(g)
+        self.assertEqual(totals, [3, 2, 3, 1, 1])
+        self.assertEqual(reached, [3, 3, 3, 2, 2])
+
+    def test_direction_optimizing_bfs10(self):
+        """Test direction-optimizing BFS in both modes on the graph with 10 nodes."""
+        g = Graph(10, undirected=True)
+        g.insert_edge(0, 1, 1.0)
+        g.insert_edge(0, 5, 1.0)
+        g.insert_edge(0, 7, 1.0)
+        g.insert_edge(1, 2, 1.0)
+        g.insert_edge(2, 3, 1.0)
+        g.insert_edge(2, 4, 1.0)
+        g.insert_edge(2, 5, 1.0)
+        g.insert_edge(4, 9, 1.0)
+        g.insert_edge(5, 6, 1.0)
+        g.insert_edge(5, 8, 1.0)
+        g.insert_edge(6, 8, 1.0)
+        g.insert_edge(7, 8, 1.0)
+        g.insert_edge(8, 9, 1.0)
+
+        # Top-down only gives the same result as the BFS.
+        path = direction_optimizing_bfs(g, 0, alpha=0.0001)
+        self.assertEqual(path, [-1, 0, 1, 2, 2, 0, 5, 0, 5, 8])
+
+        # Bottom-up scans pick each node's first neighbor in the frontier.
+        path = direction_optimizing_bfs(make_csr_graph(g), 0, alpha=1000.0, beta=0.0001)
+        self.assertEqual(path, [-1, 0, 1, 2, 2, 0, 5, 0, 5, 8])
+
+        # Adding an edge from node 1 moves node 3 up a level.
+        g.insert_edge(3, 1, 1.0)
+        path = direction_optimizing_bfs(g, 0, alpha=1000.0, beta=0.0001)
+        self.assertEqual(path, [-1, 0, 1, 1, 2, 0, 5, 0, 5, 8])
+
+    def test_direction_optimizing_bfs_random(self):
+        """Test that direction-optimizing BFS finds shortest hop paths."""
+        random.seed(2)
+        for undirected in [True, False]:
+            g = Graph(200, undirected=undirected)
+            g.add_random_edges(600)
+
+            csr = make_csr_graph(g)
+            in_csr = csr.make_transpose()
+            for alpha in [0.0001, 2.0, 14.0, 1000.0]:
+                expected = breadth_first_search(g, 3)
+                path = direction_optimizing_bfs(g, 3, alpha=alpha)
+                self.assertTrue(check_last_path_valid(g, path))
+                for j in range(g.num_nodes):
+                    self.assertEqual(last_path_length(path, j, 3), last_path_length(expected, j, 3))
+
+                # Passing in a prebuilt transpose gives the same result.
+                self.assertEqual(direction_optimizing_bfs(csr, 3, alpha=alpha, in_g=in_csr), path)
+
+        with self.assertRaises(ValueError):
+            direction_optimizing_bfs(g, 3, in_g=make_csr_graph(Graph(5, undirected=False)))
+
     def test_simple_dfs3(self):
         """Test DFS on a graph with 3 nodes."""
         g = Graph(3, undirected=True)
@@ -343,6 +504,109 @@ class TestSearch(unittest.TestCase):
         last: list = astar_search(g, h, 0, 6)
         self.assertEqual(last, [-1, 0, 0, 0, 1, 6, 4])
 
+    def test_bidirectional_astar_complex(self):
+        """Test bidirectional A* search on the graph from test_astar_complex."""
+        g = Graph(7, undirected=True)
+        g.insert_edge(0, 1, 2.0)
+        g.insert_edge(0, 2, 2.83)
+        g.insert_edge(0, 3, 3.0)
+        g.insert_edge(1, 4, 1.41)
+        g.insert_edge(2, 3, 2.24)
+        g.insert_edge(3, 5, 1.14)
+        g.insert_edge(4, 6, 2.24)
+        g.insert_edge(5, 6, 3.16)
+        g.insert_edge(2, 4, 3.5)
+
+        h = [5.0, 3.6, 2.24, 4.0, 2.24, 3.16, 0.0]
+        last, bound = bidirectional_astar_search(g, h, 0, 6)
+        self.assertEqual(make_node_path_from_last(last, 6), [0, 1, 4, 6])
+        self.assertEqual(bound, 1.0)
+
+        last, bound = bidirectional_astar_search(g, h, 3, 3)
+        self.assertEqual(make_node_path_from_last(last, 3), [3])
+
+        g.insert_node()
+        last, bound = bidirectional_astar_search(g, h + [1.0], 0, 7)
+        self.assertEqual(last[7], -1)
+
+    def test_bidirectional_astar_random(self):
+        """Test that bidirectional A* finds optimal paths on random spatial graphs."""
+        random.seed(8)
+        for undirected in [True, False]:
+            for trial in range(5):
+                g, points = make_random_spatial_graph(60, 2.5, undirected)
+                start = trial
+                goal = 59 - trial
+                h = [euclidean_dist(x, y, points[goal][0], points[goal][1]) for x, y in points]
+                h_start = [euclidean_dist(x, y, points[start][0], points[start][1]) for x, y in points]
+
+                expected_last = Dijkstras(g, start)
+                if expected_last[goal] == -1:
+                    continue
+                expected = compute_path_cost(g, make_node_path_from_last(expected_last, goal))
+
+                for hs in [h_start, None]:
+                    last, bound = bidirectional_astar_search(g, h, start, goal, h_start=hs)
+                    path = make_node_path_from_last(last, goal)
+                    self.assertEqual(path[0], start)
+                    self.assertTrue(check_last_path_valid(g, last))
+                    self.assertAlmostEqual(compute_path_cost(g, path), expected)
+
+    def test_anytime_astar_random(self):
+        """Test that anytime A* finds optimal paths when given enough budget."""
+        random.seed(9)
+        for undirected in [True, False]:
+            for trial in range(5):
+                g, points = make_random_spatial_graph(60, 2.5, undirected)
+                start = trial
+                goal = 59 - trial
+                h = [euclidean_dist(x, y, points[goal][0], points[goal][1]) for x, y in points]
+
+                expected_last = Dijkstras(g, start)
+                last, bound = anytime_astar_search(g, h, start, goal, weight=5.0, weight_step=1.0)
+                if expected_last[goal] == -1:
+                    self.assertEqual(last[goal], -1)
+                    self.assertEqual(bound, math.inf)
+                    continue
+
+                expected = compute_path_cost(g, make_node_path_from_last(expected_last, goal))
+                path = make_node_path_from_last(last, goal)
+                self.assertEqual(bound, 1.0)
+                self.assertEqual(path[0], start)
+                self.assertAlmostEqual(compute_path_cost(g, path), expected)
+
+    def test_anytime_astar_budget(self):
+        """Test that anytime A* returns a bounded path when it runs out of budget."""
+        random.seed(10)
+        g, points = make_random_spatial_graph(200, 1.5, True)
+        start = 0
+        goal = max(range(200), key=lambda i: euclidean_dist(*points[0], *points[i]))
+        h = [euclidean_dist(x, y, points[goal][0], points[goal][1]) for x, y in points]
+        expected_last = Dijkstras(g, start)
+        self.assertNotEqual(expected_last[goal], -1)
+        expected = compute_path_cost(g, make_node_path_from_last(expected_last, goal))
+
+        # Too small a budget to find any path.
+        last, bound = anytime_astar_search(g, h, start, goal, max_expansions=1)
+        self.assertEqual(last[goal], -1)
+        self.assertEqual(bound, math.inf)
+
+        for max_expansions in [30, 60, 100, 200, 1000]:
+            last, bound = anytime_astar_search(g, h, start, goal, weight=3.0, max_expansions=max_expansions)
+            if bound < math.inf:
+                path = make_node_path_from_last(last, goal)
+                self.assertEqual(path[0], start)
+                self.assertTrue(check_last_path_valid(g, last))
+                self.assertGreaterEqual(bound, 1.0)
+                self.assertLessEqual(compute_path_cost(g, path), bound * expected + 1e-9)
+
+        last, bound = anytime_astar_search(g, h, start, goal, time_limit=10.0)
+        self.assertEqual(bound, 1.0)
+        self.assertAlmostEqual(compute_path_cost(g, make_node_path_from_last(last, goal)), expected)
+
+        with self.assertRaises(ValueError):
+            anytime_astar_search(g, h, start, goal, weight=0.5)
+
     def test_dfs_connected_components_4(self):
         """Test DFS connected component search on a graph with 4 nodes."""
         g = Graph(4, undirected=True)
@@ -482,6 +746,133 @@ class TestSearch(unittest.TestCase):
         self.assertEqual(order, [0, 1, 2, 5, 3, 6, 4])
         self.assertEqual(parents, [-1, 0, 1, 0, 2, 3, 1])
 
+    def test_dfs_iterative_matches_recursive(self):
+        """Test that the iterative DFS functions match the recursive ones."""
+        random.seed(3)
+        for undirected in [True, False]:
+            g = Graph(60, undirected=undirected)
+            g.add_random_edges(90)
+
+            for start in [0, 17, 59]:
+                seen1 = [False] * g.num_nodes
+                seen2 = [False] * g.num_nodes
+                dfs_recursive_basic(g, start, seen1)
+                dfs_iterative_basic(g, start, seen2)
+                self.assertEqual(seen1, seen2)
+
+                seen1 = [False] * g.num_nodes
+                seen2 = [False] * g.num_nodes
+                last1 = [-1] * g.num_nodes
+                last2 = [-1] * g.num_nodes
+                dfs_recursive_path(g, start, seen1, last1)
+                dfs_iterative_path(g, start, seen2, last2)
+                self.assertEqual(seen1, seen2)
+                self.assertEqual(last1, last2)
+
+                comp1 = [-1] * g.num_nodes
+                comp2 = [-1] * g.num_nodes
+                dfs_recursive_cc(g, start, comp1, 5)
+                dfs_iterative_cc(g, start, comp2, 5)
+                self.assertEqual(comp1, comp2)
+
+    def test_dfs_deep_chain(self):
+        """Test the DFS functions on a chain much deeper than the recursion limit."""
+        num_nodes = 20000
+        g = Graph(num_nodes, undirected=True)
+        for i in range(num_nodes - 1):
+            g.insert_edge(i, i + 1, 1.0)
+
+        depth_first_search_basic(g, 0)
+        self.assertEqual(depth_first_search_path(g), [-1] + list(range(num_nodes - 1)))
+        self.assertEqual(dfs_connected_components(g), [0] * num_nodes)
+
+    def test_iter_bfs(self):
+        """Test that the BFS generator matches the full BFS."""
+        random.seed(6)
+        for undirected in [True, False]:
+            g = Graph(80, undirected=undirected)
+            g.add_random_edges(160)
+
+            last = breadth_first_search(g, 5)
+            count = 0
+            prev_depth = 0
+            for index, parent, depth in iter_bfs(g, 5):
+                self.assertEqual(parent, last[index])
+                self.assertEqual(depth, last_path_length(last, index, 5))
+                self.assertGreaterEqual(depth, prev_depth)
+                prev_depth = depth
+                count += 1
+            self.assertEqual(count, sum(1 for p in last if p != -1) + 1)
+
+    def test_iter_bfs_early_stop(self):
+        """Test that we can stop the BFS generator early."""
+        g = Graph(6, undirected=True)
+        g.insert_edge(0, 1, 1.0)
+        g.insert_edge(0, 2, 1.0)
+        g.insert_edge(1, 3, 1.0)
+        g.insert_edge(2, 4, 1.0)
+        g.insert_edge(4, 5, 1.0)
+
+        found = None
+        for index, parent, depth in iter_bfs(g, 0):
+            if index == 4:
+                found = (index, parent, depth)
+                break
+        self.assertEqual(found, (4, 2, 2))
+        self.assertEqual(list(iter_bfs(g, 5))[:3], [(5, -1, 0), (4, 5, 1), (2, 4, 2)])
+
+    def test_iter_dfs(self):
+        """Test that the DFS generator matches the recursive DFS."""
+        random.seed(7)
+        for undirected in [True, False]:
+            g = Graph(80, undirected=undirected)
+            g.add_random_edges(160)
+
+            seen = [False] * g.num_nodes
+            last = [-1] * g.num_nodes
+            dfs_recursive_path(g, 2, seen, last)
+
+            visited = []
+            for index, parent, depth in iter_dfs(g, 2):
+                self.assertEqual(parent, last[index])
+                self.assertEqual(depth, last_path_length(last, index, 2))
+                visited.append(index)
+            self.assertEqual(sorted(visited), [i for i in range(g.num_nodes) if seen[i]])
+
+    def test_iter_dfs_edges_directed(self):
+        """Test the DFS edge classification on a directed graph."""
+        g = Graph(5, undirected=False)
+        g.insert_edge(0, 1, 1.0)
+        g.insert_edge(1, 2, 1.0)
+        g.insert_edge(2, 0, 1.0)
+        g.insert_edge(0, 2, 1.0)
+        g.insert_edge(0, 3, 1.0)
+        g.insert_edge(3, 2, 1.0)
+        g.insert_edge(3, 3, 1.0)
+
+        edges = list(iter_dfs_edges(g, 0))
+        expected = [
+            (0, 1, "tree"),
+            (1, 2, "tree"),
+            (2, 0, "back"),
+            (0, 2, "forward"),
+            (0, 3, "tree"),
+            (3, 2, "cross"),
+            (3, 3, "back"),
+        ]
+        self.assertEqual(edges, expected)
+
+    def test_iter_dfs_edges_undirected(self):
+        """Test the DFS edge classification on an undirected graph."""
+        g = Graph(5, undirected=True)
+        g.insert_edge(0, 1, 1.0)
+        g.insert_edge(1, 2, 1.0)
+        g.insert_edge(2, 0, 1.0)
+        g.insert_edge(2, 3, 1.0)
+
+        edges = list(iter_dfs_edges(g, 0))
+        self.assertEqual(edges, [(0, 1, "tree"), (1, 2, "tree"), (2, 0, "back"), (2, 3, "tree")])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,118 @@
+import threading
+import time
+import unittest
+from functools import partial
+
+from graph_algorithms_the_fun_way.file_reader import make_graph_from_dependencies
+from graph_algorithms_the_fun_way.graph import Graph
+from graph_algorithms_the_fun_way.task_scheduler import *
+
+
+class TestTaskScheduler(unittest.TestCase):
+    def setUp(self):
+        """Create a small dependency graph."""
+        priors = {0: [], 1: [0], 2: [0, 1], 3: [], 4: [1, 3], 5: [2, 4]}
+        self.g = make_graph_from_dependencies(priors)
+
+    def test_critical_path_priorities(self):
+        """Test the critical path priorities with and without costs."""
+        self.assertEqual(critical_path_priorities(self.g), [4.0, 3.0, 2.0, 3.0, 2.0, 1.0])
+        costs = [1.0, 1.0, 5.0, 10.0, 1.0, 1.0]
+        self.assertEqual(critical_path_priorities(self.g, costs), [8.0, 7.0, 6.0, 12.0, 2.0, 1.0])
+        self.assertRaises(ValueError, critical_path_priorities, self.g, [1.0])
+
+        g = Graph(2, undirected=False)
+        g.insert_edge(0, 1, 1.0)
+        g.insert_edge(1, 0, 1.0)
+        self.assertRaises(ValueError, critical_path_priorities, g)
+
+    def test_dependencies_respected(self):
+        """Test that each task starts only after its predecessors finish."""
+        lock = threading.Lock()
+        finished = set()
+        violations = []
+
+        def task(index):
+            with lock:
+                for prior in self.g.get_in_neighbors(index):
+                    if prior not in finished:
+                        violations.append((prior, index))
+            time.sleep(0.01)
+            with lock:
+                finished.add(index)
+            return index * 10
+
+        tasks = [partial(task, i) for i in range(6)]
+        executor = DAGExecutor(self.g, tasks, max_workers=3)
+        results = executor.run()
+        self.assertEqual(results, {i: i * 10 for i in range(6)})
+        self.assertEqual(violations, [])
+        self.assertEqual(executor.status, ["done"] * 6)
+        for i in range(6):
+            self.assertGreaterEqual(executor.durations[i], 0.005)
+            self.assertLessEqual(executor.start_times[i], executor.finish_times[i])
+        self.assertGreaterEqual(executor.makespan, max(executor.finish_times.values()))
+
+    def test_parallel(self):
+        """Test that independent tasks run at the same time."""
+        g = Graph(4, undirected=False)
+        tasks = [partial(time.sleep, 0.1) for _ in range(4)]
+        executor = DAGExecutor(g, tasks, max_workers=4)
+        executor.run()
+
+        # Every task started before the first one finished.
+        self.assertEqual(len(executor.start_times), 4)
+        self.assertLess(max(executor.start_times.values()), min(executor.finish_times.values()))
+
+    def test_critical_path_first(self):
+        """Test that a single worker runs the task with the longest chain first."""
+        order = []
+        tasks = [partial(order.append, i) for i in range(6)]
+        costs = [1.0, 1.0, 1.0, 10.0, 1.0, 1.0]
+        DAGExecutor(self.g, tasks, max_workers=1, costs=costs).run()
+        self.assertEqual(order[0], 3)
+        self.assertEqual(sorted(order), list(range(6)))
+
+    def test_cancel(self):
+        """Test that cancelling from inside a task stops its dependents."""
+        executor = None
+
+        def cancel():
+            executor.cancel()
+
+        tasks = [cancel] + [partial(int, i) for i in range(1, 6)]
+        executor = DAGExecutor(self.g, tasks, max_workers=1, costs=[10.0, 1.0, 1.0, 1.0, 1.0, 1.0])
+        results = executor.run()
+        self.assertTrue(executor.cancelled)
+        self.assertEqual(list(results), [0])
+        self.assertEqual(executor.status[0], "done")
+        for i in [1, 2, 4, 5]:
+            self.assertEqual(executor.status[i], "cancelled")
+
+    def test_failure(self):
+        """Test that a failed task's exception is raised and its dependents never run."""
+
+        def fail():
+            raise RuntimeError("failed")
+
+        tasks = [partial(int, 0), fail, partial(int, 2), partial(int, 3), partial(int, 4), partial(int, 5)]
+        executor = DAGExecutor(self.g, tasks, max_workers=2)
+        self.assertRaises(RuntimeError, executor.run)
+        self.assertEqual(executor.status[1], "failed")
+        for i in [2, 4, 5]:
+            self.assertEqual(executor.status[i], "cancelled")
+
+    def test_processes(self):
+        """Test running the tasks on a process pool."""
+        tasks = [partial(pow, i, 2) for i in range(6)]
+        executor = DAGExecutor(self.g, tasks, max_workers=2, use_processes=True)
+        self.assertEqual(executor.run(), {i: i * i for i in range(6)})
+
+    def test_invalid(self):
+        """Test invalid executor arguments."""
+        self.assertRaises(ValueError, DAGExecutor, self.g, [], 2)
+        self.assertRaises(ValueError, DAGExecutor, self.g, [int] * 6, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,21 @@
+import itertools
+import random
 import unittest
 
+from graph_algorithms_the_fun_way.csr_graph import make_csr_graph
 from graph_algorithms_the_fun_way.graph import Graph
 from graph_algorithms_the_fun_way.topological import (
     check_cycle_kahns,
+    critical_path,
+    DynamicTopologicalOrder,
     is_topo_ordered,
     Kahns,
     sort_forward_pointers,
     topological_dfs,
+    topological_dfs_cycle,
+    topological_dfs_iterative,
+    topological_dfs_recursive,
+    topological_levels,
 )
 
 
@@ -210,6 +219,185 @@ class TestGraphTopological(unittest.TestCase):
         order = sort_forward_pointers(options)
         self.assertEqual(order, [0, 1, 2, 6, 7, 4, 5, 8, 9, 3])
 
+    def test_topological_dfs_iterative(self):
+        """Test that the iterative DFS matches the recursive one."""
+        for g in [self.g_line, self.g_line2, self.g_y, self.g6, self.g6b, self.g8]:
+            seen1 = [False] * g.num_nodes
+            seen2 = [False] * g.num_nodes
+            s1 = []
+            s2 = []
+            for ind in range(g.num_nodes):
+                if not seen1[ind]:
+                    topological_dfs_recursive(g, ind, seen1, s1)
+                if not seen2[ind]:
+                    topological_dfs_iterative(g, ind, seen2, s2)
+            self.assertEqual(s1, s2)
+
+    def test_topological_dfs_deep_chain(self):
+        """Test the topological sort on a chain much deeper than the recursion limit."""
+        num_nodes = 20000
+        g = Graph(num_nodes, undirected=False)
+        for i in range(num_nodes - 1):
+            g.insert_edge(i + 1, i, 1.0)
+        self.assertEqual(topological_dfs(g), list(reversed(range(num_nodes))))
+
+    def test_topological_levels(self):
+        """Test the level of each node in a small DAG."""
+        g = Graph(6, undirected=False)
+        g.insert_edge(0, 1, 1.0)
+        g.insert_edge(0, 2, 1.0)
+        g.insert_edge(1, 2, 1.0)
+        g.insert_edge(3, 4, 1.0)
+        g.insert_edge(2, 5, 1.0)
+        g.insert_edge(4, 5, 1.0)
+
+        level, layers = topological_levels(g)
+        self.assertEqual(level, [0, 1, 2, 0, 1, 3])
+        self.assertEqual([sorted(layer) for layer in layers], [[0, 3], [1, 4], [2], [5]])
+        self.assertEqual(topological_levels(make_csr_graph(g)), (level, layers))
+        self.assertTrue(is_topo_ordered(g, [index for layer in layers for index in layer]))
+
+        g.insert_edge(5, 0, 1.0)
+        self.assertRaises(ValueError, topological_levels, g)
+
+    def test_critical_path(self):
+        """Test the critical path and slack in a small weighted DAG."""
+        g = Graph(6, undirected=False)
+        g.insert_edge(0, 1, 2.0)
+        g.insert_edge(0, 2, 1.0)
+        g.insert_edge(1, 3, 4.0)
+        g.insert_edge(2, 3, 1.0)
+        g.insert_edge(3, 5, 1.0)
+        g.insert_edge(4, 5, 2.0)
+
+        path, length, slack = critical_path(g)
+        self.assertEqual(path, [0, 1, 3, 5])
+        self.assertAlmostEqual(length, 7.0)
+        self.assertEqual(slack, [0.0, 0.0, 4.0, 0.0, 5.0, 0.0])
+        self.assertEqual(critical_path(Graph(0, undirected=False)), ([], 0.0, []))
+
+    def test_critical_path_random(self):
+        """Test the critical path length against enumerating paths on random DAGs."""
+        for trial in range(20):
+            num_nodes = random.randint(1, 8)
+            g = Graph(num_nodes, undirected=False)
+            for i, j in itertools.combinations(range(num_nodes), 2):
+                if random.random() < 0.4:
+                    g.insert_edge(i, j, float(random.randint(1, 9)))
+
+            # The longest path ending at each node by dynamic programming in index order.
+            best = [0.0] * num_nodes
+            for j in range(num_nodes):
+                for i in range(j):
+                    if g.is_edge(i, j):
+                        best[j] = max(best[j], best[i] + g.get_edge(i, j).weight)
+
+            path, length, slack = critical_path(g)
+            self.assertAlmostEqual(length, max(best))
+            self.assertAlmostEqual(sum(g.get_edge(a, b).weight for a, b in zip(path, path[1:])), length)
+            for index in path:
+                self.assertAlmostEqual(slack[index], 0.0)
+            for value in slack:
+                self.assertGreaterEqual(value, -1e-9)
+
+    def test_dynamic_order(self):
+        """Test the dynamic topological order on a small example."""
+        dto = DynamicTopologicalOrder(4)
+        self.assertIsNone(dto.insert_edge(0, 1))
+        self.assertIsNone(dto.insert_edge(3, 0))
+        self.assertEqual(dto.order, [3, 0, 2, 1])
+        self.assertTrue(is_topo_ordered(dto.g, dto.order))
+        self.assertIsNone(dto.insert_edge(1, 2))
+        self.assertEqual([dto.node_at(i) for i in range(4)], [3, 0, 1, 2])
+        for i in range(4):
+            self.assertEqual(dto.node_at(dto.position_of(i)), i)
+
+        self.assertEqual(dto.insert_edge(2, 3), [3, 0, 1, 2])
+        self.assertFalse(dto.g.is_edge(2, 3))
+        self.assertEqual(dto.insert_edge(1, 1), [1])
+        self.assertTrue(is_topo_ordered(dto.g, dto.order))
+        self.assertRaises(IndexError, dto.insert_edge, 0, 4)
+
+    def test_dynamic_order_random(self):
+        """Test the dynamic topological order against Kahn's algorithm on random insertions."""
+        for trial in range(20):
+            num_nodes = random.randint(1, 20)
+            dto = DynamicTopologicalOrder(num_nodes)
+            g = Graph(num_nodes, undirected=False)
+            for _ in range(3 * num_nodes):
+                u = random.randint(0, num_nodes - 1)
+                v = random.randint(0, num_nodes - 1)
+                g.insert_edge(u, v, 1.0)
+                cycle = dto.insert_edge(u, v)
+                if check_cycle_kahns(g):
+                    self.assertIsNotNone(cycle)
+                    self.assertEqual(cycle[0], v)
+                    self.assertEqual(cycle[-1], u)
+                    for a, b in zip(cycle, cycle[1:]):
+                        self.assertTrue(dto.g.is_edge(a, b))
+                    g.remove_edge(u, v)
+                else:
+                    self.assertIsNone(cycle)
+                self.assertTrue(is_topo_ordered(dto.g, dto.order))
+                self.assertEqual(len(dto.g.make_edge_list()), len(g.make_edge_list()))
+
+    def test_topological_dfs_cycle(self):
+        """Test the single pass DFS topological sort on graphs with and without cycles."""
+        g = Graph(5, undirected=False)
+        g.insert_edge(0, 1, 1.0)
+        g.insert_edge(1, 2, 1.0)
+        g.insert_edge(3, 1, 1.0)
+        g.insert_edge(2, 4, 1.0)
+
+        order, cycle = topological_dfs_cycle(g)
+        self.assertIsNone(cycle)
+        self.assertEqual(order, topological_dfs(g))
+        self.assertTrue(is_topo_ordered(g, order))
+
+        g.insert_edge(4, 1, 1.0)
+        order, cycle = topological_dfs_cycle(g)
+        self.assertIsNone(order)
+        self.assertEqual(cycle, [1, 2, 4])
+
+        g2 = Graph(2, undirected=False)
+        g2.insert_edge(1, 1, 1.0)
+        self.assertEqual(topological_dfs_cycle(g2), (None, [1]))
+
+    def test_topological_dfs_cycle_random(self):
+        """Test the single pass DFS topological sort against Kahn's algorithm on random graphs."""
+        for trial in range(50):
+            num_nodes = random.randint(1, 30)
+            g = Graph(num_nodes, undirected=False)
+            for _ in range(random.randint(0, 2 * num_nodes)):
+                u = random.randint(0, num_nodes - 1)
+                v = random.randint(0, num_nodes - 1)
+                if trial % 2 == 0 or u < v:
+                    g.insert_edge(u, v, 1.0)
+
+            order, cycle = topological_dfs_cycle(g)
+            if check_cycle_kahns(g):
+                self.assertIsNone(order)
+                self.assertGreater(len(cycle), 0)
+                self.assertEqual(len(set(cycle)), len(cycle))
+                for a, b in zip(cycle, cycle[1:] + cycle[:1]):
+                    self.assertTrue(g.is_edge(a, b))
+            else:
+                self.assertIsNone(cycle)
+                self.assertEqual(order, topological_dfs(g))
+                self.assertTrue(is_topo_ordered(g, order))
+
+    def test_topological_dfs_cycle_deep(self):
+        """Test the single pass DFS topological sort on a chain much deeper than the recursion limit."""
+        num_nodes = 20000
+        g = Graph(num_nodes, undirected=False)
+        for i in range(num_nodes - 1):
+            g.insert_edge(i, i + 1, 1.0)
+        self.assertEqual(topological_dfs_cycle(g), (list(range(num_nodes)), None))
+
+        g.insert_edge(num_nodes - 1, 0, 1.0)
+        order, cycle = topological_dfs_cycle(g)
+        self.assertEqual(cycle, list(range(num_nodes)))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,127 @@
+import random
+import unittest
+
+from graph_algorithms_the_fun_way.connected import get_reachable
+from graph_algorithms_the_fun_way.file_reader import make_graph_from_dependencies
+from graph_algorithms_the_fun_way.graph import Graph
+from graph_algorithms_the_fun_way.transitive import *
+
+
+def make_random_dag(num_nodes: int, num_edges: int) -> Graph:
+    """Create a random DAG with edges between shuffled node indices."""
+    labels = list(range(num_nodes))
+    random.shuffle(labels)
+    g = Graph(num_nodes, undirected=False)
+    for _ in range(num_edges):
+        i = random.randint(0, num_nodes - 1)
+        j = random.randint(0, num_nodes - 1)
+        if i < j:
+            g.insert_edge(labels[i], labels[j], random.random())
+    return g
+
+
+class TestTransitive(unittest.TestCase):
+    def test_dependencies(self):
+        """Test the closure and reduction of a small dependency graph."""
+        priors = {0: [], 1: [0], 2: [0, 1], 3: [], 4: [1, 3], 5: [2, 4]}
+        g = make_graph_from_dependencies(priors)
+
+        closure = transitive_closure(g)
+        self.assertEqual(closure.descendants(0), set([1, 2, 4, 5]))
+        self.assertEqual(closure.descendants(3), set([4, 5]))
+        self.assertEqual(closure.descendants(5), set())
+        self.assertEqual(closure.count_descendants(1), 3)
+        self.assertTrue(closure.can_reach(0, 5))
+        self.assertFalse(closure.can_reach(5, 0))
+        self.assertFalse(closure.can_reach(2, 2))
+        self.assertRaises(IndexError, closure.can_reach, 0, 6)
+
+        reduced = transitive_reduction(g, closure)
+        self.assertFalse(reduced.is_edge(0, 2))
+        for a, b in [(0, 1), (1, 2), (1, 4), (2, 5), (3, 4), (4, 5)]:
+            self.assertTrue(reduced.is_edge(a, b))
+        self.assertEqual(len(reduced.make_edge_list()), 6)
+
+    def test_reduction_names(self):
+        """Test that the reduction keeps the node names of a dependency graph."""
+        priors = {"app": ["lib", "core"], "lib": ["core"], "core": []}
+        g = make_graph_from_dependencies(priors)
+        for node in g.nodes:
+            node.label = f"task {node.index}"
+        reduced = transitive_reduction(g)
+
+        app = reduced.get_index_by_name("app")
+        lib = reduced.get_index_by_name("lib")
+        core = reduced.get_index_by_name("core")
+        self.assertEqual(reduced.num_nodes, 3)
+        for node in g.nodes:
+            self.assertEqual(reduced.nodes[node.index].label, node.label)
+        self.assertTrue(reduced.is_edge(core, lib))
+        self.assertTrue(reduced.is_edge(lib, app))
+        self.assertFalse(reduced.is_edge(core, app))
+
+    def test_cycle(self):
+        """Test that a graph with a cycle is rejected."""
+        g = Graph(3, undirected=False)
+        g.insert_edge(0, 1, 1.0)
+        g.insert_edge(1, 2, 1.0)
+        g.insert_edge(2, 0, 1.0)
+        self.assertRaises(ValueError, transitive_closure, g)
+        self.assertRaises(ValueError, transitive_reduction, g)
+
+    def test_random(self):
+        """Test the closure and reduction against searches on random DAGs."""
+        for trial in range(20):
+            num_nodes = random.randint(1, 40)
+            g = make_random_dag(num_nodes, 3 * num_nodes)
+            closure = transitive_closure(g, compress=(trial % 2 == 1))
+            reduced = transitive_reduction(g, closure)
+
+            for i in range(num_nodes):
+                reachable = get_reachable(g, i) - set([i])
+                self.assertEqual(closure.descendants(i), reachable)
+                self.assertEqual(closure.count_descendants(i), len(reachable))
+                self.assertEqual(get_reachable(reduced, i) - set([i]), reachable)
+                for j in range(num_nodes):
+                    self.assertEqual(closure.can_reach(i, j), j in reachable)
+
+            # Removing any edge of the reduction changes the reachability.
+            for edge in reduced.make_edge_list():
+                self.assertEqual(g.get_edge(edge.from_node, edge.to_node).weight, edge.weight)
+                reduced.remove_edge(edge.from_node, edge.to_node)
+                self.assertNotIn(edge.to_node, get_reachable(reduced, edge.from_node))
+                reduced.insert_edge(edge.from_node, edge.to_node, edge.weight)
+
+    def test_memory_budget(self):
+        """Test that the rows are compressed to fit a memory budget."""
+        num_nodes = 400
+        g = Graph(num_nodes, undirected=False)
+        for i in range(num_nodes - 1):
+            g.insert_edge(i, i + 1, 1.0)
+
+        closure = transitive_closure(g)
+        self.assertFalse(closure.compressed)
+        budget = closure.memory_bytes // 2
+
+        compressed = transitive_closure(g, memory_budget=budget)
+        self.assertTrue(compressed.compressed)
+        self.assertLessEqual(compressed.memory_bytes, budget)
+        for i in range(0, num_nodes, 37):
+            self.assertEqual(compressed.descendants(i), closure.descendants(i))
+        self.assertRaises(MemoryError, transitive_closure, g, False, 10)
+
+    @unittest.skipIf(np is None, "requires numpy")
+    def test_numpy(self):
+        """Test that the NumPy bit matrix matches the bitset rows."""
+        for trial in range(10):
+            num_nodes = random.randint(1, 50)
+            g = make_random_dag(num_nodes, 3 * num_nodes)
+            closure = transitive_closure(g)
+            matrix = np.unpackbits(transitive_closure_numpy(g), axis=1)[:, :num_nodes]
+            for i in range(num_nodes):
+                self.assertEqual(set(np.flatnonzero(matrix[i]).tolist()), closure.descendants(i))
+        self.assertRaises(MemoryError, transitive_closure_numpy, g, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
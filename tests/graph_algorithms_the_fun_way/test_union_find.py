@@ -1,7 +1,13 @@
-from graph_algorithms_the_fun_way.union_find import UnionFind
+from graph_algorithms_the_fun_way.union_find import ArrayUnionFind, RollbackUnionFind, UnionFind
 
+import random
 import unittest
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class TestUnionFind(unittest.TestCase):
     def test_basic(self):
@@ -75,6 +81,177 @@ class TestUnionFind(unittest.TestCase):
             for j in range(15):
                 self.assertFalse(djs.are_disjoint(i, j))
 
+    def test_path_compression(self):
+        """Test that find_set points the nodes on the path directly at the root."""
+        djs = UnionFind(4)
+        djs.union_sets(0, 1)
+        djs.union_sets(2, 3)
+        djs.union_sets(1, 3)
+
+        # Node 2 hangs off of node 0 through node 2's old root.
+        root = djs.find_set(0)
+        deep = [i for i in range(4) if djs.nodes[i].parent is not None and djs.nodes[i].parent.label != root]
+        self.assertEqual(len(deep), 1)
+
+        self.assertEqual(djs.find_set(deep[0]), root)
+        for i in range(4):
+            if i != root:
+                self.assertEqual(djs.nodes[i].parent.label, root)
+            self.assertEqual(djs.find_set(i), root)
+        self.assertEqual(djs.num_disjoint_sets, 1)
+
+
+class TestArrayUnionFind(unittest.TestCase):
+    def test_basic(self):
+        """Test basic operations of an ArrayUnionFind data structure."""
+        djs = ArrayUnionFind(3)
+        self.assertEqual(djs.num_disjoint_sets, 3)
+        self.assertTrue(djs.are_disjoint(0, 1))
+        self.assertTrue(djs.are_disjoint(1, 2))
+
+        self.assertTrue(djs.union_sets(0, 1))
+        self.assertFalse(djs.union_sets(1, 0))
+        self.assertEqual(djs.num_disjoint_sets, 2)
+        self.assertFalse(djs.are_disjoint(0, 1))
+        self.assertTrue(djs.are_disjoint(1, 2))
+        self.assertEqual(djs.set_sizes[djs.find_set(0)], 2)
+
+        with self.assertRaises(IndexError):
+            djs.find_set(-1)
+        with self.assertRaises(IndexError):
+            djs.find_set(4)
+        with self.assertRaises(IndexError):
+            djs.are_disjoint(4, 0)
+
+    def test_matches_union_find(self):
+        """Test that the ArrayUnionFind gives the same sets as the UnionFind."""
+        random.seed(20)
+        djs1 = UnionFind(200)
+        djs2 = ArrayUnionFind(200)
+        for _ in range(150):
+            i = random.randint(0, 199)
+            j = random.randint(0, 199)
+            djs1.union_sets(i, j)
+            djs2.union_sets(i, j)
+            self.assertEqual(djs1.num_disjoint_sets, djs2.num_disjoint_sets)
+
+        for i in range(200):
+            for j in range(200):
+                self.assertEqual(djs1.are_disjoint(i, j), djs2.are_disjoint(i, j))
+            root = djs2.find_set(i)
+            self.assertEqual(djs2.set_sizes[root], djs1.set_sizes[djs1.find_set(i)])
+
+    def test_batch(self):
+        """Test the batch union and find operations."""
+        djs = ArrayUnionFind(10)
+        self.assertEqual(djs.union_many([(0, 1), (2, 3), (1, 0), (3, 4), (0, 4)]), 4)
+        self.assertEqual(djs.num_disjoint_sets, 6)
+
+        roots = djs.find_many(range(10))
+        self.assertEqual(len(set(roots[0:5])), 1)
+        self.assertEqual(roots[5:], [5, 6, 7, 8, 9])
+        self.assertEqual(djs.set_sizes[roots[0]], 5)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_numpy_batch(self):
+        """Test the vectorized batch union and find operations."""
+        random.seed(21)
+        for _ in range(10):
+            num_sets = random.randint(1, 300)
+            pairs = [(random.randint(0, num_sets - 1), random.randint(0, num_sets - 1)) for _ in range(200)]
+
+            djs1 = ArrayUnionFind(num_sets)
+            djs2 = ArrayUnionFind(num_sets)
+            djs1.union_many(pairs[:100])
+            djs2.union_many_numpy(np.array(pairs[:100]))
+            djs1.union_many(pairs[100:])
+            merged = djs2.union_many_numpy(pairs[100:])
+            self.assertEqual(djs1.num_disjoint_sets, djs2.num_disjoint_sets)
+            self.assertGreaterEqual(merged, 0)
+
+            roots1 = djs1.find_many(range(num_sets))
+            roots2 = djs2.find_many_numpy(np.arange(num_sets))
+            self.assertEqual(list(roots2), djs2.find_many(range(num_sets)))
+            for i in range(num_sets):
+                for j in range(num_sets):
+                    self.assertEqual(roots1[i] == roots1[j], roots2[i] == roots2[j])
+                self.assertEqual(djs1.set_sizes[roots1[i]], djs2.set_sizes[roots2[i]])
+            self.assertEqual(sum(djs2.set_sizes), num_sets)
+
+        djs = ArrayUnionFind(5)
+        self.assertEqual(djs.union_many_numpy(np.zeros((0, 2))), 0)
+        self.assertEqual(len(djs.find_many_numpy([])), 0)
+        with self.assertRaises(IndexError):
+            djs.find_many_numpy([0, 5])
+
+
+class TestRollbackUnionFind(unittest.TestCase):
+    def test_basic(self):
+        """Test basic operations of a RollbackUnionFind data structure."""
+        djs = RollbackUnionFind(4)
+        self.assertEqual(djs.checkpoint(), 0)
+        self.assertTrue(djs.union_sets(0, 1))
+        self.assertFalse(djs.union_sets(1, 0))
+        self.assertEqual(djs.checkpoint(), 1)
+        self.assertEqual(djs.num_disjoint_sets, 3)
+        self.assertFalse(djs.are_disjoint(0, 1))
+        self.assertEqual(djs.set_sizes[djs.find_set(1)], 2)
+
+        with self.assertRaises(IndexError):
+            djs.find_set(4)
+        with self.assertRaises(ValueError):
+            djs.rollback(2)
+
+    def test_rollback(self):
+        """Test that rolling back restores the earlier sets."""
+        djs = RollbackUnionFind(6)
+        djs.union_sets(0, 1)
+        djs.union_sets(2, 3)
+        checkpoint = djs.checkpoint()
+        parents = list(djs.parent)
+        ranks = list(djs.rank)
+        sizes = list(djs.set_sizes)
+
+        djs.union_sets(1, 3)
+        djs.union_sets(4, 5)
+        djs.union_sets(0, 5)
+        self.assertEqual(djs.num_disjoint_sets, 1)
+        self.assertEqual(djs.set_sizes[djs.find_set(2)], 6)
+
+        djs.rollback(checkpoint)
+        self.assertEqual(djs.num_disjoint_sets, 4)
+        self.assertEqual(list(djs.parent), parents)
+        self.assertEqual(list(djs.rank), ranks)
+        self.assertEqual(list(djs.set_sizes), sizes)
+        self.assertTrue(djs.are_disjoint(1, 3))
+        self.assertFalse(djs.are_disjoint(2, 3))
+
+        djs.rollback(0)
+        for i in range(6):
+            self.assertEqual(djs.find_set(i), i)
+
+    def test_random(self):
+        """Test random unions and rollbacks against rebuilding a UnionFind."""
+        random.seed(22)
+        djs = RollbackUnionFind(30)
+        applied = []
+        for _ in range(200):
+            if applied and random.random() < 0.3:
+                keep = random.randint(0, len(applied))
+                djs.rollback(djs.checkpoint() - (len(applied) - keep))
+                applied = applied[:keep]
+            else:
+                pair = (random.randint(0, 29), random.randint(0, 29))
+                if djs.union_sets(pair[0], pair[1]):
+                    applied.append(pair)
+
+            expected = UnionFind(30)
+            for i, j in applied:
+                expected.union_sets(i, j)
+            self.assertEqual(djs.num_disjoint_sets, expected.num_disjoint_sets)
+            for i in range(30):
+                self.assertEqual(djs.are_disjoint(0, i), expected.are_disjoint(0, i))
+
 
 if __name__ == "__main__":
     unittest.main()